@@ -4,99 +4,113 @@ Easing Functions - Timing functions for smooth animations.
 
 Provides various easing functions for natural motion and timing.
 All functions take a value t (0.0 to 1.0) and return eased value (0.0 to 1.0).
+t may also be a NumPy array of progress values, which is eased elementwise,
+and timeline() returns a whole per-frame track in one call.
 """
 
 import math
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Callable
+import numpy as np
 
 
-def linear(t: float) -> float:
+# A progress value, or an array of them
+Progress = float | np.ndarray
+
+
+def _where(condition, if_true: Progress, if_false: Progress) -> Progress:
+    """Pick between two branch values elementwise (or directly for scalars)."""
+    if isinstance(condition, np.ndarray):
+        return np.where(condition, if_true, if_false)
+    return if_true if condition else if_false
+
+
+def _sin(x: Progress) -> Progress:
+    return np.sin(x) if isinstance(x, np.ndarray) else math.sin(x)
+
+
+def linear(t: Progress) -> Progress:
     """Linear interpolation (no easing)."""
     return t
 
 
-def ease_in_quad(t: float) -> float:
+def ease_in_quad(t: Progress) -> Progress:
     """Quadratic ease-in (slow start, accelerating)."""
     return t * t
 
 
-def ease_out_quad(t: float) -> float:
+def ease_out_quad(t: Progress) -> Progress:
     """Quadratic ease-out (fast start, decelerating)."""
     return t * (2 - t)
 
 
-def ease_in_out_quad(t: float) -> float:
+def ease_in_out_quad(t: Progress) -> Progress:
     """Quadratic ease-in-out (slow start and end)."""
-    if t < 0.5:
-        return 2 * t * t
-    return -1 + (4 - 2 * t) * t
+    return _where(t < 0.5, 2 * t * t, -1 + (4 - 2 * t) * t)
 
 
-def ease_in_cubic(t: float) -> float:
+def ease_in_cubic(t: Progress) -> Progress:
     """Cubic ease-in (slow start)."""
     return t * t * t
 
 
-def ease_out_cubic(t: float) -> float:
+def ease_out_cubic(t: Progress) -> Progress:
     """Cubic ease-out (fast start)."""
     return (t - 1) * (t - 1) * (t - 1) + 1
 
 
-def ease_in_out_cubic(t: float) -> float:
+def ease_in_out_cubic(t: Progress) -> Progress:
     """Cubic ease-in-out."""
-    if t < 0.5:
-        return 4 * t * t * t
-    return (t - 1) * (2 * t - 2) * (2 * t - 2) + 1
+    return _where(t < 0.5, 4 * t * t * t, (t - 1) * (2 * t - 2) * (2 * t - 2) + 1)
+
+
+# Time bands of ease_out_bounce and the center/height of the parabola in each
+_BOUNCE_BANDS = (1 / 2.75, 2 / 2.75, 2.5 / 2.75)
+_BOUNCE_CENTERS = (0.0, 1.5 / 2.75, 2.25 / 2.75, 2.625 / 2.75)
+_BOUNCE_HEIGHTS = (0.0, 0.75, 0.9375, 0.984375)
 
 
-def ease_in_bounce(t: float) -> float:
+def ease_in_bounce(t: Progress) -> Progress:
     """Bounce ease-in (bouncy start)."""
     return 1 - ease_out_bounce(1 - t)
 
 
-def ease_out_bounce(t: float) -> float:
+def ease_out_bounce(t: Progress) -> Progress:
     """Bounce ease-out (bouncy end)."""
-    if t < 1 / 2.75:
-        return 7.5625 * t * t
-    elif t < 2 / 2.75:
-        t -= 1.5 / 2.75
-        return 7.5625 * t * t + 0.75
-    elif t < 2.5 / 2.75:
-        t -= 2.25 / 2.75
-        return 7.5625 * t * t + 0.9375
-    else:
-        t -= 2.625 / 2.75
-        return 7.5625 * t * t + 0.984375
-
-
-def ease_in_out_bounce(t: float) -> float:
+    # Each bounce is the same parabola, shifted to its own time band and height
+    if isinstance(t, np.ndarray):
+        band = np.searchsorted(_BOUNCE_BANDS, t, side='right')
+        t = t - np.take(_BOUNCE_CENTERS, band)
+        return 7.5625 * t * t + np.take(_BOUNCE_HEIGHTS, band)
+    band = bisect_right(_BOUNCE_BANDS, t)
+    t = t - _BOUNCE_CENTERS[band]
+    return 7.5625 * t * t + _BOUNCE_HEIGHTS[band]
+
+
+def ease_in_out_bounce(t: Progress) -> Progress:
     """Bounce ease-in-out."""
-    if t < 0.5:
-        return ease_in_bounce(t * 2) * 0.5
-    return ease_out_bounce(t * 2 - 1) * 0.5 + 0.5
+    return _where(t < 0.5, ease_in_bounce(t * 2) * 0.5, ease_out_bounce(t * 2 - 1) * 0.5 + 0.5)
 
 
-def ease_in_elastic(t: float) -> float:
+def ease_in_elastic(t: Progress) -> Progress:
     """Elastic ease-in (spring effect)."""
-    if t == 0 or t == 1:
-        return t
-    return -math.pow(2, 10 * (t - 1)) * math.sin((t - 1.1) * 5 * math.pi)
+    return _where((t == 0) | (t == 1), t,
+                  -2.0 ** (10 * (t - 1)) * _sin((t - 1.1) * 5 * math.pi))
 
 
-def ease_out_elastic(t: float) -> float:
+def ease_out_elastic(t: Progress) -> Progress:
     """Elastic ease-out (spring effect)."""
-    if t == 0 or t == 1:
-        return t
-    return math.pow(2, -10 * t) * math.sin((t - 0.1) * 5 * math.pi) + 1
+    return _where((t == 0) | (t == 1), t,
+                  2.0 ** (-10 * t) * _sin((t - 0.1) * 5 * math.pi) + 1)
 
 
-def ease_in_out_elastic(t: float) -> float:
+def ease_in_out_elastic(t: Progress) -> Progress:
     """Elastic ease-in-out."""
-    if t == 0 or t == 1:
-        return t
-    t = t * 2 - 1
-    if t < 0:
-        return -0.5 * math.pow(2, 10 * t) * math.sin((t - 0.1) * 5 * math.pi)
-    return math.pow(2, -10 * t) * math.sin((t - 0.1) * 5 * math.pi) * 0.5 + 1
+    u = t * 2 - 1
+    spring = _sin((u - 0.1) * 5 * math.pi)
+    eased = _where(u < 0, -0.5 * 2.0 ** (10 * u) * spring, 2.0 ** (-10 * u) * spring * 0.5 + 1)
+    return _where((t == 0) | (t == 1), t, eased)
 
 
 # Convenience mapping
@@ -119,45 +133,91 @@ def get_easing(name: str = 'linear'):
     return EASING_FUNCTIONS.get(name, linear)
 
 
-def interpolate(start: float, end: float, t: float, easing: str = 'linear') -> float:
+def interpolate(start: float, end: float, t: Progress, easing: str = 'linear') -> Progress:
     """
     Interpolate between two values with easing.
 
     Args:
         start: Start value
         end: End value
-        t: Progress from 0.0 to 1.0
+        t: Progress from 0.0 to 1.0 (or an array of progress values)
         easing: Name of easing function
 
     Returns:
-        Interpolated value
+        Interpolated value (an array if t is an array)
     """
     ease_func = get_easing(easing)
     eased_t = ease_func(t)
     return start + (end - start) * eased_t
 
 
-def ease_back_in(t: float) -> float:
+@lru_cache(maxsize=64)
+def progress(num_frames: int) -> np.ndarray:
+    """
+    Progress value of every frame, t = i / (num_frames - 1).
+
+    Args:
+        num_frames: Number of frames
+
+    Returns:
+        Read-only (num_frames,) float array from 0.0 to 1.0 (all 0.0 for one frame)
+    """
+    # Divide (rather than linspace) so values match i / (num_frames - 1) exactly
+    t = np.arange(num_frames) / (num_frames - 1) if num_frames > 1 else np.zeros(max(0, num_frames))
+    t.flags.writeable = False
+    return t
+
+
+@lru_cache(maxsize=128)
+def _eased_curve(easing: str | Callable, num_frames: int) -> np.ndarray:
+    ease_func = get_easing(easing) if isinstance(easing, str) else easing
+    curve = np.asarray(ease_func(progress(num_frames).copy()), dtype=np.float64)
+    curve.flags.writeable = False
+    return curve
+
+
+def timeline(num_frames: int, easing: str | Callable = 'linear',
+             start: float = 0.0, end: float = 1.0) -> np.ndarray:
+    """
+    Eased values for every frame of an animation in one call.
+
+    Equivalent to [interpolate(start, end, i / (num_frames - 1), easing)
+    for i in range(num_frames)]. The eased curve is cached per
+    (easing, num_frames), so each call is a single multiply-add.
+
+    Args:
+        num_frames: Number of frames
+        easing: Name of easing function (or the function itself)
+        start: Value at the first frame
+        end: Value at the last frame
+
+    Returns:
+        (num_frames,) float array of per-frame values
+    """
+    return start + (end - start) * _eased_curve(easing, num_frames)
+
+
+def ease_back_in(t: Progress) -> Progress:
     """Back ease-in (slight overshoot backward before forward motion)."""
     c1 = 1.70158
     c3 = c1 + 1
     return c3 * t * t * t - c1 * t * t
 
 
-def ease_back_out(t: float) -> float:
+def ease_back_out(t: Progress) -> Progress:
     """Back ease-out (overshoot forward then settle back)."""
     c1 = 1.70158
     c3 = c1 + 1
     return 1 + c3 * pow(t - 1, 3) + c1 * pow(t - 1, 2)
 
 
-def ease_back_in_out(t: float) -> float:
+def ease_back_in_out(t: Progress) -> Progress:
     """Back ease-in-out (overshoot at both ends)."""
     c1 = 1.70158
     c2 = c1 * 1.525
-    if t < 0.5:
-        return (pow(2 * t, 2) * ((c2 + 1) * 2 * t - c2)) / 2
-    return (pow(2 * t - 2, 2) * ((c2 + 1) * (t * 2 - 2) + c2) + 2) / 2
+    return _where(t < 0.5,
+                  (pow(2 * t, 2) * ((c2 + 1) * 2 * t - c2)) / 2,
+                  (pow(2 * t - 2, 2) * ((c2 + 1) * (t * 2 - 2) + c2) + 2) / 2)
 
 
 def apply_squash_stretch(base_scale: tuple[float, float], intensity: float,
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Font Registry - Process-wide cache of loaded fonts.
+
+Opening a TrueType file and building a FreeTypeFont is far slower than drawing
+with one, and every text/emoji helper used to do it on every call. The
+registry checks each candidate path once per process, keeps loaded fonts in an
+LRU keyed by (path, size, index), and counts hits so renders can confirm that
+fonts are being reused.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+from PIL import ImageFont
+
+
+# Candidate fonts in order of preference, for cross-platform support
+TEXT_FONT_PATHS = (
+    # macOS fonts
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/System/Library/Fonts/SF-Pro.ttf",
+    "/Library/Fonts/Arial.ttf",
+    # Linux fonts
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    # Windows fonts
+    "C:\\Windows\\Fonts\\arial.ttf",
+)
+
+BOLD_FONT_PATHS = (
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/System/Library/Fonts/SF-Pro.ttf",
+    "/Library/Fonts/Arial Bold.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "C:\\Windows\\Fonts\\arialbd.ttf",
+)
+
+EMOJI_FONT_PATHS = (
+    "/System/Library/Fonts/Apple Color Emoji.ttc",
+)
+
+
+class FontRegistry:
+    """LRU cache of FreeTypeFont instances keyed by (path, size, index)."""
+
+    def __init__(self, max_fonts: int = 64):
+        """
+        Initialize an empty registry.
+
+        Args:
+            max_fonts: Number of (path, size, index) fonts to keep loaded
+        """
+        self.max_fonts = max_fonts
+        self._fonts: OrderedDict[tuple[str, int, int], Optional[ImageFont.FreeTypeFont]] = OrderedDict()
+        self._exists: dict[str, bool] = {}
+        self._default: Optional[ImageFont.ImageFont] = None
+        self.hits = 0
+        self.misses = 0
+        self.failures = 0
+
+    def _path_exists(self, path: str) -> bool:
+        """Check a candidate path once per process."""
+        exists = self._exists.get(path)
+        if exists is None:
+            exists = self._exists[path] = Path(path).is_file()
+        return exists
+
+    def get(self, path: str, size: int, index: int = 0) -> Optional[ImageFont.FreeTypeFont]:
+        """
+        Load a font, reusing a cached instance when possible.
+
+        Args:
+            path: Font file path
+            size: Font size in pixels
+            index: Face index within a collection (.ttc)
+
+        Returns:
+            FreeTypeFont, or None if the file is missing or cannot be loaded
+            at this size (bitmap emoji fonts only support a few sizes)
+        """
+        key = (path, size, index)
+        if key in self._fonts:
+            self._fonts.move_to_end(key)
+            self.hits += 1
+            return self._fonts[key]
+
+        self.misses += 1
+        font = None
+        if self._path_exists(path):
+            try:
+                font = ImageFont.truetype(path, size, index=index)
+            except OSError:
+                self.failures += 1
+
+        # Failed loads are cached too, so a bad size isn't retried every frame
+        self._fonts[key] = font
+        if len(self._fonts) > self.max_fonts:
+            self._fonts.popitem(last=False)
+        return font
+
+    def first(self, paths: tuple[str, ...], size: int,
+              index: int = 0) -> Optional[ImageFont.FreeTypeFont]:
+        """
+        Load the first candidate font that is available at this size.
+
+        Args:
+            paths: Candidate font paths in order of preference
+            size: Font size in pixels
+            index: Face index within a collection (.ttc)
+
+        Returns:
+            FreeTypeFont, or None if no candidate can be loaded
+        """
+        for path in paths:
+            if not self._path_exists(path):
+                continue
+            font = self.get(path, size, index)
+            if font is not None:
+                return font
+        return None
+
+    def default(self) -> ImageFont.ImageFont:
+        """Pillow's built-in font (loaded once)."""
+        if self._default is None:
+            self._default = ImageFont.load_default()
+        return self._default
+
+    def clear(self):
+        """Drop all loaded fonts and path checks, and reset the counters."""
+        self._fonts.clear()
+        self._exists.clear()
+        self._default = None
+        self.hits = self.misses = self.failures = 0
+
+    def stats(self) -> dict:
+        """
+        Registry statistics.
+
+        Returns:
+            Dictionary with hits, misses (font loads), failures, hit_rate and
+            the number of cached fonts
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'failures': self.failures,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'fonts': len(self._fonts),
+        }
+
+
+_registry = FontRegistry()
+
+
+def get_font_registry() -> FontRegistry:
+    """The process-wide font registry shared by all drawing helpers."""
+    return _registry
+
+
+def load_text_font(size: int, bold: bool = False) -> ImageFont.ImageFont:
+    """
+    Get a text font from the shared registry with fallback support.
+
+    Args:
+        size: Font size in pixels
+        bold: Use bold variant if available
+
+    Returns:
+        FreeTypeFont, or Pillow's default font if no system font is found
+    """
+    font = _registry.first(BOLD_FONT_PATHS if bold else TEXT_FONT_PATHS, size)
+    return font if font is not None else _registry.default()
+
+
+def load_emoji_font(size: int) -> ImageFont.ImageFont:
+    """
+    Get a color emoji font from the shared registry, falling back to a text font.
+
+    Args:
+        size: Font size in pixels
+
+    Returns:
+        Emoji font if available at this size, otherwise a text font
+    """
+    font = _registry.first(EMOJI_FONT_PATHS, size)
+    return font if font is not None else load_text_font(size)
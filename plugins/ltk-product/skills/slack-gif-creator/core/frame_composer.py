@@ -6,9 +6,11 @@ Provides functions for drawing shapes, text, emojis, and compositing elements
 together to create animation frames.
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache
+from PIL import Image, ImageDraw
 import numpy as np
 from typing import Optional
+from core.fonts import load_emoji_font, load_text_font
 
 
 def create_blank_frame(width: int, height: int, color: tuple[int, int, int] = (255, 255, 255)) -> Image.Image:
@@ -113,11 +115,7 @@ def draw_text(frame: Image.Image, text: str, position: tuple[int, int],
     """
     draw = ImageDraw.Draw(frame)
 
-    # Try to use default font, fall back to basic if not available
-    try:
-        font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
-    except:
-        font = ImageFont.load_default()
+    font = load_text_font(font_size)
 
     if centered:
         bbox = draw.textbbox((0, 0), text, font=font)
@@ -146,12 +144,8 @@ def draw_emoji(frame: Image.Image, emoji: str, position: tuple[int, int], size:
     """
     draw = ImageDraw.Draw(frame)
 
-    # Use Apple Color Emoji font on macOS
-    try:
-        font = ImageFont.truetype("/System/Library/Fonts/Apple Color Emoji.ttc", size)
-    except:
-        # Fallback to text-based emoji
-        font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
+    # Apple Color Emoji on macOS, falling back to text-based emoji
+    font = load_emoji_font(size)
 
     draw.text(position, emoji, font=font, embedded_color=True)
     return frame
@@ -232,39 +226,69 @@ def draw_stick_figure(frame: Image.Image, position: tuple[int, int], scale: floa
     return frame
 
 
+GRADIENT_DIRECTIONS = ('vertical', 'horizontal', 'diagonal', 'radial')
+
+
+@lru_cache(maxsize=16)
+def _gradient_array(width: int, height: int, start_color: tuple[int, int, int],
+                    end_color: tuple[int, int, int], direction: str) -> np.ndarray:
+    """
+    Render a two-color gradient once.
+
+    Returns:
+        Read-only (H, W, 3) uint8 array
+    """
+    # Interpolation ratio per row/column; 2D directions combine them by broadcasting
+    ys = (np.arange(height) / height)[:, None]
+    xs = (np.arange(width) / width)[None, :]
+    if direction == 'vertical':
+        ratio = ys
+    elif direction == 'horizontal':
+        ratio = xs
+    elif direction == 'diagonal':
+        ratio = (xs + ys) / 2
+    elif direction == 'radial':
+        # Start color at the center, end color at the corners
+        dx = np.arange(width) - width // 2
+        dy = (np.arange(height) - height // 2)[:, None]
+        max_dist = ((width / 2) ** 2 + (height / 2) ** 2) ** 0.5
+        ratio = np.minimum(1, np.sqrt(dx ** 2 + dy ** 2) / max_dist)
+    else:
+        raise ValueError(f"Unknown gradient direction '{direction}'. "
+                         f"Use one of: {', '.join(GRADIENT_DIRECTIONS)}")
+
+    ratio = ratio[..., None]
+    start = np.array(start_color, dtype=np.float64)
+    end = np.array(end_color, dtype=np.float64)
+    colors = (start * (1 - ratio) + end * ratio).astype(np.uint8)
+
+    gradient = np.ascontiguousarray(np.broadcast_to(colors, (height, width, 3)))
+    gradient.flags.writeable = False
+    return gradient
+
+
 def create_gradient_background(width: int, height: int,
                                top_color: tuple[int, int, int],
-                               bottom_color: tuple[int, int, int]) -> Image.Image:
+                               bottom_color: tuple[int, int, int],
+                               direction: str = 'vertical') -> Image.Image:
     """
-    Create a vertical gradient background.
+    Create a gradient background.
+
+    Gradients are rendered once per set of arguments and cached, so calling
+    this for every frame only costs a copy.
 
     Args:
         width: Frame width
         height: Frame height
-        top_color: RGB color at top
-        bottom_color: RGB color at bottom
+        top_color: RGB start color (top, left, top-left, or center for radial)
+        bottom_color: RGB end color (bottom, right, bottom-right, or corners for radial)
+        direction: 'vertical', 'horizontal', 'diagonal' or 'radial'
 
     Returns:
         PIL Image with gradient
     """
-    frame = Image.new('RGB', (width, height))
-    draw = ImageDraw.Draw(frame)
-
-    # Calculate color step for each row
-    r1, g1, b1 = top_color
-    r2, g2, b2 = bottom_color
-
-    for y in range(height):
-        # Interpolate color
-        ratio = y / height
-        r = int(r1 * (1 - ratio) + r2 * ratio)
-        g = int(g1 * (1 - ratio) + g2 * ratio)
-        b = int(b1 * (1 - ratio) + b2 * ratio)
-
-        # Draw horizontal line
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
-
-    return frame
+    gradient = _gradient_array(width, height, tuple(top_color), tuple(bottom_color), direction)
+    return Image.fromarray(gradient)
 
 
 def draw_emoji_enhanced(frame: Image.Image, emoji: str, position: tuple[int, int],
@@ -289,15 +313,8 @@ def draw_emoji_enhanced(frame: Image.Image, emoji: str, position: tuple[int, int
     # Ensure minimum size to avoid font rendering errors
     size = max(12, size)
 
-    # Use Apple Color Emoji font on macOS
-    try:
-        font = ImageFont.truetype("/System/Library/Fonts/Apple Color Emoji.ttc", size)
-    except:
-        # Fallback to text-based emoji
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
-        except:
-            font = ImageFont.load_default()
+    # Apple Color Emoji on macOS, falling back to text-based emoji
+    font = load_emoji_font(size)
 
     # Draw shadow first if enabled
     if shadow and size >= 20:  # Only draw shadow for larger emojis
@@ -389,47 +406,60 @@ def draw_rounded_rectangle(frame: Image.Image, top_left: tuple[int, int],
     return frame
 
 
-def add_vignette(frame: Image.Image, strength: float = 0.5) -> Image.Image:
+@lru_cache(maxsize=32)
+def _vignette_mask(width: int, height: int, strength: float) -> np.ndarray:
     """
-    Add a vignette effect (darkened edges) to frame.
+    Radial vignette multiplier for a frame size, as 8.8 fixed point.
 
     Args:
-        frame: PIL Image
+        width: Frame width
+        height: Frame height
         strength: Vignette strength (0.0-1.0)
 
     Returns:
-        Frame with vignette
+        Read-only (H, W, 1) uint16 array of multipliers in 0-256 (256 = unchanged)
     """
-    width, height = frame.size
-
-    # Create radial gradient mask
+    # Radial gradient from the center to the corners
     center_x, center_y = width // 2, height // 2
     max_dist = ((width / 2) ** 2 + (height / 2) ** 2) ** 0.5
+    dx = np.arange(width, dtype=np.float64) - center_x
+    dy = np.arange(height, dtype=np.float64)[:, None] - center_y
+    dist = np.sqrt(dx ** 2 + dy ** 2)
 
-    # Create overlay
-    overlay = Image.new('RGB', (width, height), (0, 0, 0))
-    pixels = overlay.load()
+    vignette = np.minimum(1, (dist / max_dist) * strength)
+    value = (255 * (1 - vignette)).astype(np.uint16)
 
-    for y in range(height):
-        for x in range(width):
-            # Calculate distance from center
-            dx = x - center_x
-            dy = y - center_y
-            dist = (dx ** 2 + dy ** 2) ** 0.5
+    # Rescale 0-255 to 0-256 so that (pixel * mask) >> 8 multiplies by value / 255
+    mask = ((value * 256 + 127) // 255)[..., None]
+    mask.flags.writeable = False
+    return mask
 
-            # Calculate vignette value
-            vignette = min(1, (dist / max_dist) * strength)
-            value = int(255 * (1 - vignette))
-            pixels[x, y] = (value, value, value)
 
-    # Blend with original using multiply
-    frame_array = np.array(frame, dtype=np.float32) / 255
-    overlay_array = np.array(overlay, dtype=np.float32) / 255
+def add_vignette(frame: Image.Image, strength: float = 0.5) -> Image.Image:
+    """
+    Add a vignette effect (darkened edges) to frame.
+
+    The mask is cached per (width, height, strength), so animating a vignette
+    costs one integer multiply and shift per frame.
+
+    Args:
+        frame: PIL Image
+        strength: Vignette strength (0.0-1.0)
+
+    Returns:
+        Frame with vignette
+    """
+    width, height = frame.size
+    mask = _vignette_mask(width, height, float(strength))
 
-    result = frame_array * overlay_array
-    result = (result * 255).astype(np.uint8)
+    # Multiply in uint16: 255 * 256 still fits, and >> 8 replaces the divide
+    if frame.mode != 'RGB':
+        frame = frame.convert('RGB')
+    result = np.asarray(frame).astype(np.uint16)
+    result *= mask
+    result >>= 8
 
-    return Image.fromarray(result)
+    return Image.fromarray(result.astype(np.uint8))
 
 
 def draw_star(frame: Image.Image, center: tuple[int, int], size: int,
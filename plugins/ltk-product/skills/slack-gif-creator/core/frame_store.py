@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Frame Store - Pluggable storage for the frames held by a GIFBuilder.
+
+The default MemoryFrameStore keeps a list of separate arrays in memory.
+ArrayFrameStore keeps every frame in one preallocated (N, H, W, 3) uint8
+array that grows geometrically, and MemmapFrameStore backs that array with an
+np.memmap file on local disk, so long renders don't need to fit in RAM: the OS
+pages frames in and out, and dedup/quantization read contiguous slices of it.
+"""
+
+import os
+import tempfile
+from abc import ABC, abstractmethod
+import weakref
+from pathlib import Path
+from typing import Iterator, Optional
+import numpy as np
+
+
+class FrameStore(ABC):
+    """Ordered collection of equally sized (H, W, 3) uint8 RGB frames."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abstractmethod
+    def __getitem__(self, index: int | slice):
+        ...
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for i in range(len(self)):
+            yield self[i]
+
+    @abstractmethod
+    def append(self, frame: np.ndarray):
+        """Add a frame at the end (the store keeps its own copy or reference)."""
+
+    def reserve(self, frame_shape: tuple[int, ...]) -> np.ndarray:
+        """Add an uninitialized frame and return a writable array to draw it into."""
+        frame = np.empty(frame_shape, dtype=np.uint8)
+        self.append(frame)
+        return frame
+
+    @abstractmethod
+    def keep(self, indices: list[int]):
+        """
+        Retain only the frames at the given indices, in place.
+
+        Args:
+            indices: Strictly increasing frame indices to keep
+        """
+
+    @abstractmethod
+    def clear(self):
+        """Remove all frames."""
+
+    @abstractmethod
+    def empty(self) -> 'FrameStore':
+        """A new, empty store of the same kind and settings."""
+
+    def as_array(self) -> Optional[np.ndarray]:
+        """All frames as one contiguous (N, H, W, 3) array, if the store has one."""
+        return None
+
+
+class MemoryFrameStore(FrameStore):
+    """Frames as a list of separate in-memory arrays (the default)."""
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._frames: list[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __getitem__(self, index: int | slice):
+        return self._frames[index]
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return iter(self._frames)
+
+    def append(self, frame: np.ndarray):
+        self._frames.append(frame)
+
+    def keep(self, indices: list[int]):
+        self._frames = [self._frames[i] for i in indices]
+
+    def clear(self):
+        self._frames = []
+
+    def empty(self) -> 'MemoryFrameStore':
+        return MemoryFrameStore()
+
+
+def _check_increasing(indices: list[int], length: int) -> np.ndarray:
+    indices = np.asarray(indices, dtype=np.int64)
+    if len(indices) and (indices[0] < 0 or indices[-1] >= length or np.any(np.diff(indices) <= 0)):
+        raise ValueError("keep() needs strictly increasing indices within the store")
+    return indices
+
+
+class ArrayFrameStore(FrameStore):
+    """Frames in one contiguous in-memory (N, H, W, 3) uint8 array."""
+
+    def __init__(self, capacity: int = 64):
+        """
+        Initialize a contiguous store.
+
+        The array is allocated on the first frame, sized for `capacity` frames
+        of that frame's dimensions, and doubled whenever it fills up.
+
+        Args:
+            capacity: Number of frames to preallocate (e.g. the expected frame count)
+        """
+        self.initial_capacity = max(1, capacity)
+        self.capacity = 0
+        self._length = 0
+        self._buffer: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            frames = self.as_array()
+            return [] if frames is None else frames[index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("frame index out of range")
+        return self._buffer[index]
+
+    def _allocate(self, capacity: int, frame_shape: tuple[int, ...]) -> np.ndarray:
+        """Return a buffer for `capacity` frames holding the current frames."""
+        buffer = np.empty((capacity, *frame_shape), dtype=np.uint8)
+        if self._buffer is not None:
+            buffer[:self._length] = self._buffer[:self._length]
+        return buffer
+
+    def _slot(self, frame_shape: tuple[int, ...]) -> np.ndarray:
+        """Claim the next frame slot, growing the buffer if needed."""
+        if self._buffer is not None and frame_shape != self._buffer.shape[1:]:
+            raise ValueError(f"Frame shape {frame_shape} does not match store "
+                             f"{self._buffer.shape[1:]}")
+        if self._length == self.capacity:
+            capacity = self.capacity * 2 if self._buffer is not None else self.initial_capacity
+            self._buffer = self._allocate(capacity, frame_shape)
+            self.capacity = capacity
+        slot = self._buffer[self._length]
+        self._length += 1
+        return slot
+
+    def append(self, frame: np.ndarray):
+        self._slot(frame.shape)[...] = frame
+
+    def reserve(self, frame_shape: tuple[int, ...]) -> np.ndarray:
+        """
+        Add an uninitialized frame and return a writable view of it.
+
+        The view is only valid until the next frame is added (the buffer may
+        move when it grows), so fill it before adding more frames.
+        """
+        return self._slot(frame_shape)
+
+    def keep(self, indices: list[int]):
+        indices = _check_increasing(indices, self._length)
+        # Each kept frame moves to an earlier (or the same) slot, so copying in
+        # order never overwrites a frame that is still to be moved
+        for target, source in enumerate(indices):
+            if target != source:
+                self._buffer[target] = self._buffer[source]
+        self._length = len(indices)
+
+    def clear(self):
+        # The next frame may have different dimensions; the buffer is reallocated then
+        self._buffer = None
+        self._length = 0
+        self.capacity = 0
+
+    def empty(self) -> 'ArrayFrameStore':
+        return ArrayFrameStore(capacity=self.initial_capacity)
+
+    def as_array(self) -> Optional[np.ndarray]:
+        if self._buffer is None:
+            return None
+        return self._buffer[:self._length]
+
+
+class MemmapFrameStore(ArrayFrameStore):
+    """Frames in a single preallocated (N, H, W, 3) uint8 memory-mapped file."""
+
+    def __init__(self, path: Optional[str | Path] = None, capacity: int = 64,
+                 directory: Optional[str | Path] = None):
+        """
+        Initialize a memory-mapped store.
+
+        The file is created on the first append, sized for `capacity` frames of
+        that frame's dimensions, and doubled whenever it fills up.
+
+        A store at an explicit path stays next to it: empty() (used when the
+        builder rebuilds its frames, e.g. resizing for emoji) returns a store
+        backed by the sibling file `<path>.swap`, and a store at that sibling
+        returns one at `path` again, so the two files take turns and neither is
+        deleted.
+
+        Args:
+            path: Backing file (None = temporary file, deleted with the store)
+            capacity: Number of frames to preallocate
+            directory: Where to create the temporary file (None = system temp dir)
+        """
+        super().__init__(capacity)
+        if path is None:
+            fd, path = tempfile.mkstemp(suffix='.frames', dir=directory)
+            os.close(fd)
+            self._cleanup = weakref.finalize(self, _remove_file, path)
+            self._home = None
+        else:
+            self._cleanup = None
+            self._home = Path(path)
+        self.path = Path(path)
+        self.directory = directory
+
+    def _allocate(self, capacity: int, frame_shape: tuple[int, ...]) -> np.memmap:
+        """Map the file with room for more frames, keeping existing data in place."""
+        mode = 'w+'
+        if self._buffer is not None:
+            self._buffer.flush()
+            with open(self.path, 'r+b') as f:
+                f.truncate(capacity * int(np.prod(frame_shape)))
+            mode = 'r+'
+        return np.memmap(self.path, dtype=np.uint8, mode=mode, shape=(capacity, *frame_shape))
+
+    def empty(self) -> 'MemmapFrameStore':
+        if self._home is None:
+            return MemmapFrameStore(capacity=self.initial_capacity, directory=self.directory)
+        swap = self._home.with_name(self._home.name + '.swap')
+        store = MemmapFrameStore(self._home if self.path == swap else swap,
+                                 capacity=self.initial_capacity)
+        store._home = self._home
+        return store
+
+    def close(self):
+        """Release the mapping and delete the file if it is temporary."""
+        self.clear()
+        if self._cleanup is not None:
+            self._cleanup()
+
+
+def _remove_file(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
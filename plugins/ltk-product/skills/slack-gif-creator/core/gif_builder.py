@@ -6,17 +6,213 @@ This module provides the main interface for creating GIFs from programmatically
 generated frames, with automatic optimization for Slack's requirements.
 """
 
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional
-import imageio.v3 as imageio
+from typing import BinaryIO, Callable, NamedTuple, Optional
+import io
+import time
 from PIL import Image
 import numpy as np
+from core.frame_store import ArrayFrameStore, FrameStore, MemoryFrameStore
+from core.gif_writer import GIFWriter
+from core.palette import ColorHistogram, Palette
+
+
+class HeldFrame(NamedTuple):
+    """
+    A frame shown for several frame intervals.
+
+    Templates can return these in place of repeated identical frames; the
+    builder stores one frame with a longer duration.
+    """
+    frame: np.ndarray | Image.Image
+    frame_count: int
+
+
+def _group_durations(durations: list[float], keep_every: int) -> list[float]:
+    """Durations after keeping every nth frame, each kept frame covering the ones dropped."""
+    return [sum(durations[i:i + keep_every]) for i in range(0, len(durations), keep_every)]
+
+
+def _map_frames(func: Callable, frames: list, workers: Optional[int] = None,
+                executor: Optional[Executor] = None) -> list:
+    """
+    Apply func to every frame, optionally in parallel, preserving frame order.
+
+    Args:
+        func: Picklable callable taking a single frame
+        frames: Frames to process
+        workers: Thread count for a temporary pool (None or 1 = serial)
+        executor: Existing thread or process pool to use instead (takes precedence)
+
+    Returns:
+        List of results in frame order
+    """
+    if executor is not None:
+        return list(executor.map(func, frames))
+    if workers is not None and workers > 1 and len(frames) > 1:
+        # NumPy lookups and PIL quantize release the GIL, so threads scale
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(func, frames))
+    return [func(frame) for frame in frames]
+
+
+def _quantize_own_palette(num_colors: int, dither: bool, frame: np.ndarray) -> np.ndarray:
+    """Quantize a frame against a palette built from that frame alone."""
+    palette = ColorHistogram.from_frames([frame]).palette(num_colors)
+    return palette.to_rgb(palette.quantize(frame, dither=dither))
+
+
+# Dimension scales and frame decimation steps tried by save(target_kb=...),
+# in order of preference
+_TARGET_SCALES = (1.0, 0.75, 0.5)
+_TARGET_KEEP_EVERY = (1, 2, 3)
+
+
+def _write_gif(output: str | Path | BinaryIO, indexed_frames: list[np.ndarray],
+               palette: Palette, durations: list[float], delta_frames: bool = True):
+    """
+    Encode indexed frames as a looping GIF.
+
+    Every frame after the first is cropped to the region that changed since
+    the previous one; delta_frames additionally makes unchanged pixels in that
+    region transparent and picks each frame's disposal.
+
+    Args:
+        output: File path or writable binary file object
+        indexed_frames: (H, W) uint8 index arrays, all the same size
+        palette: Palette the indices refer to
+        durations: Per-frame durations in milliseconds
+        delta_frames: Transparent unchanged pixels and per-frame disposal
+            (see GIFBuilder.save())
+    """
+    height, width = indexed_frames[0].shape
+    with GIFWriter(output, width, height, palette.colors, loop=0,
+                   crop_unchanged=True, transparency=delta_frames,
+                   optimize_disposal=delta_frames) as writer:
+        for indices, duration in zip(indexed_frames, durations):
+            writer.write_frame(indices, duration=duration)
+
+
+def _palette_size(num_colors: int, delta_frames: bool) -> int:
+    """Colors to quantize to, leaving a slot for the transparent index when delta encoding."""
+    num_colors = max(1, min(256, num_colors))
+    if delta_frames:
+        return max(1, min(255, num_colors - 1))
+    return num_colors
+
+
+def _frame_similarity(frame_a: np.ndarray, frame_b: np.ndarray) -> float:
+    """Similarity of two frames (1.0 = identical) from mean absolute difference."""
+    diff = np.abs(frame_a.astype(np.int16) - frame_b)
+    return 1.0 - (np.mean(diff) / 255.0)
+
+
+# Frames are compared as grids of at most 32x32 block sums; a full-resolution
+# comparison is only made when the signature distance does not rule it out
+_SIGNATURE_SIZE = 32
+
+# Frames per signature batch. This bounds peak memory: each batch holds a
+# (batch, 32, W, 3) uint32 array of row-block sums, about 12 MB for 480-px-wide
+# frames at 64, while still reading a memory-mapped store in large sequential runs
+_SIGNATURE_BATCH = 64
+
+
+def _block_sums(array: np.ndarray, blocks: int, axis: int) -> np.ndarray:
+    """Sum an axis into nearly equal contiguous blocks that cover all of it."""
+    length = array.shape[axis]
+    if length % blocks == 0:
+        # Even blocks: a reshape is much faster than reduceat
+        shape = array.shape[:axis] + (blocks, length // blocks) + array.shape[axis:][1:]
+        return array.reshape(shape).sum(axis=axis, dtype=np.uint32)
+    starts = np.linspace(0, length, blocks + 1).astype(int)[:-1]
+    return np.add.reduceat(array, starts, axis=axis, dtype=np.uint32)
+
+
+def _frame_signature(frame: np.ndarray) -> np.ndarray:
+    """
+    Flat float vector of block sums summarizing an RGB frame.
+
+    Blocks tile the whole frame (their sizes differ by at most one pixel when
+    the frame doesn't divide evenly), and each block's sum is scaled by the
+    number of blocks over the number of pixels, so for evenly divided frames
+    the entries are block-mean colors. With that scaling the mean absolute
+    difference of two signatures is a lower bound on the full-resolution mean
+    absolute difference of the frames.
+
+    Also accepts a stack of frames (..., H, W, 3) and returns one row per frame.
+    """
+    height, width = frame.shape[-3:-1]
+    lead = frame.shape[:-3]
+    rows, cols = min(_SIGNATURE_SIZE, height), min(_SIGNATURE_SIZE, width)
+    # Sum block rows first (contiguous), then block columns
+    strips = _block_sums(frame, rows, axis=-3)
+    sums = _block_sums(strips, cols, axis=-2)
+    return sums.reshape(*lead, -1) * (rows * cols / (height * width))
+
+
+def _frame_signatures(frames: FrameStore) -> np.ndarray:
+    """(N, D) signatures of all frames, read in contiguous batches when the store allows."""
+    array = frames.as_array()
+    if array is None:
+        return np.stack([_frame_signature(frame) for frame in frames])
+    return np.concatenate([_frame_signature(array[i:i + _SIGNATURE_BATCH])
+                           for i in range(0, len(array), _SIGNATURE_BATCH)])
+
+
+def _is_duplicate(signature_distance: float, frame_a: np.ndarray, frame_b: np.ndarray,
+                  threshold: float) -> bool:
+    """
+    Decide whether two frames are near-duplicates, reading full frames only if needed.
+
+    The signature distance never exceeds the full-resolution mean absolute
+    difference, so a distance over the limit settles it. Anything under the
+    limit is confirmed at full resolution, since block sums can hide a local
+    change.
+
+    Args:
+        signature_distance: Mean absolute difference of the two frame signatures
+        frame_a: First RGB frame
+        frame_b: Second RGB frame
+        threshold: Similarity threshold (0.0-1.0) at or above which frames are duplicates
+
+    Returns:
+        True if the frames count as duplicates
+    """
+    limit = (1.0 - threshold) * 255.0
+    if signature_distance > limit:
+        return False
+    return _frame_similarity(frame_a, frame_b) >= threshold
+
+
+def _print_info(info: dict, optimize_for_emoji: bool = False):
+    """Print a summary of a written GIF along with Slack size warnings."""
+    file_size_kb = info['size_kb']
+
+    print(f"\n✓ GIF created successfully!")
+    print(f"  Path: {info['path']}")
+    print(f"  Size: {file_size_kb:.1f} KB ({info['size_mb']:.2f} MB)")
+    print(f"  Dimensions: {info['dimensions']}")
+    print(f"  Frames: {info['frame_count']} @ {info['fps']} fps")
+    print(f"  Duration: {info['duration_seconds']:.1f}s")
+    print(f"  Colors: {info['colors']}")
+
+    # Warnings
+    if optimize_for_emoji and file_size_kb > 64:
+        print(f"\n⚠️  WARNING: Emoji file size ({file_size_kb:.1f} KB) exceeds 64 KB limit")
+        print("   Try: fewer frames, fewer colors, or simpler design")
+    elif not optimize_for_emoji and file_size_kb > 2048:
+        print(f"\n⚠️  WARNING: File size ({file_size_kb:.1f} KB) is large for Slack")
+        print("   Try: fewer frames, smaller dimensions, or fewer colors")
 
 
 class GIFBuilder:
     """Builder for creating optimized GIFs from frames."""
 
-    def __init__(self, width: int = 480, height: int = 480, fps: int = 15):
+    def __init__(self, width: int = 480, height: int = 480, fps: int = 15,
+                 frame_store: Optional[FrameStore] = None,
+                 expected_frames: Optional[int] = None):
         """
         Initialize GIF builder.
 
@@ -24,98 +220,195 @@ class GIFBuilder:
             width: Frame width in pixels
             height: Frame height in pixels
             fps: Frames per second
+            frame_store: Where frames are kept (default: in memory). Pass a
+                MemmapFrameStore for long renders that shouldn't live in RAM.
+            expected_frames: Preallocate one contiguous buffer for this many frames
+                (grows if exceeded); ignored when frame_store is given
         """
         self.width = width
         self.height = height
         self.fps = fps
-        self.frames: list[np.ndarray] = []
+        if frame_store is None:
+            if expected_frames is not None:
+                frame_store = ArrayFrameStore(capacity=expected_frames)
+            else:
+                frame_store = MemoryFrameStore()
+        self._store = frame_store
+        # Display time of each frame in milliseconds, parallel to self.frames
+        self.durations: list[float] = []
+
+    @property
+    def frames(self) -> FrameStore:
+        """The frames added so far, in order."""
+        return self._store
+
+    @frames.setter
+    def frames(self, frames: list[np.ndarray]):
+        store = self._store.empty()
+        for frame in frames:
+            store.append(np.asarray(frame))
+        self._store = store
+
+    def _prepare_frame(self, frame: np.ndarray | Image.Image) -> np.ndarray:
+        """Convert a frame to an RGB array at the builder's dimensions."""
+        size = (self.width, self.height)
+        if isinstance(frame, Image.Image):
+            if frame.mode != 'RGB':
+                frame = frame.convert('RGB')
+            if frame.size != size:
+                frame = frame.resize(size, Image.Resampling.LANCZOS)
+            # Already RGB: read the pixels without another conversion copy
+            return np.asarray(frame)
 
-    def add_frame(self, frame: np.ndarray | Image.Image):
+        # Ensure frame is correct size
+        if frame.shape[:2] != (self.height, self.width):
+            pil_frame = Image.fromarray(frame)
+            frame = np.asarray(pil_frame.resize(size, Image.Resampling.LANCZOS))
+
+        return frame
+
+    def add_frame(self, frame: np.ndarray | Image.Image, duration: Optional[float] = None):
         """
         Add a frame to the GIF.
 
         Args:
             frame: Frame as numpy array or PIL Image (will be converted to RGB)
+            duration: How long to show the frame in milliseconds (default 1000/fps)
         """
-        if isinstance(frame, Image.Image):
-            frame = np.array(frame.convert('RGB'))
+        self._frame_durations()
+        self.frames.append(self._prepare_frame(frame))
+        self.durations.append(1000 / self.fps if duration is None else duration)
 
-        # Ensure frame is correct size
-        if frame.shape[:2] != (self.height, self.width):
-            pil_frame = Image.fromarray(frame)
-            pil_frame = pil_frame.resize((self.width, self.height), Image.Resampling.LANCZOS)
-            frame = np.array(pil_frame)
+    def new_frame(self, bg_color: Optional[tuple[int, int, int]] = None,
+                  duration: Optional[float] = None) -> np.ndarray:
+        """
+        Add a frame and return a writable (H, W, 3) uint8 array to draw it into.
 
-        self.frames.append(frame)
+        With a contiguous store (expected_frames=... or a MemmapFrameStore) the
+        array is a view into the store itself, so rendering writes straight
+        into place. Finish drawing before adding the next frame.
 
-    def add_frames(self, frames: list[np.ndarray | Image.Image]):
-        """Add multiple frames at once."""
+        Args:
+            bg_color: Fill color (None = leave uninitialized)
+            duration: How long to show the frame in milliseconds (default 1000/fps)
+
+        Returns:
+            Writable frame array
+        """
+        self._frame_durations()
+        frame = self._store.reserve((self.height, self.width, 3))
+        if bg_color is not None:
+            frame[...] = bg_color
+        self.durations.append(1000 / self.fps if duration is None else duration)
+        return frame
+
+    def add_frames(self, frames: list[np.ndarray | Image.Image | HeldFrame]):
+        """
+        Add multiple frames at once.
+
+        HeldFrame entries are added once, shown for frame_count frame intervals.
+        """
         for frame in frames:
-            self.add_frame(frame)
+            if isinstance(frame, HeldFrame):
+                self.add_frame(frame.frame, duration=frame.frame_count * 1000 / self.fps)
+            else:
+                self.add_frame(frame)
 
-    def optimize_colors(self, num_colors: int = 128, use_global_palette: bool = True) -> list[np.ndarray]:
+    def hold(self, duration: float):
         """
-        Reduce colors in all frames using quantization.
+        Keep the last frame on screen longer instead of adding copies of it.
+
+        Args:
+            duration: Extra time in milliseconds
+        """
+        if not self.frames:
+            raise ValueError("No frame to hold. Add frames with add_frame() first.")
+        self._frame_durations()[-1] += duration
+
+    def build_palette(self, num_colors: int = 128, max_frames: Optional[int] = 32) -> Palette:
+        """
+        Build a global palette from a color histogram of the frames.
 
         Args:
             num_colors: Target number of colors (8-256)
-            use_global_palette: Use a single palette for all frames (better compression)
+            max_frames: Histogram an evenly spaced sample of at most this many
+                frames (None = all frames)
 
         Returns:
-            List of color-optimized frames
+            Palette shared by all frames
         """
-        optimized = []
+        histogram = ColorHistogram.from_frames(self.frames, max_frames=max_frames)
+        return histogram.palette(num_colors)
 
-        if use_global_palette and len(self.frames) > 1:
-            # Create a global palette from all frames
-            # Sample frames to build palette
-            sample_size = min(5, len(self.frames))
-            sample_indices = [int(i * len(self.frames) / sample_size) for i in range(sample_size)]
-            sample_frames = [self.frames[i] for i in sample_indices]
-
-            # Combine sample frames into a single image for palette generation
-            # Flatten each frame to get all pixels, then stack them
-            all_pixels = np.vstack([f.reshape(-1, 3) for f in sample_frames])  # (total_pixels, 3)
-
-            # Create a properly-shaped RGB image from the pixel data
-            # We'll make a roughly square image from all the pixels
-            total_pixels = len(all_pixels)
-            width = min(512, int(np.sqrt(total_pixels)))  # Reasonable width, max 512
-            height = (total_pixels + width - 1) // width  # Ceiling division
-
-            # Pad if necessary to fill the rectangle
-            pixels_needed = width * height
-            if pixels_needed > total_pixels:
-                padding = np.zeros((pixels_needed - total_pixels, 3), dtype=np.uint8)
-                all_pixels = np.vstack([all_pixels, padding])
-
-            # Reshape to proper RGB image format (H, W, 3)
-            img_array = all_pixels[:pixels_needed].reshape(height, width, 3).astype(np.uint8)
-            combined_img = Image.fromarray(img_array, mode='RGB')
-
-            # Generate global palette
-            global_palette = combined_img.quantize(colors=num_colors, method=2)
-
-            # Apply global palette to all frames
-            for frame in self.frames:
-                pil_frame = Image.fromarray(frame)
-                quantized = pil_frame.quantize(palette=global_palette, dither=1)
-                optimized.append(np.array(quantized.convert('RGB')))
-        else:
-            # Use per-frame quantization
-            for frame in self.frames:
-                pil_frame = Image.fromarray(frame)
-                quantized = pil_frame.quantize(colors=num_colors, method=2, dither=1)
-                optimized.append(np.array(quantized.convert('RGB')))
+    def quantize_frames(self, num_colors: int = 128, dither: bool = True,
+                        workers: Optional[int] = None,
+                        executor: Optional[Executor] = None) -> tuple[list[np.ndarray], Palette]:
+        """
+        Quantize all frames to palette indices against one global palette.
+
+        Indexed frames are a third the size of RGB frames and can be written
+        to a GIF directly, without a second quantization pass in the encoder.
+
+        Args:
+            num_colors: Target number of colors (8-256)
+            dither: Apply Floyd-Steinberg dithering (smoother gradients, larger files;
+                on by default)
+            workers: Quantize frames on this many threads (None = serial)
+            executor: Existing thread/process pool to quantize frames on
+
+        Returns:
+            Tuple of (list of (H, W) uint8 index arrays, shared Palette)
+        """
+        palette = self.build_palette(num_colors)
+        quantize = partial(palette.quantize, dither=dither)
+        indexed = _map_frames(quantize, list(self.frames), workers=workers, executor=executor)
+        return indexed, palette
+
+    def optimize_colors(self, num_colors: int = 128, use_global_palette: bool = True,
+                        dither: bool = True, workers: Optional[int] = None,
+                        executor: Optional[Executor] = None) -> list[np.ndarray]:
+        """
+        Reduce colors in all frames using quantization.
 
-        return optimized
+        Args:
+            num_colors: Target number of colors (8-256)
+            use_global_palette: Use a single palette for all frames (better compression)
+            dither: Apply Floyd-Steinberg dithering (smoother gradients, larger files;
+                on by default)
+            workers: Quantize frames on this many threads (None = serial)
+            executor: Existing thread/process pool to quantize frames on
 
-    def deduplicate_frames(self, threshold: float = 0.995) -> int:
+        Returns:
+            List of color-optimized frames (in original order)
+        """
+        if use_global_palette and len(self.frames) > 1:
+            # One histogram over all frames, one palette, one lookup table
+            indexed, palette = self.quantize_frames(num_colors, dither=dither,
+                                                    workers=workers, executor=executor)
+            return [palette.to_rgb(indices) for indices in indexed]
+
+        # Use per-frame palettes
+        quantize = partial(_quantize_own_palette, num_colors, dither)
+        return _map_frames(quantize, list(self.frames), workers=workers, executor=executor)
+
+    def _frame_durations(self) -> list[float]:
+        """Per-frame durations in ms (uniform 1000/fps if frames were replaced directly)."""
+        if len(self.durations) != len(self.frames):
+            self.durations = [1000 / self.fps] * len(self.frames)
+        return self.durations
+
+    def deduplicate_frames(self, threshold: float = 0.995, merge_durations: bool = False) -> int:
         """
         Remove duplicate or near-duplicate consecutive frames.
 
+        Frames are compared through small block-sum signatures computed once
+        up front; full-resolution comparisons only happen for pairs whose
+        signatures don't already rule out a duplicate.
+
         Args:
             threshold: Similarity threshold (0.0-1.0). Higher = more strict (0.995 = very similar).
+            merge_durations: Add each removed frame's duration to the frame it duplicates,
+                so playback time is unchanged
 
         Returns:
             Number of frames removed
@@ -123,30 +416,38 @@ class GIFBuilder:
         if len(self.frames) < 2:
             return 0
 
-        deduplicated = [self.frames[0]]
-        removed_count = 0
+        durations = self._frame_durations()
+        signatures = _frame_signatures(self.frames)
+        # Consecutive distances cover the common case of comparing against the
+        # frame right before; runs of duplicates compare against the kept frame
+        consecutive = np.abs(np.diff(signatures, axis=0)).mean(axis=1)
 
+        kept = [0]
+        kept_durations = [durations[0]]
         for i in range(1, len(self.frames)):
-            # Compare with previous frame
-            prev_frame = np.array(deduplicated[-1], dtype=np.float32)
-            curr_frame = np.array(self.frames[i], dtype=np.float32)
-
-            # Calculate similarity (normalized)
-            diff = np.abs(prev_frame - curr_frame)
-            similarity = 1.0 - (np.mean(diff) / 255.0)
-
-            # Keep frame if sufficiently different
-            # High threshold (0.995) means only remove truly identical frames
-            if similarity < threshold:
-                deduplicated.append(self.frames[i])
+            last = kept[-1]
+            if last == i - 1:
+                distance = consecutive[last]
             else:
-                removed_count += 1
+                distance = np.abs(signatures[i] - signatures[last]).mean()
 
-        self.frames = deduplicated
+            if _is_duplicate(distance, self.frames[last], self.frames[i], threshold):
+                if merge_durations:
+                    kept_durations[-1] += durations[i]
+            else:
+                kept.append(i)
+                kept_durations.append(durations[i])
+
+        removed_count = len(self.frames) - len(kept)
+        self._store.keep(kept)
+        self.durations = kept_durations
         return removed_count
 
     def save(self, output_path: str | Path, num_colors: int = 128,
-             optimize_for_emoji: bool = False, remove_duplicates: bool = True) -> dict:
+             optimize_for_emoji: bool = False, remove_duplicates: bool = True,
+             dither: bool = True, workers: Optional[int] = None,
+             executor: Optional[Executor] = None, delta_frames: bool = True,
+             target_kb: Optional[float] = None) -> dict:
         """
         Save frames as optimized GIF for Slack.
 
@@ -155,6 +456,19 @@ class GIFBuilder:
             num_colors: Number of colors to use (fewer = smaller file)
             optimize_for_emoji: If True, optimize for <64KB emoji size
             remove_duplicates: Remove duplicate consecutive frames
+            dither: Apply Floyd-Steinberg dithering when quantizing (on by default;
+                False gives flat colors and smaller files)
+            workers: Quantize frames on this many threads (None = serial)
+            executor: Existing thread/process pool to quantize frames on
+            delta_frames: Make unchanged pixels inside each frame's changed region
+                transparent and pick per-frame disposal (much smaller files, one
+                palette slot used). Frames are cropped to their changed region
+                either way.
+            target_kb: Search colors (up to num_colors), frame decimation and
+                dimensions for the best quality that fits this size (e.g. 64 for
+                emoji), quantizing every candidate with the given dither setting.
+                Candidates are encoded in memory; the chosen parameters and
+                per-attempt timings are returned under info['search'].
 
         Returns:
             Dictionary with file info (path, size, dimensions, frame_count)
@@ -165,25 +479,27 @@ class GIFBuilder:
         output_path = Path(output_path)
         original_frame_count = len(self.frames)
 
-        # Remove duplicate frames to reduce file size
+        # Remove duplicate frames to reduce file size (the kept frame absorbs their time)
         if remove_duplicates:
-            removed = self.deduplicate_frames(threshold=0.98)
+            removed = self.deduplicate_frames(threshold=0.98, merge_durations=True)
             if removed > 0:
                 print(f"  Removed {removed} duplicate frames")
 
-        # Optimize for emoji if requested
+        # Optimize for emoji if requested (a size target replaces the fixed heuristics)
         if optimize_for_emoji:
             if self.width > 128 or self.height > 128:
                 print(f"  Resizing from {self.width}x{self.height} to 128x128 for emoji")
                 self.width = 128
                 self.height = 128
                 # Resize all frames
-                resized_frames = []
+                resized_frames = self._store.empty()
                 for frame in self.frames:
                     pil_frame = Image.fromarray(frame)
                     pil_frame = pil_frame.resize((128, 128), Image.Resampling.LANCZOS)
-                    resized_frames.append(np.array(pil_frame))
-                self.frames = resized_frames
+                    resized_frames.append(np.asarray(pil_frame))
+                self._store = resized_frames
+
+        if optimize_for_emoji and target_kb is None:
             num_colors = min(num_colors, 48)  # More aggressive color limit for emoji
 
             # More aggressive FPS reduction for emoji
@@ -191,21 +507,31 @@ class GIFBuilder:
                 print(f"  Reducing frames from {len(self.frames)} to ~12 for emoji size")
                 # Keep every nth frame to get close to 12 frames
                 keep_every = max(1, len(self.frames) // 12)
-                self.frames = [self.frames[i] for i in range(0, len(self.frames), keep_every)]
-
-        # Optimize colors with global palette
-        optimized_frames = self.optimize_colors(num_colors, use_global_palette=True)
-
-        # Calculate frame duration in milliseconds
-        frame_duration = 1000 / self.fps
-
-        # Save GIF
-        imageio.imwrite(
-            output_path,
-            optimized_frames,
-            duration=frame_duration,
-            loop=0  # Infinite loop
-        )
+                durations = self._frame_durations()
+                self._store.keep(list(range(0, len(self.frames), keep_every)))
+                self.durations = _group_durations(durations, keep_every)
+
+        if target_kb is not None:
+            data, search = self._search_target_size(target_kb, num_colors, delta_frames,
+                                                    dither=dither, workers=workers,
+                                                    executor=executor)
+            output_path.write_bytes(data)
+            chosen = search['chosen']
+            width, height = chosen['width'], chosen['height']
+            frame_count = chosen['frame_count']
+            num_colors = chosen['colors']
+        else:
+            # Quantize to palette indices with a global palette
+            indexed_frames, palette = self.quantize_frames(
+                _palette_size(num_colors, delta_frames), dither=dither,
+                workers=workers, executor=executor)
+
+            # Save GIF straight from the indexed frames
+            _write_gif(output_path, indexed_frames, palette, self._frame_durations(),
+                       delta_frames)
+            search = None
+            width, height = self.width, self.height
+            frame_count = len(indexed_frames)
 
         # Get file info
         file_size_kb = output_path.stat().st_size / 1024
@@ -215,32 +541,373 @@ class GIFBuilder:
             'path': str(output_path),
             'size_kb': file_size_kb,
             'size_mb': file_size_mb,
-            'dimensions': f'{self.width}x{self.height}',
-            'frame_count': len(optimized_frames),
+            'dimensions': f'{width}x{height}',
+            'frame_count': frame_count,
             'fps': self.fps,
-            'duration_seconds': len(optimized_frames) / self.fps,
+            'duration_seconds': sum(self._frame_durations()) / 1000,
             'colors': num_colors
         }
+        if search is not None:
+            info['search'] = search
 
-        # Print info
-        print(f"\n✓ GIF created successfully!")
-        print(f"  Path: {output_path}")
-        print(f"  Size: {file_size_kb:.1f} KB ({file_size_mb:.2f} MB)")
-        print(f"  Dimensions: {self.width}x{self.height}")
-        print(f"  Frames: {len(optimized_frames)} @ {self.fps} fps")
-        print(f"  Duration: {info['duration_seconds']:.1f}s")
-        print(f"  Colors: {num_colors}")
-
-        # Warnings
-        if optimize_for_emoji and file_size_kb > 64:
-            print(f"\n⚠️  WARNING: Emoji file size ({file_size_kb:.1f} KB) exceeds 64 KB limit")
-            print("   Try: fewer frames, fewer colors, or simpler design")
-        elif not optimize_for_emoji and file_size_kb > 2048:
-            print(f"\n⚠️  WARNING: File size ({file_size_kb:.1f} KB) is large for Slack")
-            print("   Try: fewer frames, smaller dimensions, or fewer colors")
+        _print_info(info, optimize_for_emoji)
 
         return info
 
+    def _search_target_size(self, target_kb: float, max_colors: int, delta_frames: bool,
+                            dither: bool = True, workers: Optional[int] = None,
+                            executor: Optional[Executor] = None) -> tuple[bytes, dict]:
+        """
+        Find the highest-quality encoding that fits a byte budget.
+
+        Tries dimension scales, then frame decimation (keeping playback time by
+        lengthening kept frames), binary-searching the color count for each.
+        Resized frames, histograms and palettes are cached across attempts, so
+        each attempt is one LZW encode into memory.
+
+        Args:
+            target_kb: Size budget in KB
+            max_colors: Upper bound on palette colors
+            delta_frames: Transparent unchanged pixels and per-frame disposal
+            dither: Apply Floyd-Steinberg dithering in every attempt
+            workers: Quantize frames on this many threads (None = serial)
+            executor: Existing thread/process pool to quantize frames on
+
+        Returns:
+            Tuple of (GIF bytes, search report dict)
+        """
+        search_start = time.perf_counter()
+        target_bytes = target_kb * 1024
+        durations = self._frame_durations()
+        min_colors = min(8, max_colors)
+        frames_by_scale: dict[float, list[np.ndarray]] = {}
+        histograms: dict[float, ColorHistogram] = {}
+        palettes: dict[tuple[float, int], Palette] = {}
+        iterations = []
+
+        def frames_at(scale: float) -> list[np.ndarray]:
+            if scale not in frames_by_scale:
+                if scale == 1.0:
+                    frames_by_scale[scale] = list(self.frames)
+                else:
+                    size = (max(1, round(self.width * scale)), max(1, round(self.height * scale)))
+                    frames_by_scale[scale] = [
+                        np.asarray(Image.fromarray(frame).resize(size, Image.Resampling.LANCZOS))
+                        for frame in self.frames
+                    ]
+            return frames_by_scale[scale]
+
+        def palette_for(scale: float, colors: int) -> Palette:
+            if scale not in histograms:
+                histograms[scale] = ColorHistogram.from_frames(frames_at(scale), max_frames=32)
+            if (scale, colors) not in palettes:
+                palettes[scale, colors] = histograms[scale].palette(
+                    _palette_size(colors, delta_frames))
+            return palettes[scale, colors]
+
+        def attempt(scale: float, keep_every: int, colors: int) -> bytes:
+            start = time.perf_counter()
+            frames = frames_at(scale)
+            palette = palette_for(scale, colors)
+            kept = frames[::keep_every]
+            indexed = _map_frames(partial(palette.quantize, dither=dither), kept,
+                                  workers=workers, executor=executor)
+            # Each kept frame covers the frames dropped after it, preserving timing
+            buffer = io.BytesIO()
+            _write_gif(buffer, indexed, palette, _group_durations(durations, keep_every),
+                       delta_frames)
+            data = buffer.getvalue()
+            height, width = indexed[0].shape
+            iterations.append({
+                'width': width,
+                'height': height,
+                'keep_every': keep_every,
+                'frame_count': len(indexed),
+                'colors': colors,
+                'dither': dither,
+                'size_kb': len(data) / 1024,
+                'seconds': time.perf_counter() - start,
+            })
+            return data
+
+        best: Optional[tuple[bytes, dict]] = None
+        smallest: Optional[tuple[bytes, dict]] = None
+
+        for scale in _TARGET_SCALES:
+            for keep_every in _TARGET_KEEP_EVERY:
+                if keep_every > 1 and len(self.frames) <= keep_every:
+                    continue
+
+                # Fewest colors first: if that doesn't fit, no color count will
+                data = attempt(scale, keep_every, min_colors)
+                if smallest is None or len(data) < len(smallest[0]):
+                    smallest = (data, iterations[-1])
+                if len(data) > target_bytes:
+                    continue
+                best = (data, iterations[-1])
+
+                # Binary search for the most colors that still fit
+                low, high = min_colors, max_colors + 1
+                if max_colors > min_colors:
+                    data = attempt(scale, keep_every, max_colors)
+                    if len(data) <= target_bytes:
+                        low, best = max_colors, (data, iterations[-1])
+                    else:
+                        high = max_colors
+                while high - low > max(2, low // 8):
+                    colors = (low + high) // 2
+                    data = attempt(scale, keep_every, colors)
+                    if len(data) <= target_bytes:
+                        low, best = colors, (data, iterations[-1])
+                    else:
+                        high = colors
+                break
+            if best is not None:
+                break
+
+        fits = best is not None
+        data, chosen = best if fits else smallest
+        search = {
+            'target_kb': target_kb,
+            'fits': fits,
+            'chosen': chosen,
+            'iterations': iterations,
+            'seconds': time.perf_counter() - search_start,
+        }
+
+        print(f"  Size search ({len(iterations)} encodes, {search['seconds']:.2f}s): "
+              f"{chosen['width']}x{chosen['height']}, {chosen['colors']} colors, "
+              f"every {chosen['keep_every']} frame(s), dither={chosen['dither']}")
+        if not fits:
+            print(f"  No candidate fits {target_kb} KB; using the smallest "
+                  f"({chosen['size_kb']:.1f} KB)")
+
+        return data, search
+
+    def open_stream(self, output_path: str | Path, num_colors: int = 128,
+                    palette_sample: int = 8, remove_duplicates: bool = True,
+                    delta_frames: bool = True, dither: bool = True) -> 'GIFStream':
+        """
+        Open a streaming writer that encodes frames as they are added.
+
+        Unlike add_frame()/save(), frames are quantized and written to disk
+        as they arrive (one frame behind, so duplicates can extend its
+        duration), so memory use stays bounded regardless of frame count.
+
+        Example:
+            with builder.open_stream('long.gif', num_colors=64) as stream:
+                for frame in render_frames():
+                    stream.add_frame(frame)
+            print(stream.info['size_kb'])
+
+        Args:
+            output_path: Where to save the GIF
+            num_colors: Number of colors in the global palette
+            palette_sample: Number of leading frames buffered to build the palette
+            remove_duplicates: Skip frames nearly identical to the last written one
+            delta_frames: Transparent unchanged pixels and per-frame disposal (see save())
+            dither: Apply Floyd-Steinberg dithering when quantizing
+
+        Returns:
+            GIFStream (usable as a context manager; if the block raises, the
+            unfinished file is removed)
+        """
+        return GIFStream(self, output_path, num_colors=num_colors,
+                         palette_sample=palette_sample,
+                         remove_duplicates=remove_duplicates,
+                         delta_frames=delta_frames, dither=dither)
+
     def clear(self):
         """Clear all frames (useful for creating multiple GIFs)."""
-        self.frames = []
+        self._store.clear()
+        self.durations = []
+
+
+class GIFStream:
+    """Writes frames to a GIF as they arrive, holding only a small window in memory."""
+
+    def __init__(self, builder: GIFBuilder, output_path: str | Path, num_colors: int = 128,
+                 palette_sample: int = 8, remove_duplicates: bool = True,
+                 dedup_threshold: float = 0.98, delta_frames: bool = True,
+                 dither: bool = True):
+        """
+        Initialize a GIF stream.
+
+        Args:
+            builder: Builder providing dimensions and fps
+            output_path: Where to save the GIF
+            num_colors: Number of colors in the global palette
+            palette_sample: Number of leading frames buffered to build the palette
+            remove_duplicates: Skip frames nearly identical to the last written one
+            dedup_threshold: Similarity threshold for duplicate detection
+            delta_frames: Transparent unchanged pixels and per-frame disposal
+                (see GIFBuilder.save())
+            dither: Apply Floyd-Steinberg dithering when quantizing
+        """
+        self.builder = builder
+        self.output_path = Path(output_path)
+        self.num_colors = num_colors
+        self.palette_sample = max(1, palette_sample)
+        self.remove_duplicates = remove_duplicates
+        self.dedup_threshold = dedup_threshold
+        self.delta_frames = delta_frames
+        self.dither = dither
+        self.info: dict = {}
+
+        self._sample: list[tuple[np.ndarray, float]] = []
+        self._palette: Optional[Palette] = None
+        self._writer: Optional[GIFWriter] = None
+        self._last_frame: Optional[np.ndarray] = None
+        self._last_signature: Optional[np.ndarray] = None
+        # Last quantized frame and its duration, written once the next distinct frame arrives
+        self._held: Optional[tuple[np.ndarray, float]] = None
+        self._total_ms = 0.0
+        self._frames_added = 0
+        self._frames_removed = 0
+        self._closed = False
+
+    def add_frame(self, frame: np.ndarray | Image.Image, duration: Optional[float] = None):
+        """
+        Add a frame, writing it out as soon as the palette is known.
+
+        Args:
+            frame: Frame as numpy array or PIL Image (will be converted to RGB)
+            duration: How long to show the frame in milliseconds (default 1000/fps)
+        """
+        if self._closed:
+            raise ValueError("Cannot add frames to a closed GIFStream")
+
+        frame = self.builder._prepare_frame(frame)
+        if duration is None:
+            duration = 1000 / self.builder.fps
+        self._frames_added += 1
+        self._total_ms += duration
+
+        if self._palette is None:
+            self._sample.append((frame, duration))
+            if len(self._sample) >= self.palette_sample:
+                self._start()
+            return
+
+        self._write(frame, duration)
+
+    def add_frames(self, frames: list[np.ndarray | Image.Image | HeldFrame]):
+        """Add multiple frames at once (HeldFrame entries are written once)."""
+        for frame in frames:
+            if isinstance(frame, HeldFrame):
+                self.add_frame(frame.frame,
+                               duration=frame.frame_count * 1000 / self.builder.fps)
+            else:
+                self.add_frame(frame)
+
+    def hold(self, duration: float):
+        """
+        Keep the last frame on screen longer instead of adding copies of it.
+
+        Args:
+            duration: Extra time in milliseconds
+        """
+        if self._closed:
+            raise ValueError("Cannot add frames to a closed GIFStream")
+        self._total_ms += duration
+        if self._held is not None:
+            indices, held_duration = self._held
+            self._held = (indices, held_duration + duration)
+        elif self._sample:
+            frame, sample_duration = self._sample[-1]
+            self._sample[-1] = (frame, sample_duration + duration)
+        else:
+            raise ValueError("No frame to hold. Add frames with add_frame() first.")
+
+    def _start(self):
+        """Build the palette from the buffered sample and flush it to the writer."""
+        histogram = ColorHistogram.from_frames([frame for frame, _ in self._sample])
+        self._palette = histogram.palette(_palette_size(self.num_colors, self.delta_frames))
+        self._writer = GIFWriter(self.output_path, self.builder.width, self.builder.height,
+                                 self._palette.colors, loop=0,
+                                 crop_unchanged=True,
+                                 transparency=self.delta_frames,
+                                 optimize_disposal=self.delta_frames)
+
+        sample, self._sample = self._sample, []
+        for frame, duration in sample:
+            self._write(frame, duration)
+
+    def _write(self, frame: np.ndarray, duration: float):
+        """Quantize a frame, or fold it into the held frame if it is a duplicate."""
+        if self.remove_duplicates:
+            signature = _frame_signature(frame)
+            if self._last_frame is not None:
+                distance = np.abs(signature - self._last_signature).mean()
+                if _is_duplicate(distance, self._last_frame, frame, self.dedup_threshold):
+                    indices, held_duration = self._held
+                    self._held = (indices, held_duration + duration)
+                    self._frames_removed += 1
+                    return
+            self._last_signature = signature
+
+        if self._held is not None:
+            self._writer.write_frame(*self._held)
+        self._held = (self._palette.quantize(frame, dither=self.dither), duration)
+        self._last_frame = frame
+
+    def close(self) -> dict:
+        """
+        Flush remaining frames and finish the GIF.
+
+        Returns:
+            Dictionary with file info (path, size, dimensions, frame_count)
+        """
+        if self._closed:
+            return self.info
+        self._closed = True
+
+        if self._palette is None and not self._sample:
+            raise ValueError("No frames to save. Add frames with add_frame() first.")
+        try:
+            if self._palette is None:
+                self._start()
+            if self._held is not None:
+                self._writer.write_frame(*self._held)
+                self._held = None
+            self._writer.close()
+        except BaseException:
+            self._abort()
+            raise
+
+        if self._frames_removed > 0:
+            print(f"  Removed {self._frames_removed} duplicate frames")
+
+        frame_count = self._writer.frame_count
+        file_size_kb = self.output_path.stat().st_size / 1024
+        self.info = {
+            'path': str(self.output_path),
+            'size_kb': file_size_kb,
+            'size_mb': file_size_kb / 1024,
+            'dimensions': f'{self.builder.width}x{self.builder.height}',
+            'frame_count': frame_count,
+            'fps': self.builder.fps,
+            'duration_seconds': self._total_ms / 1000,
+            'colors': self.num_colors
+        }
+        _print_info(self.info)
+        return self.info
+
+    def __enter__(self) -> 'GIFStream':
+        return self
+
+    def _abort(self):
+        """Release the file handle and remove the unfinished GIF."""
+        self._closed = True
+        self._sample = []
+        self._held = None
+        if self._writer is not None:
+            self._writer.abort()
+            self.output_path.unlink(missing_ok=True)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # Don't mask the original error or leave a truncated GIF behind
+            self._abort()
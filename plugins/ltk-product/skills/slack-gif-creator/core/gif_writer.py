@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+GIF Writer - Incremental encoder for palette-indexed GIF frames.
+
+Writes the GIF header once and then encodes each frame as soon as it is handed
+over, so animations can be streamed to disk without keeping every frame in
+memory. Pillow's LZW encoder does the actual image data compression.
+
+Frames after the first are delta encoded: only the bounding box that changed
+is written, pixels inside it that did not change can be marked transparent,
+and each frame's disposal method is chosen to minimize the next frame's box.
+"""
+
+from pathlib import Path
+from typing import BinaryIO, Optional
+from PIL import Image, GifImagePlugin
+import numpy as np
+
+
+def changed_bbox(previous: np.ndarray, current: np.ndarray) -> Optional[tuple[int, int, int, int]]:
+    """
+    Bounding box of pixels that differ between two indexed frames.
+
+    Args:
+        previous: (H, W) indices of the previous frame
+        current: (H, W) indices of the current frame
+
+    Returns:
+        (left, top, right, bottom) box with exclusive right/bottom, or None if identical
+    """
+    diff = previous != current
+    rows = np.flatnonzero(diff.any(axis=1))
+    if len(rows) == 0:
+        return None
+    cols = np.flatnonzero(diff.any(axis=0))
+    return (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1)
+
+
+def _bbox_area(bbox: Optional[tuple[int, int, int, int]]) -> int:
+    if bbox is None:
+        return 0
+    left, top, right, bottom = bbox
+    return (right - left) * (bottom - top)
+
+
+def _encode(region: np.ndarray, offset: tuple[int, int], **params) -> list[bytes]:
+    """LZW-encode an index array as one GIF image block (plus control extension)."""
+    # An 'L' image encodes its raw bytes, which are exactly the indices
+    frame = Image.fromarray(np.ascontiguousarray(region, dtype=np.uint8))
+    return GifImagePlugin.getdata(frame, offset=offset, **params)
+
+
+class GIFWriter:
+    """Writes palette-indexed frames to a GIF one at a time."""
+
+    def __init__(self, output: str | Path | BinaryIO, width: int, height: int,
+                 palette: np.ndarray, loop: int = 0, crop_unchanged: bool = True,
+                 transparency: bool = False, optimize_disposal: bool = False):
+        """
+        Open the output and write the GIF header.
+
+        Args:
+            output: File path or writable binary file object
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+            palette: Global color table as (N, 3) uint8 array (N <= 256)
+            loop: Number of loops (0 = infinite)
+            crop_unchanged: Only encode the region that changed since the previous frame
+            transparency: Reserve an extra palette slot as transparent and use it for
+                unchanged pixels inside the changed region (needs N <= 255)
+            optimize_disposal: Per frame, pick "do not dispose" or "restore to previous",
+                whichever leaves the next frame less to encode (one frame of lookahead)
+        """
+        palette = np.asarray(palette, dtype=np.uint8).reshape(-1, 3)
+        if not 1 <= len(palette) <= 256:
+            raise ValueError(f"GIF palette must have 1-256 colors, got {len(palette)}")
+
+        # Transparent pixels reveal the canvas underneath, so they only apply to
+        # delta frames and need a palette slot no real color maps to
+        self.transparent_index: Optional[int] = None
+        if transparency and crop_unchanged and len(palette) < 256:
+            self.transparent_index = len(palette)
+            palette = np.vstack([palette, np.zeros((1, 3), dtype=np.uint8)])
+
+        if isinstance(output, (str, Path)):
+            self._fp = open(output, 'wb')
+            self._owns_fp = True
+        else:
+            self._fp = output
+            self._owns_fp = False
+
+        self.width = width
+        self.height = height
+        self.crop_unchanged = crop_unchanged
+        self.optimize_disposal = optimize_disposal and crop_unchanged
+        self.frame_count = 0
+        self.bytes_written = 0
+        self.closed = False
+        # Canvas before the pending frame is drawn, and the frame awaiting its disposal
+        self._canvas: Optional[np.ndarray] = None
+        self._pending: Optional[tuple[np.ndarray, float]] = None
+        # GIF delays are whole centiseconds; track requested vs written time so
+        # rounding errors are carried into later frames instead of accumulating
+        self._elapsed_ms = 0.0
+        self._elapsed_cs = 0
+
+        # Pillow builds the logical screen descriptor and global color table
+        # from a palette image of canvas size
+        header_image = Image.new('P', (width, height))
+        header_image.putpalette(palette.tobytes())
+        header, _ = GifImagePlugin.getheader(header_image, info={'loop': loop})
+        self._write(header)
+
+    def _write(self, chunks: list[bytes]):
+        for chunk in chunks:
+            self._fp.write(chunk)
+            self.bytes_written += len(chunk)
+
+    def write_frame(self, indices: np.ndarray, duration: float):
+        """
+        Add one full-canvas frame of palette indices.
+
+        With optimize_disposal the frame is encoded once the next frame (or
+        close()) arrives, since its disposal method depends on what follows.
+
+        Args:
+            indices: (H, W) uint8 array of indices into the global palette
+            duration: Frame duration in milliseconds (written in centiseconds, with
+                rounding carried over so total playback time stays exact)
+        """
+        if self.closed:
+            raise ValueError("Cannot write to a closed GIFWriter")
+        if indices.shape != (self.height, self.width):
+            raise ValueError(f"Frame shape {indices.shape} does not match canvas "
+                             f"{(self.height, self.width)}")
+
+        self._elapsed_ms += duration
+        delay_cs = max(1, round(self._elapsed_ms / 10) - self._elapsed_cs)
+        self._elapsed_cs += delay_cs
+
+        if self._pending is not None:
+            self._flush(next_frame=indices)
+        self._pending = (indices, delay_cs * 10)
+        if not self.optimize_disposal:
+            self._flush()
+
+    def _flush(self, next_frame: Optional[np.ndarray] = None):
+        """Encode the pending frame, choosing its disposal from the next frame."""
+        indices, duration = self._pending
+        self._pending = None
+        canvas = self._canvas
+
+        if canvas is None or not self.crop_unchanged:
+            self._write(_encode(indices, (0, 0), duration=duration))
+            self._canvas = indices
+            self.frame_count += 1
+            return
+
+        # Disposal 1 (do not dispose) leaves this frame on the canvas; disposal 3
+        # (restore to previous) puts back the canvas it was drawn over
+        disposal = 1
+        if self.optimize_disposal and next_frame is not None:
+            keep_area = _bbox_area(changed_bbox(indices, next_frame))
+            restore_area = _bbox_area(changed_bbox(canvas, next_frame))
+            if restore_area < keep_area:
+                disposal = 3
+
+        bbox = changed_bbox(canvas, indices) or (0, 0, 1, 1)
+        left, top, right, bottom = bbox
+        region = indices[top:bottom, left:right]
+        chunks = _encode(region, (left, top), duration=duration, disposal=disposal)
+
+        if self.transparent_index is not None:
+            # Unchanged pixels show through from the canvas; keep whichever encoding is smaller
+            unchanged = canvas[top:bottom, left:right] == region
+            if unchanged.any():
+                masked = np.where(unchanged, self.transparent_index, region)
+                masked_chunks = _encode(masked, (left, top), duration=duration,
+                                        disposal=disposal,
+                                        transparency=self.transparent_index)
+                if sum(map(len, masked_chunks)) < sum(map(len, chunks)):
+                    chunks = masked_chunks
+
+        self._write(chunks)
+        if disposal != 3:
+            self._canvas = indices
+        self.frame_count += 1
+
+    def close(self):
+        """Write the GIF trailer and close the output if this writer opened it."""
+        if self.closed:
+            return
+        if self._pending is not None:
+            self._flush()
+        self._write([b';'])
+        self.closed = True
+        if self._owns_fp:
+            self._fp.close()
+        else:
+            self._fp.flush()
+
+    def abort(self):
+        """Stop without writing the trailer, closing the output if this writer opened it."""
+        if self.closed:
+            return
+        self.closed = True
+        self._pending = None
+        if self._owns_fp:
+            self._fp.close()
+
+    def __enter__(self) -> 'GIFWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
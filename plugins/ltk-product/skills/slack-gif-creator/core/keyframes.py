@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Keyframes - Declare animation phases once, compile them to per-frame tracks.
+
+Templates used to decide every frame which phase they were in (`if t < 0.2:
+... elif ...`) and interpolate each property separately. A Track lists the
+keyframes of one property with the easing into each, and compiling it
+evaluates all frames at once with NumPy, so the frame loop only indexes
+precomputed position/scale/rotation/opacity arrays. Tracks depend only on the
+frame count, so any range of frames can be rendered independently.
+"""
+
+from typing import Optional
+import numpy as np
+from core.easing import interpolate, progress
+
+
+class Track:
+    """
+    Piecewise eased value of one property over normalized time (0.0 to 1.0).
+
+    Example:
+        # Grow for the first 20% of the animation, then shrink back
+        scale = Track(1.0).to(0.2, 1.2, 'ease_out').to(1.0, 1.0, 'ease_in')
+        scales = scale.compile(num_frames)
+    """
+
+    def __init__(self, value: float = 0.0, cycles: Optional[float] = None):
+        """
+        Start a track.
+
+        Args:
+            value: Value at time 0.0 (and until the next keyframe)
+            cycles: Repeat the keyframes this many times over the animation
+                (time wraps with (t * cycles) % 1.0); None = play once
+        """
+        self.times = [0.0]
+        self.values = [float(value)]
+        self.easings: list[Optional[str]] = [None]
+        self.cycles = cycles
+
+    def to(self, time: float, value: float, easing: str = 'linear') -> 'Track':
+        """
+        Add a keyframe, easing from the previous keyframe into it.
+
+        A keyframe at the same time as the previous one makes the value
+        jump there.
+
+        Args:
+            time: Normalized time of the keyframe (0.0 to 1.0)
+            value: Value at that time
+            easing: Name of easing function for the segment ending here
+
+        Returns:
+            The track, for chaining
+        """
+        if time < self.times[-1]:
+            raise ValueError(f"Keyframe time {time} is before the previous keyframe ({self.times[-1]})")
+        self.times.append(float(time))
+        self.values.append(float(value))
+        self.easings.append(easing)
+        return self
+
+    def hold(self, time: float) -> 'Track':
+        """
+        Keep the current value until a time.
+
+        Args:
+            time: Normalized time to hold until
+
+        Returns:
+            The track, for chaining
+        """
+        return self.to(time, self.values[-1])
+
+    def evaluate(self, t: np.ndarray) -> np.ndarray:
+        """
+        Track values at the given times.
+
+        Args:
+            t: Array of normalized times
+
+        Returns:
+            Array of values (before the first keyframe: its value; after the
+            last: the last value)
+        """
+        t = np.asarray(t, dtype=np.float64)
+        if self.cycles is not None:
+            t = (t * self.cycles) % 1.0
+
+        values = np.full(t.shape, self.values[-1])
+        values[t < self.times[0]] = self.values[0]
+        for k in range(1, len(self.times)):
+            start, end = self.times[k - 1], self.times[k]
+            if end <= start:
+                continue
+            in_segment = (t >= start) & (t < end)
+            if in_segment.any():
+                local = (t[in_segment] - start) / (end - start)
+                values[in_segment] = interpolate(self.values[k - 1], self.values[k], local,
+                                                 self.easings[k])
+        return values
+
+    def compile(self, num_frames: int) -> np.ndarray:
+        """
+        Values for every frame, at t = i / (num_frames - 1).
+
+        Args:
+            num_frames: Number of frames
+
+        Returns:
+            (num_frames,) float array
+        """
+        return self.evaluate(progress(num_frames))
+
+
+def compile_tracks(num_frames: int, **tracks: Track | float) -> dict[str, np.ndarray]:
+    """
+    Compile several named tracks for the same animation.
+
+    Args:
+        num_frames: Number of frames
+        **tracks: Track per property (a plain number is a constant track)
+
+    Returns:
+        Dictionary of property name to (num_frames,) float array, plus 't'
+        with each frame's progress
+    """
+    compiled = {'t': progress(num_frames)}
+    for name, track in tracks.items():
+        if isinstance(track, Track):
+            compiled[name] = track.compile(num_frames)
+        else:
+            compiled[name] = np.full(num_frames, float(track))
+    return compiled
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Layers - Composite small RGBA tiles onto a shared background.
+
+Templates used to give every object its own full-frame RGBA canvas, fade it,
+and alpha_composite the whole frame, even when the object covered a small
+patch of it. A layer is just the object's tight tile and where it goes; the
+compositor starts each frame from one prepared background and blends only
+each layer's bounding box, so per-frame cost follows the object's size rather
+than the frame's.
+"""
+
+import threading
+from typing import NamedTuple, Optional
+from PIL import Image
+from core.sprites import Sprite, paste_tile, with_opacity
+
+
+Box = tuple[int, int, int, int]
+
+
+class Layer(NamedTuple):
+    """An RGBA tile placed at a position in the frame, with an opacity."""
+    image: Image.Image
+    position: tuple[int, int]
+    opacity: float = 1.0
+
+    @property
+    def box(self) -> Box:
+        """(left, top, right, bottom) covered by the tile (may be off-frame)."""
+        x, y = self.position
+        return (x, y, x + self.image.width, y + self.image.height)
+
+    @classmethod
+    def from_sprite(cls, sprite: Sprite, position: tuple[int, int], scale: float = 1.0,
+                    opacity: float = 1.0, centered: bool = False) -> 'Layer':
+        """
+        Layer for a sprite, placed as Sprite.blit() would place it.
+
+        Args:
+            sprite: Sprite to place
+            position: (x, y) draw position, as passed to the drawing helper
+            scale: Scale factor relative to the rasterized size
+            opacity: Opacity (0.0-1.0)
+            centered: If True, center the sprite at position
+
+        Returns:
+            Layer
+        """
+        tile, corner = sprite.place(position, scale, centered)
+        return cls(tile, corner, opacity)
+
+
+class LayerCompositor:
+    """
+    Blend layers onto a fixed background, touching only their bounding boxes.
+
+    Example:
+        compositor = LayerCompositor(480, 480, bg_color=(255, 255, 255))
+        star = get_sprite_cache().emoji('⭐', size=100)
+        for i in range(num_frames):
+            frames.append(compositor.compose([
+                Layer.from_sprite(star, (240, 240), opacity=opacities[i], centered=True),
+            ]))
+    """
+
+    def __init__(self, width: int, height: int,
+                 bg_color: tuple[int, int, int] = (255, 255, 255),
+                 background: Optional[Image.Image] = None):
+        """
+        Initialize a compositor.
+
+        Args:
+            width: Frame width
+            height: Frame height
+            bg_color: Background color (ignored if background is given)
+            background: Background image to composite onto instead of a
+                solid color (e.g. a gradient), rendered once
+        """
+        if background is None:
+            background = Image.new('RGB', (width, height), bg_color)
+        elif background.size != (width, height):
+            raise ValueError(f"Background is {background.size[0]}x{background.size[1]}, "
+                             f"expected {width}x{height}")
+        self.width = width
+        self.height = height
+        self.background = background.convert('RGB')
+        # Reused canvas and the boxes its last frame drew over, per thread, so
+        # threads rendering frames with a shared compositor don't clobber each other
+        self._canvases: dict[int, tuple[Image.Image, list[Box]]] = {}
+
+    def __getstate__(self) -> dict:
+        # Process pools get a copy without the reused canvases
+        state = self.__dict__.copy()
+        state['_canvases'] = {}
+        return state
+
+    def _clip(self, box: Box) -> Optional[Box]:
+        """Box clipped to the frame, or None if nothing of it is visible."""
+        left, top = max(0, box[0]), max(0, box[1])
+        right, bottom = min(self.width, box[2]), min(self.height, box[3])
+        if right <= left or bottom <= top:
+            return None
+        return (left, top, right, bottom)
+
+    def compose(self, layers: list[Layer], reuse: bool = False) -> Image.Image:
+        """
+        Render one frame: the background with the layers blended on in order.
+
+        Args:
+            layers: Layers from bottom to top; fully transparent or off-frame
+                layers are skipped
+            reuse: Render into one canvas kept by the compositor (one per
+                thread), restoring only the regions the previous frame drew
+                over. The returned image is overwritten by the next
+                reuse=True call from the same thread, so consume it first
+                (e.g. add it to a GIFBuilder, which copies frames).
+
+        Returns:
+            RGB frame
+        """
+        thread = threading.get_ident()
+        if not reuse or thread not in self._canvases:
+            frame = self.background.copy()
+        else:
+            frame, previous = self._canvases[thread]
+            for box in previous:
+                frame.paste(self.background.crop(box), box[:2])
+
+        dirty = []
+        for layer in layers:
+            if layer.opacity <= 0:
+                continue
+            box = self._clip(layer.box)
+            if box is None:
+                continue
+            tile = with_opacity(layer.image, layer.opacity)
+            paste_tile(frame, tile, layer.position)
+            dirty.append(box)
+
+        if reuse:
+            self._canvases[thread] = (frame, dirty)
+        return frame
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Palette Engine - Fast global palette construction and frame quantization.
+
+Builds a color histogram across frames with NumPy, derives a palette from the
+histogram with median cut plus a few k-means refinement passes, and maps frames
+to palette indices through a precomputed 32x32x32 lookup table. Working on
+histogram bins instead of raw pixels keeps palette cost independent of the
+number of frames.
+"""
+
+from typing import Optional
+from PIL import Image
+import numpy as np
+
+
+# Bits kept per channel for histogram bins and the lookup table (32 levels)
+HISTOGRAM_BITS = 5
+_SHIFT = 8 - HISTOGRAM_BITS
+_LEVELS = 1 << HISTOGRAM_BITS
+_NUM_BINS = _LEVELS ** 3
+
+# Per-bin mean colors are estimated from every Nth pixel; counts use all pixels
+_MEAN_STRIDE = 4
+
+
+def _bin_indices(frame: np.ndarray) -> np.ndarray:
+    """Map an (H, W, 3) uint8 frame to flat histogram/LUT bin indices."""
+    r = (frame[..., 0] >> _SHIFT).astype(np.uint16)
+    g = (frame[..., 1] >> _SHIFT).astype(np.uint16)
+    b = (frame[..., 2] >> _SHIFT).astype(np.uint16)
+    return (r << (2 * HISTOGRAM_BITS)) | (g << HISTOGRAM_BITS) | b
+
+
+def _bin_centers() -> np.ndarray:
+    """(32768, 3) float array of the RGB center of every histogram bin."""
+    levels = np.arange(_LEVELS, dtype=np.float32) * (1 << _SHIFT) + (1 << _SHIFT) / 2
+    r, g, b = np.meshgrid(levels, levels, levels, indexing='ij')
+    return np.stack([r.ravel(), g.ravel(), b.ravel()], axis=1)
+
+
+def _nearest(points: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    """Index of the nearest center for each point (squared Euclidean distance)."""
+    points = points.astype(np.float32)
+    centers = centers.astype(np.float32)
+    # |p - c|^2 = |p|^2 - 2 p.c + |c|^2; |p|^2 is constant per row
+    distances = (centers * centers).sum(axis=1) - 2.0 * points @ centers.T
+    return np.argmin(distances, axis=1)
+
+
+class Palette:
+    """A fixed set of colors plus a lookup table for fast frame quantization."""
+
+    def __init__(self, colors: np.ndarray):
+        """
+        Initialize palette.
+
+        Args:
+            colors: (N, 3) array of RGB colors (1-256 entries)
+        """
+        colors = np.asarray(colors, dtype=np.uint8).reshape(-1, 3)
+        if not 1 <= len(colors) <= 256:
+            raise ValueError(f"Palette must have 1-256 colors, got {len(colors)}")
+        self.colors = colors
+        self._lut: Optional[np.ndarray] = None
+        self._image: Optional[Image.Image] = None
+
+    def __len__(self) -> int:
+        return len(self.colors)
+
+    @property
+    def lut(self) -> np.ndarray:
+        """Flat (32768,) uint8 table mapping histogram bins to palette indices."""
+        if self._lut is None:
+            self._lut = _nearest(_bin_centers(), self.colors).astype(np.uint8)
+        return self._lut
+
+    def image(self) -> Image.Image:
+        """Palette as a 'P' mode PIL Image (for PIL quantize/dither)."""
+        if self._image is None:
+            self._image = Image.new('P', (1, 1))
+            self._image.putpalette(self.colors.tobytes())
+        return self._image
+
+    def quantize(self, frame: np.ndarray, dither: bool = False) -> np.ndarray:
+        """
+        Map an RGB frame to palette indices.
+
+        Args:
+            frame: (H, W, 3) uint8 RGB frame
+            dither: Use Floyd-Steinberg dithering (slower, via PIL)
+
+        Returns:
+            (H, W) uint8 array of palette indices
+        """
+        if dither:
+            quantized = Image.fromarray(frame).quantize(
+                palette=self.image(), dither=Image.Dither.FLOYDSTEINBERG)
+            return np.asarray(quantized)
+        return np.take(self.lut, _bin_indices(frame))
+
+    def to_rgb(self, indices: np.ndarray) -> np.ndarray:
+        """Expand palette indices back to an (H, W, 3) RGB frame."""
+        return np.take(self.colors, indices, axis=0)
+
+
+class ColorHistogram:
+    """Accumulates a binned color histogram across frames."""
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.counts = np.zeros(_NUM_BINS, dtype=np.int64)
+        # Per-bin channel sums over a pixel sample, so palette colors use true
+        # means rather than bin centers
+        self.sample_counts = np.zeros(_NUM_BINS, dtype=np.int64)
+        self.sums = np.zeros((_NUM_BINS, 3), dtype=np.float64)
+
+    @classmethod
+    def from_frames(cls, frames: list[np.ndarray],
+                    max_frames: Optional[int] = None) -> 'ColorHistogram':
+        """
+        Build a histogram from frames.
+
+        Args:
+            frames: RGB frames as (H, W, 3) uint8 arrays
+            max_frames: If set, use an evenly spaced sample of at most this many frames
+
+        Returns:
+            ColorHistogram
+        """
+        histogram = cls()
+        indices = range(len(frames))
+        if max_frames is not None and len(frames) > max_frames:
+            indices = np.linspace(0, len(frames) - 1, max_frames).round().astype(int)
+        for i in indices:
+            histogram.add(frames[i])
+        return histogram
+
+    def add(self, frame: np.ndarray):
+        """Add all pixels of an RGB frame to the histogram."""
+        bins = _bin_indices(frame).ravel()
+        self.counts += np.bincount(bins, minlength=_NUM_BINS)
+
+        sample = bins[::_MEAN_STRIDE]
+        pixels = frame.reshape(-1, 3)[::_MEAN_STRIDE]
+        self.sample_counts += np.bincount(sample, minlength=_NUM_BINS)
+        for channel in range(3):
+            self.sums[:, channel] += np.bincount(sample, weights=pixels[:, channel],
+                                                 minlength=_NUM_BINS)
+
+    def palette(self, num_colors: int = 128, refine_iterations: int = 3) -> Palette:
+        """
+        Derive a palette from the histogram.
+
+        Uses median cut over occupied bins (weighted by pixel count), then
+        refines the box means with a few weighted k-means iterations.
+
+        Args:
+            num_colors: Maximum number of palette colors (1-256)
+            refine_iterations: Number of k-means refinement passes
+
+        Returns:
+            Palette with at most num_colors colors
+        """
+        num_colors = max(1, min(256, num_colors))
+        occupied = np.nonzero(self.counts)[0]
+        if len(occupied) == 0:
+            return Palette(np.zeros((1, 3), dtype=np.uint8))
+
+        weights = self.counts[occupied].astype(np.float64)
+        sampled = self.sample_counts[occupied]
+        colors = _bin_centers()[occupied].astype(np.float64)
+        has_mean = sampled > 0
+        colors[has_mean] = self.sums[occupied[has_mean]] / sampled[has_mean, None]
+
+        centers = _median_cut(colors, weights, num_colors)
+
+        for _ in range(refine_iterations):
+            labels = _nearest(colors, centers)
+            totals = np.bincount(labels, weights=weights, minlength=len(centers))
+            used = totals > 0
+            for channel in range(3):
+                sums = np.bincount(labels, weights=colors[:, channel] * weights,
+                                   minlength=len(centers))
+                centers[used, channel] = sums[used] / totals[used]
+
+        return Palette(np.clip(np.round(centers), 0, 255).astype(np.uint8))
+
+
+def _median_cut(colors: np.ndarray, weights: np.ndarray, num_colors: int) -> np.ndarray:
+    """
+    Split weighted colors into boxes by median cut.
+
+    Args:
+        colors: (K, 3) bin colors
+        weights: (K,) pixel counts per bin
+        num_colors: Maximum number of boxes
+
+    Returns:
+        (M, 3) float array of weighted box means, M <= num_colors
+    """
+    def split_candidate(box: np.ndarray) -> tuple[float, int]:
+        """Score a box by population-weighted range along its widest channel."""
+        if len(box) < 2:
+            return 0.0, 0
+        ranges = colors[box].max(axis=0) - colors[box].min(axis=0)
+        channel = int(np.argmax(ranges))
+        return float(ranges[channel] * weights[box].sum()), channel
+
+    boxes = [np.arange(len(colors))]
+    candidates = [split_candidate(boxes[0])]
+
+    while len(boxes) < num_colors:
+        best = max(range(len(boxes)), key=lambda i: candidates[i][0])
+        score, channel = candidates[best]
+        if score <= 0:
+            break
+
+        box = boxes.pop(best)
+        candidates.pop(best)
+        box = box[np.argsort(colors[box, channel], kind='stable')]
+        cumulative = np.cumsum(weights[box])
+        split = int(np.searchsorted(cumulative, cumulative[-1] / 2))
+        split = min(max(split, 1), len(box) - 1)
+        for half in (box[:split], box[split:]):
+            boxes.append(half)
+            candidates.append(split_candidate(half))
+
+    return np.array([
+        (colors[box] * weights[box, None]).sum(axis=0) / weights[box].sum()
+        for box in boxes
+    ])
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Render - Shared harness for rendering animation frames in parallel.
+
+A template that exposes a pure `render_frame(i, t, ctx)` function (frame
+index, progress t = i / (num_frames - 1), and a picklable context holding
+everything precomputed: tracks, sprites, seeded random values) can have its
+frames rendered by a process pool. Frames are scheduled in contiguous chunks,
+come back in order, and can be streamed straight into a GIFBuilder or
+GIFStream instead of being collected in a list.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterator, Optional
+from PIL import Image
+import numpy as np
+from core.easing import progress
+
+
+RenderFrame = Callable[[int, float, Any], Image.Image | np.ndarray]
+
+# (render_frame, ctx) installed once in each process of a pool created here,
+# so the context is pickled per worker rather than per chunk
+_worker_job: Optional[tuple[RenderFrame, Any]] = None
+
+
+def _to_array(frame: Image.Image | np.ndarray) -> np.ndarray:
+    """RGB uint8 array of a frame (arrays pickle far faster than images)."""
+    if isinstance(frame, Image.Image):
+        return np.asarray(frame if frame.mode == 'RGB' else frame.convert('RGB'))
+    return frame
+
+
+def _render_chunk(render_frame: RenderFrame, ctx: Any, num_frames: int,
+                  bounds: tuple[int, int]) -> list[np.ndarray]:
+    """Render frames [start, stop) (picklable unit of work for process pools)."""
+    t = progress(num_frames)
+    start, stop = bounds
+    return [_to_array(render_frame(i, float(t[i]), ctx)) for i in range(start, stop)]
+
+
+def _init_worker(render_frame: RenderFrame, ctx: Any):
+    global _worker_job
+    _worker_job = (render_frame, ctx)
+
+
+def _render_worker_chunk(num_frames: int, bounds: tuple[int, int]) -> list[np.ndarray]:
+    render_frame, ctx = _worker_job
+    return _render_chunk(render_frame, ctx, num_frames, bounds)
+
+
+def frame_chunks(num_frames: int, num_chunks: int) -> list[tuple[int, int]]:
+    """
+    Split frame indices into contiguous, nearly equal (start, stop) ranges.
+
+    Args:
+        num_frames: Number of frames
+        num_chunks: Number of chunks wanted (fewer if there are fewer frames)
+
+    Returns:
+        List of (start, stop) index ranges in order
+    """
+    num_chunks = max(1, min(num_chunks, num_frames))
+    bounds = np.linspace(0, num_frames, num_chunks + 1).astype(int)
+    return [(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+
+def iter_frames(render_frame: RenderFrame, num_frames: int, ctx: Any = None,
+                workers: Optional[int] = None, executor: Optional[Executor] = None,
+                chunks_per_worker: int = 4) -> Iterator[Image.Image | np.ndarray]:
+    """
+    Render frames and yield them in order as they become available.
+
+    Args:
+        render_frame: Module-level function (i, t, ctx) -> frame; must be
+            picklable, and pure so frames can render in any process
+        num_frames: Number of frames
+        ctx: Context passed to every call (picklable)
+        workers: Render chunks on this many processes (None or 1 = serial)
+        executor: Existing process/thread pool to render chunks on
+        chunks_per_worker: Chunks scheduled per worker, for load balancing
+
+    Yields:
+        Frames in index order (arrays when rendered on a pool). A serial
+        render_frame that reuses its canvas yields the same image again, so
+        consume each frame before asking for the next.
+    """
+    if executor is None and (workers is None or workers <= 1):
+        t = progress(num_frames)
+        for i in range(num_frames):
+            yield render_frame(i, float(t[i]), ctx)
+        return
+
+    pool_size = workers or 4
+    chunks = frame_chunks(num_frames, pool_size * chunks_per_worker)
+
+    # map() keeps chunks in order and starts yielding once the first is done
+    if executor is not None:
+        results = executor.map(partial(_render_chunk, render_frame, ctx, num_frames), chunks)
+        for chunk in results:
+            yield from chunk
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(render_frame, ctx)) as pool:
+            for chunk in pool.map(partial(_render_worker_chunk, num_frames), chunks):
+                yield from chunk
+
+
+def render_frames(render_frame: RenderFrame, num_frames: int, ctx: Any = None,
+                  workers: Optional[int] = None, executor: Optional[Executor] = None,
+                  output: Any = None, reused: bool = False) -> Any:
+    """
+    Render every frame of an animation, optionally on a process pool.
+
+    Example:
+        def render_frame(i, t, ctx):
+            frame = create_blank_frame(ctx['width'], ctx['height'])
+            draw_circle(frame, (int(ctx['xs'][i]), 240), 30, (255, 0, 0))
+            return frame
+
+        ctx = {'width': 480, 'height': 480, 'xs': timeline(60, 'ease_out', 40, 440)}
+        frames = render_frames(render_frame, 60, ctx, workers=4)
+
+    Args:
+        render_frame: Module-level function (i, t, ctx) -> PIL Image or RGB array
+        num_frames: Number of frames
+        ctx: Picklable context with everything the frames need
+        workers: Render on this many processes (None = serial)
+        executor: Existing process/thread pool to render on
+        output: Object with add_frame() (GIFBuilder, GIFStream) to stream
+            frames into instead of returning a list
+        reused: render_frame returns a canvas it draws the next frame into
+            (e.g. LayerCompositor.compose(reuse=True)). Frames kept in the
+            returned list are copied; streamed and pooled frames already are
+
+    Returns:
+        List of PIL Images in frame order, or `output` if given
+    """
+    frames = iter_frames(render_frame, num_frames, ctx, workers=workers, executor=executor)
+    if output is not None:
+        for frame in frames:
+            output.add_frame(frame)
+        return output
+    return [Image.fromarray(frame) if isinstance(frame, np.ndarray)
+            else frame.copy() if reused else frame
+            for frame in frames]
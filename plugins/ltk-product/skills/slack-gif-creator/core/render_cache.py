@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Render Cache - Content-addressed disk cache for rendered template GIFs.
+
+Renders are keyed by a stable hash of (template, parameters, seed, version),
+so a repeated request for the same animation is a file read instead of a full
+re-render. Entries hold the final GIF bytes and optionally the frame stack,
+and the cache evicts least recently used entries to stay under a size bound.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+import PIL
+from PIL import Image
+import numpy as np
+from core.gif_builder import GIFBuilder
+
+
+# Bump when a change to rendering or encoding should invalidate cached output
+RENDER_CACHE_VERSION = 1
+
+_GIF_SUFFIX = '.gif'
+_FRAMES_SUFFIX = '.frames.npz'
+
+
+def _default_directory() -> Path:
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'slack-gif-creator' / 'renders'
+
+
+def _canonical(value: Any) -> Any:
+    """JSON fallback encoder that gives arrays/images a stable content digest."""
+    if isinstance(value, Image.Image):
+        value = np.asarray(value)
+    if isinstance(value, np.ndarray):
+        digest = hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest()
+        return {'ndarray': digest, 'shape': list(value.shape), 'dtype': str(value.dtype)}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Cannot hash render parameter of type {type(value).__name__}")
+
+
+def _is_random(template: Callable) -> bool:
+    """Whether a template draws random values (it takes a seed parameter)."""
+    try:
+        return 'seed' in inspect.signature(template).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _template_name(template: Callable | str) -> str:
+    if isinstance(template, str):
+        return template
+    return f'{template.__module__}.{template.__qualname__}'
+
+
+class RenderCache:
+    """Size-bounded LRU cache of rendered GIFs on local disk."""
+
+    def __init__(self, directory: Optional[str | Path] = None,
+                 max_bytes: int = 256 * 1024 * 1024):
+        """
+        Open (or create) a cache directory.
+
+        Args:
+            directory: Where entries are stored (default: ~/.cache/slack-gif-creator/renders)
+            max_bytes: Total size of entries to keep before evicting the least recently used
+        """
+        self.directory = Path(directory) if directory is not None else _default_directory()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.version = f'{RENDER_CACHE_VERSION}/pillow-{PIL.__version__}/numpy-{np.__version__}'
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._hit_seconds = 0.0
+        self._miss_seconds = 0.0
+
+        # key -> (total bytes, last access time); seeded from the files on disk
+        self._entries: dict[str, tuple[int, float]] = {}
+        for path in self.directory.glob(f'*{_GIF_SUFFIX}'):
+            self._index(path.name[:-len(_GIF_SUFFIX)])
+
+    def key(self, template: Callable | str, params: dict,
+            seed: Optional[int] = None) -> str:
+        """
+        Stable hash identifying a render.
+
+        Args:
+            template: Template function (or its dotted name)
+            params: Keyword arguments the render depends on (JSON-serializable,
+                arrays and PIL images are hashed by content)
+            seed: Integer seed (a Generator has no stable identity; pass an int)
+
+        Returns:
+            Hex digest usable as the cache key
+        """
+        if seed is not None and not isinstance(seed, (int, np.integer)):
+            raise ValueError("Cached renders need an integer seed, not a Generator")
+        payload = {
+            'template': _template_name(template),
+            'params': params,
+            'seed': seed,
+            'version': self.version,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=_canonical)
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.directory / f'{key}{suffix}'
+
+    def _index(self, key: str):
+        """Record an entry's size and access time from its files."""
+        size, accessed = 0, 0.0
+        for suffix in (_GIF_SUFFIX, _FRAMES_SUFFIX):
+            try:
+                stat = self._path(key, suffix).stat()
+            except FileNotFoundError:
+                continue
+            size += stat.st_size
+            accessed = max(accessed, stat.st_mtime)
+        if size:
+            self._entries[key] = (size, accessed)
+        else:
+            self._entries.pop(key, None)
+
+    def _touch(self, key: str):
+        now = time.time()
+        try:
+            os.utime(self._path(key, _GIF_SUFFIX), (now, now))
+        except FileNotFoundError:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = (self._entries[key][0], now)
+
+    def _write(self, path: Path, write: Callable):
+        """Write a file atomically so concurrent readers never see partial data."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up cached GIF bytes (counts as a hit or miss).
+
+        Args:
+            key: Key from key()
+
+        Returns:
+            GIF bytes, or None if not cached
+        """
+        start = time.perf_counter()
+        try:
+            data = self._path(key, _GIF_SUFFIX).read_bytes()
+        except FileNotFoundError:
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+        if key not in self._entries:
+            self._index(key)
+        self._touch(key)
+        self.hits += 1
+        self._hit_seconds += time.perf_counter() - start
+        return data
+
+    def get_frames(self, key: str) -> Optional[tuple[np.ndarray, np.ndarray]]:
+        """
+        Load the cached frame stack for a key, if one was stored.
+
+        Returns:
+            Tuple of ((N, H, W, 3) uint8 frames, (N,) durations in ms), or None
+        """
+        try:
+            with np.load(self._path(key, _FRAMES_SUFFIX)) as stored:
+                return stored['frames'], stored['durations']
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, gif_bytes: bytes, frames: Optional[np.ndarray] = None,
+            durations: Optional[list[float]] = None):
+        """
+        Store a render and evict old entries if over the size bound.
+
+        Args:
+            key: Key from key()
+            gif_bytes: Encoded GIF
+            frames: Optional (N, H, W, 3) uint8 frame stack to keep alongside
+            durations: Per-frame durations in ms for the frame stack
+        """
+        self._write(self._path(key, _GIF_SUFFIX), lambda f: f.write(gif_bytes))
+        if frames is not None:
+            frames = np.asarray(frames, dtype=np.uint8)
+            if durations is None:
+                durations = np.zeros(len(frames))
+            self._write(self._path(key, _FRAMES_SUFFIX),
+                        lambda f: np.savez(f, frames=frames,
+                                           durations=np.asarray(durations, dtype=np.float64)))
+        self._index(key)
+        if key in self._entries and self._entries[key][0] > self.max_bytes:
+            # Larger than the whole cache: keeping it would evict everything else
+            self.remove(key)
+            return
+        self._evict()
+
+    def _evict(self):
+        """Remove least recently used entries until the cache fits max_bytes."""
+        total = sum(size for size, _ in self._entries.values())
+        for key, (size, _) in sorted(self._entries.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            self.remove(key)
+            total -= size
+            self.evictions += 1
+
+    def remove(self, key: str):
+        """Delete an entry (no error if it does not exist)."""
+        for suffix in (_GIF_SUFFIX, _FRAMES_SUFFIX):
+            try:
+                self._path(key, suffix).unlink()
+            except FileNotFoundError:
+                pass
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """Delete all entries and reset the statistics."""
+        for key in list(self._entries):
+            self.remove(key)
+        self.hits = self.misses = self.evictions = 0
+        self._hit_seconds = self._miss_seconds = 0.0
+
+    def render(self, template: Callable[..., list], params: Optional[dict] = None,
+               seed: Optional[int] = None, width: int = 480, height: int = 480,
+               fps: int = 15, save_options: Optional[dict] = None,
+               keep_frames: bool = False) -> bytes:
+        """
+        Return a template animation as GIF bytes, rendering it only on a miss.
+
+        Example:
+            cache = RenderCache()
+            gif = cache.render(create_bounce_animation,
+                               {'object_type': 'emoji', 'object_data': {'emoji': '⚽', 'size': 60}},
+                               width=128, height=128, save_options={'optimize_for_emoji': True})
+
+        Args:
+            template: A create_*_animation function returning frames
+            params: Keyword arguments for the template
+            seed: Integer seed, passed to the template as seed= when given (a 'seed'
+                in params counts the same). A template that takes a seed but gets none
+                differs on every call, so that render is neither looked up nor stored.
+            width: GIF width
+            height: GIF height
+            fps: Frames per second
+            save_options: Keyword arguments for GIFBuilder.save()
+            keep_frames: Also store the frame stack (see get_frames()); an entry
+                cached without one is rendered again to add it
+
+        Returns:
+            GIF bytes
+        """
+        params = dict(params or {})
+        save_options = save_options or {}
+        params_seed = params.pop('seed', None)
+        if seed is None:
+            seed = params_seed
+        if seed is None and _is_random(template):
+            return self._render(template, params, width, height, fps, save_options)[0]
+
+        key = self.key(template, {'template_params': params, 'width': width, 'height': height,
+                                  'fps': fps, 'save_options': save_options}, seed)
+        if not keep_frames or self._path(key, _FRAMES_SUFFIX).exists():
+            data = self.get(key)
+            if data is not None:
+                return data
+        else:
+            self.misses += 1
+
+        start = time.perf_counter()
+        template_params = dict(params)
+        if seed is not None:
+            template_params['seed'] = seed
+        data, frames, durations = self._render(template, template_params, width, height,
+                                               fps, save_options, keep_frames)
+        self.put(key, data, frames, durations)
+        self._miss_seconds += time.perf_counter() - start
+        return data
+
+    def _render(self, template: Callable[..., list], template_params: dict, width: int,
+                height: int, fps: int, save_options: dict, keep_frames: bool = False):
+        """Render and encode a template; returns (GIF bytes, frames, durations)."""
+        builder = GIFBuilder(width=width, height=height, fps=fps)
+        builder.add_frames(template(**template_params))
+
+        frames = durations = None
+        if keep_frames:
+            frames = np.stack(list(builder.frames))
+            durations = list(builder.durations)
+
+        # Not a .gif suffix, so a concurrently opened cache never indexes it
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        os.close(fd)
+        try:
+            builder.save(tmp_path, **save_options)
+            data = Path(tmp_path).read_bytes()
+        finally:
+            os.unlink(tmp_path)
+        return data, frames, durations
+
+    def stats(self) -> dict:
+        """
+        Cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, avg_hit_ms, avg_miss_ms
+            (render time), entries, size_bytes and evictions
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'avg_hit_ms': 1000 * self._hit_seconds / self.hits if self.hits else 0.0,
+            'avg_miss_ms': 1000 * self._miss_seconds / self.misses if self.misses else 0.0,
+            'entries': len(self._entries),
+            'size_bytes': sum(size for size, _ in self._entries.values()),
+            'evictions': self.evictions,
+        }
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Sprites - Rasterize text and emoji once, then paste them into every frame.
+
+Templates draw the same emoji or caption on every frame. A sprite renders that
+(text, font, size, color, effect) combination once into a tight RGBA tile, and
+blitting it is a single paste at any position, scale or opacity. Scaled copies
+come from a chain of half-size mip levels, so pulse/zoom animations resample a
+small cached tile instead of re-rasterizing glyphs at every size.
+"""
+
+import inspect
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable
+from PIL import Image, ImageDraw
+import numpy as np
+from core.fonts import load_emoji_font
+from core.frame_composer import draw_emoji_enhanced
+from core.typography import (draw_text_with_glow, draw_text_with_outline,
+                             draw_text_with_shadow, get_font)
+
+
+# Text effects by name (None = plain text)
+_TEXT_EFFECTS = {
+    'plain': None,
+    'outline': draw_text_with_outline,
+    'shadow': draw_text_with_shadow,
+    'glow': draw_text_with_glow,
+}
+
+# Scaled tiles kept per sprite (a pulse or zoom uses a few dozen sizes)
+_MAX_SCALED_TILES = 64
+
+
+def paste_tile(frame: Image.Image, tile: Image.Image, position: tuple[int, int]) -> Image.Image:
+    """
+    Alpha-blend an RGBA tile onto a frame, clipping it to the frame bounds.
+
+    Args:
+        frame: RGB or RGBA frame to draw on (modified in place)
+        tile: RGBA tile
+        position: (x, y) of the tile's top-left corner (may be off-frame)
+
+    Returns:
+        Modified frame
+    """
+    x, y = position
+    if frame.mode != 'RGBA':
+        frame.paste(tile, (x, y), tile)
+        return frame
+
+    # alpha_composite needs a destination inside the frame, so clip the tile first
+    left, top = max(0, -x), max(0, -y)
+    right = min(tile.width, frame.width - x)
+    bottom = min(tile.height, frame.height - y)
+    if right > left and bottom > top:
+        frame.alpha_composite(tile, dest=(x + left, y + top), source=(left, top, right, bottom))
+    return frame
+
+
+@lru_cache(maxsize=256)
+def _opacity_lut(level: int) -> tuple[int, ...]:
+    """Alpha lookup table scaling 0-255 by level / 255, rounded."""
+    return tuple((alpha * level + 127) // 255 for alpha in range(256))
+
+
+def with_opacity(image: Image.Image, opacity: float) -> Image.Image:
+    """
+    An RGBA image with its alpha scaled by opacity.
+
+    Opacity is quantized to the 256 alpha levels; each level's lookup table
+    is built once, so fading a tile is a single pass over its alpha plane.
+    Opacity 0 still copies the image to clear its alpha; callers that can
+    simply skip a fully transparent tile should (LayerCompositor.compose does).
+
+    Args:
+        image: RGBA image
+        opacity: Opacity (0.0-1.0)
+
+    Returns:
+        New image with scaled alpha, or the input itself when opacity rounds
+        to 1.0 (treat it as read-only)
+    """
+    level = min(255, max(0, round(opacity * 255)))
+    if level == 255:
+        return image
+    faded = image.copy()
+    if level == 0:
+        faded.putalpha(0)
+    else:
+        faded.putalpha(image.getchannel('A').point(_opacity_lut(level)))
+    return faded
+
+
+class Sprite:
+    """A rasterized RGBA tile plus where it sits relative to its draw position."""
+
+    def __init__(self, image: Image.Image, offset: tuple[int, int], size: tuple[int, int]):
+        """
+        Initialize a sprite.
+
+        Args:
+            image: Tight RGBA tile
+            offset: Tile top-left relative to the draw position
+            size: Logical (width, height) used for centering, as the drawing
+                helpers measure it
+        """
+        self.image = image
+        self.offset = offset
+        self.size = size
+        self._mips = [image]
+        self._scaled: OrderedDict[tuple[int, int], Image.Image] = OrderedDict()
+
+    def _mip(self, target_width: int, target_height: int) -> Image.Image:
+        """Smallest mip level that is still at least the target size."""
+        level = 0
+        while True:
+            current = self._mips[level]
+            half = (current.width // 2, current.height // 2)
+            if half[0] < max(1, target_width) or half[1] < max(1, target_height):
+                return current
+            if level + 1 == len(self._mips):
+                self._mips.append(current.resize(half, Image.BOX))
+            level += 1
+
+    def scaled(self, scale: float) -> tuple[Image.Image, tuple[int, int], tuple[int, int]]:
+        """
+        The sprite resampled to a scale, from the nearest cached mip level.
+
+        Args:
+            scale: Scale factor relative to the rasterized size
+
+        Returns:
+            (tile, offset, size) at that scale
+        """
+        if scale == 1.0:
+            return self.image, self.offset, self.size
+
+        target = (max(1, round(self.image.width * scale)), max(1, round(self.image.height * scale)))
+        tile = self._scaled.get(target)
+        if tile is None:
+            if target[0] > self.image.width or target[1] > self.image.height:
+                tile = self.image.resize(target, Image.BICUBIC)
+            else:
+                tile = self._mip(*target).resize(target, Image.LANCZOS)
+            self._scaled[target] = tile
+            if len(self._scaled) > _MAX_SCALED_TILES:
+                self._scaled.popitem(last=False)
+        else:
+            self._scaled.move_to_end(target)
+
+        offset = (round(self.offset[0] * scale), round(self.offset[1] * scale))
+        size = (int(self.size[0] * scale), int(self.size[1] * scale))
+        return tile, offset, size
+
+    def place(self, position: tuple[int, int], scale: float = 1.0,
+              centered: bool = False) -> tuple[Image.Image, tuple[int, int]]:
+        """
+        The tile to paste for a draw position, and where its top-left goes.
+
+        Args:
+            position: (x, y) draw position, as passed to the drawing helper
+            scale: Scale factor relative to the rasterized size
+            centered: If True, center the sprite at position
+
+        Returns:
+            (tile, (x, y)) in frame coordinates (may be partly off-frame)
+        """
+        tile, (offset_x, offset_y), (width, height) = self.scaled(scale)
+        x, y = position
+        if centered:
+            x -= width // 2
+            y -= height // 2
+        return tile, (int(x) + offset_x, int(y) + offset_y)
+
+    def blit(self, frame: Image.Image, position: tuple[int, int], scale: float = 1.0,
+             opacity: float = 1.0, centered: bool = False) -> Image.Image:
+        """
+        Paste the sprite onto a frame.
+
+        Args:
+            frame: RGB or RGBA frame to draw on
+            position: (x, y) draw position, as passed to the drawing helper
+            scale: Scale factor relative to the rasterized size
+            opacity: Opacity (0.0-1.0)
+            centered: If True, center the sprite at position
+
+        Returns:
+            Modified frame
+        """
+        if opacity <= 0:
+            return frame
+
+        tile, corner = self.place(position, scale, centered)
+        if opacity < 1:
+            tile = with_opacity(tile, opacity)
+
+        return paste_tile(frame, tile, corner)
+
+
+def _rasterize(draw: Callable[[Image.Image, tuple[int, int]], None],
+               bbox: tuple[int, int, int, int], margin: int,
+               size: tuple[int, int]) -> Sprite:
+    """
+    Run a drawing helper and capture what it draws as an RGBA sprite.
+
+    The helper draws onto a black and a white RGB canvas; the difference
+    between the two gives each pixel's coverage and the black one its color.
+    That reproduces exactly what the helper draws onto an RGB frame (opaque
+    shadows, embedded-color glyphs), which drawing onto RGBA would not.
+    """
+    origin = (margin - min(0, bbox[0]), margin - min(0, bbox[1]))
+    canvas_size = (origin[0] + bbox[2] + margin, origin[1] + bbox[3] + margin)
+    on_black = Image.new('RGB', canvas_size, (0, 0, 0))
+    on_white = Image.new('RGB', canvas_size, (255, 255, 255))
+    draw(on_black, origin)
+    draw(on_white, origin)
+
+    black = np.asarray(on_black, dtype=np.int32)
+    white = np.asarray(on_white, dtype=np.int32)
+    alpha = 255 - (white - black).max(axis=2)
+    coverage = np.maximum(alpha, 1)[..., None]
+    color = np.minimum((black * 255 + coverage // 2) // coverage, 255)
+    tile = Image.fromarray(np.dstack([color, alpha]).astype(np.uint8))
+
+    box = tile.getbbox()
+    if box is None:
+        return Sprite(Image.new('RGBA', (1, 1), (0, 0, 0, 0)), (0, 0), size)
+    return Sprite(tile.crop(box), (box[0] - origin[0], box[1] - origin[1]), size)
+
+
+def _effect_extent(options: dict) -> int:
+    """How far an effect reaches beyond the glyphs, in pixels."""
+    # A glow is grown by its radius, then blurred with sigma = radius / 2
+    glow_radius = options.get('glow_radius', 0)
+    extent = max(options.get('outline_width', 0), glow_radius + (3 * glow_radius) // 2 + 1)
+    offset_x, offset_y = options.get('shadow_offset', (0, 0))
+    return max(extent, abs(offset_x), abs(offset_y))
+
+
+@lru_cache(maxsize=None)
+def _effect_defaults(effect: str) -> dict:
+    """Default effect settings of a text effect's draw_text_with_* function."""
+    if _TEXT_EFFECTS[effect] is None:
+        return {}
+    parameters = inspect.signature(_TEXT_EFFECTS[effect]).parameters
+    return {name: parameter.default for name, parameter in parameters.items()
+            if parameter.default is not inspect.Parameter.empty
+            and name not in ('font_size', 'text_color', 'bold')}
+
+
+def _hashable(value):
+    """Turn sequence options (e.g. shadow_offset=[2, 2]) into tuples for cache keys."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+class SpriteCache:
+    """LRU cache of text and emoji sprites."""
+
+    def __init__(self, max_sprites: int = 128):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_sprites: Number of sprites to keep
+        """
+        self.max_sprites = max_sprites
+        self._sprites: OrderedDict[tuple, Sprite] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key: tuple, build: Callable[[], Sprite]) -> Sprite:
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = self._sprites[key] = build()
+        if len(self._sprites) > self.max_sprites:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    def emoji(self, emoji: str, size: int = 60, shadow: bool = True,
+              shadow_offset: tuple[int, int] = (2, 2)) -> Sprite:
+        """
+        Sprite of an emoji as draw_emoji_enhanced() draws it.
+
+        Blit it at the same top-left position you would pass to
+        draw_emoji_enhanced(), or centered at the emoji's center.
+
+        Args:
+            emoji: Emoji character(s)
+            size: Emoji size in pixels (minimum 12)
+            shadow: Whether to add drop shadow
+            shadow_offset: Shadow offset
+
+        Returns:
+            Cached sprite
+        """
+        size = max(12, size)
+        key = ('emoji', emoji, size, shadow, tuple(shadow_offset))
+
+        def build() -> Sprite:
+            margin = 4 + (_effect_extent({'shadow_offset': shadow_offset}) + 2 if shadow else 0)
+            return _rasterize(
+                lambda canvas, origin: draw_emoji_enhanced(canvas, emoji, origin, size=size,
+                                                           shadow=shadow, shadow_offset=shadow_offset),
+                load_emoji_font(size).getbbox(emoji), margin, (size, size))
+
+        return self._lookup(key, build)
+
+    def text(self, text: str, font_size: int = 40,
+             text_color: tuple[int, int, int] = (255, 255, 255), effect: str = 'plain',
+             bold: bool = True, **options) -> Sprite:
+        """
+        Sprite of text drawn with one of the typography effects.
+
+        Args:
+            text: Text to draw
+            font_size: Font size in pixels
+            text_color: RGB color for text fill
+            effect: 'plain', 'outline', 'shadow' or 'glow'
+            bold: Use bold font variant
+            **options: Effect settings passed to the matching
+                draw_text_with_* function (e.g. outline_width=4)
+
+        Returns:
+            Cached sprite
+        """
+        if effect not in _TEXT_EFFECTS:
+            raise ValueError(f"Unknown text effect: {effect} (use one of {', '.join(_TEXT_EFFECTS)})")
+
+        # Resolve the effect's own defaults so the margin covers e.g. the default
+        # glow radius and equivalent calls share one cache entry
+        options = {name: _hashable(value)
+                   for name, value in {**_effect_defaults(effect), **options}.items()}
+        key = ('text', text, font_size, tuple(text_color), effect, bold, tuple(sorted(options.items())))
+
+        def build() -> Sprite:
+            font = get_font(font_size, bold=bold)
+            bbox = ImageDraw.Draw(Image.new('RGB', (1, 1))).textbbox((0, 0), text, font=font)
+            size = (bbox[2] - bbox[0], bbox[3] - bbox[1])
+
+            def draw(canvas: Image.Image, origin: tuple[int, int]):
+                if _TEXT_EFFECTS[effect] is None:
+                    ImageDraw.Draw(canvas).text(origin, text, fill=text_color, font=font)
+                else:
+                    _TEXT_EFFECTS[effect](canvas, text, origin, font_size=font_size,
+                                          text_color=text_color, bold=bold, **options)
+
+            return _rasterize(draw, bbox, 4 + _effect_extent(options), size)
+
+        return self._lookup(key, build)
+
+    def clear(self):
+        """Drop all sprites and reset the counters."""
+        self._sprites.clear()
+        self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Cache statistics.
+
+        Returns:
+            Dictionary with hits, misses (rasterizations), hit_rate and the
+            number of cached sprites
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'sprites': len(self._sprites),
+        }
+
+
+_cache = SpriteCache()
+
+
+def get_sprite_cache() -> SpriteCache:
+    """The process-wide sprite cache shared by all templates."""
+    return _cache
@@ -6,8 +6,10 @@ This module provides high-quality text rendering that looks crisp and profession
 in GIFs, with outlines for readability and effects for visual impact.
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+import numpy as np
 from typing import Optional
+from core.fonts import load_text_font
 
 
 # Typography scale - proportional sizing system
@@ -26,6 +28,9 @@ def get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
     """
     Get a font with fallback support.
 
+    Fonts come from the process-wide registry in core.fonts, so the font
+    file is opened once per (size, variant) rather than on every draw.
+
     Args:
         size: Font size in pixels
         bold: Use bold variant if available
@@ -33,53 +38,67 @@ def get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
     Returns:
         ImageFont object
     """
-    # Try multiple font paths for cross-platform support
-    font_paths = [
-        # macOS fonts
-        "/System/Library/Fonts/Helvetica.ttc",
-        "/System/Library/Fonts/SF-Pro.ttf",
-        "/Library/Fonts/Arial Bold.ttf" if bold else "/Library/Fonts/Arial.ttf",
-        # Linux fonts
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf" if bold else "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-        # Windows fonts
-        "C:\\Windows\\Fonts\\arialbd.ttf" if bold else "C:\\Windows\\Fonts\\arial.ttf",
-    ]
+    return load_text_font(size, bold=bold)
+
 
-    for font_path in font_paths:
-        try:
-            return ImageFont.truetype(font_path, size)
-        except:
-            continue
+def _max_filter_1d(values: np.ndarray, radius: int, axis: int) -> np.ndarray:
+    """
+    Maximum over a (2 * radius + 1) window along one axis.
 
-    # Ultimate fallback
-    return ImageFont.load_default()
+    Window maxima are built by doubling (max of two half windows), so the cost
+    grows with log(radius) instead of radius.
+    """
+    values = np.moveaxis(values, axis, 0)
+    length = values.shape[0]
+    window = 2 * radius + 1
+    padded = np.zeros((length + 2 * window, *values.shape[1:]), dtype=values.dtype)
+    padded[radius:radius + length] = values
 
+    # span_max[i] = max(padded[i:i + span])
+    span_max, span = padded, 1
+    while span * 2 <= window:
+        doubled = span_max.copy()
+        np.maximum(doubled[:-span], span_max[span:], out=doubled[:-span])
+        span_max, span = doubled, span * 2
 
-def draw_text_with_outline(
+    result = np.maximum(span_max[:length], span_max[window - span:window - span + length])
+    return np.moveaxis(result, 0, axis)
+
+
+def _dilate(mask: Image.Image, radius: int) -> Image.Image:
+    """Grow an 'L' mask by radius pixels in every direction (square kernel)."""
+    if radius <= 0:
+        return mask
+    values = np.asarray(mask)
+    values = _max_filter_1d(_max_filter_1d(values, radius, axis=1), radius, axis=0)
+    return Image.fromarray(values)
+
+
+def _draw_text_effect(
     frame: Image.Image,
     text: str,
     position: tuple[int, int],
-    font_size: int = 40,
-    text_color: tuple[int, int, int] = (255, 255, 255),
-    outline_color: tuple[int, int, int] = (0, 0, 0),
-    outline_width: int = 3,
-    centered: bool = False,
-    bold: bool = True
+    font_size: int,
+    text_color: tuple[int, int, int],
+    layers: list[tuple[tuple[int, int, int], tuple[int, int], int, float]],
+    centered: bool,
+    bold: bool
 ) -> Image.Image:
     """
-    Draw text with outline for maximum readability.
+    Draw text over effect layers built from a single glyph mask.
 
-    This is THE most important function for professional-looking text in GIFs.
-    The outline ensures text is readable on any background.
+    The text is rasterized once into an alpha mask around its bounding box.
+    Each layer shifts that mask, grows it with a max filter, softens it with
+    a Gaussian blur and composites it in a flat color; the text is drawn on
+    top. The cost is a fixed number of passes whatever the effect size.
 
     Args:
         frame: PIL Image to draw on
         text: Text to draw
         position: (x, y) position
         font_size: Font size in pixels
-        text_color: RGB color for text fill
-        outline_color: RGB color for outline
-        outline_width: Width of outline in pixels (2-4 recommended)
+        text_color: RGB color for text
+        layers: (color, offset, spread, blur) per layer, drawn in order
         centered: If True, center text at position
         bold: Use bold font variant
 
@@ -98,12 +117,24 @@ def draw_text_with_outline(
         y = position[1] - text_height // 2
         position = (x, y)
 
-    # Draw outline by drawing text multiple times offset in all directions
     x, y = position
-    for offset_x in range(-outline_width, outline_width + 1):
-        for offset_y in range(-outline_width, outline_width + 1):
-            if offset_x != 0 or offset_y != 0:
-                draw.text((x + offset_x, y + offset_y), text, fill=outline_color, font=font)
+    bbox = draw.textbbox(position, text, font=font)
+    reach = max((spread + int(3 * blur) + 1 for _, _, spread, blur in layers), default=0)
+    left, top = bbox[0] - reach, bbox[1] - reach
+    mask_size = (bbox[2] - bbox[0] + 2 * reach, bbox[3] - bbox[1] + 2 * reach)
+
+    if mask_size[0] > 0 and mask_size[1] > 0:
+        mask = Image.new('L', mask_size, 0)
+        ImageDraw.Draw(mask).text((x - left, y - top), text, fill=255, font=font)
+
+        for color, (offset_x, offset_y), spread, blur in layers:
+            layer = _dilate(mask, spread)
+            if blur > 0:
+                layer = layer.filter(ImageFilter.GaussianBlur(blur))
+            if frame.mode == 'RGBA':
+                color = (*color[:3], 255)
+            box_left, box_top = left + offset_x, top + offset_y
+            frame.paste(color, (box_left, box_top, box_left + mask_size[0], box_top + mask_size[1]), layer)
 
     # Draw main text on top
     draw.text(position, text, fill=text_color, font=font)
@@ -111,6 +142,44 @@ def draw_text_with_outline(
     return frame
 
 
+def draw_text_with_outline(
+    frame: Image.Image,
+    text: str,
+    position: tuple[int, int],
+    font_size: int = 40,
+    text_color: tuple[int, int, int] = (255, 255, 255),
+    outline_color: tuple[int, int, int] = (0, 0, 0),
+    outline_width: int = 3,
+    centered: bool = False,
+    bold: bool = True
+) -> Image.Image:
+    """
+    Draw text with outline for maximum readability.
+
+    This is THE most important function for professional-looking text in GIFs.
+    The outline ensures text is readable on any background.
+
+    Args:
+        frame: PIL Image to draw on
+        text: Text to draw
+        position: (x, y) position
+        font_size: Font size in pixels
+        text_color: RGB color for text fill
+        outline_color: RGB color for outline
+        outline_width: Width of outline in pixels (2-4 recommended)
+        centered: If True, center text at position
+        bold: Use bold font variant
+
+    Returns:
+        Modified frame
+    """
+    # The outline is the glyph mask grown by outline_width (the union of
+    # every offset copy of the text within the outline square)
+    return _draw_text_effect(frame, text, position, font_size, text_color,
+                             [(outline_color, (0, 0), outline_width, 0)],
+                             centered, bold)
+
+
 def draw_text_with_shadow(
     frame: Image.Image,
     text: str,
@@ -139,26 +208,9 @@ def draw_text_with_shadow(
     Returns:
         Modified frame
     """
-    draw = ImageDraw.Draw(frame)
-    font = get_font(font_size, bold=bold)
-
-    # Calculate position for centering
-    if centered:
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        x = position[0] - text_width // 2
-        y = position[1] - text_height // 2
-        position = (x, y)
-
-    # Draw shadow
-    shadow_pos = (position[0] + shadow_offset[0], position[1] + shadow_offset[1])
-    draw.text(shadow_pos, text, fill=shadow_color, font=font)
-
-    # Draw main text
-    draw.text(position, text, fill=text_color, font=font)
-
-    return frame
+    return _draw_text_effect(frame, text, position, font_size, text_color,
+                             [(shadow_color, shadow_offset, 0, 0)],
+                             centered, bold)
 
 
 def draw_text_with_glow(
@@ -189,30 +241,11 @@ def draw_text_with_glow(
     Returns:
         Modified frame
     """
-    draw = ImageDraw.Draw(frame)
-    font = get_font(font_size, bold=bold)
-
-    # Calculate position for centering
-    if centered:
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        x = position[0] - text_width // 2
-        y = position[1] - text_height // 2
-        position = (x, y)
-
-    # Draw glow layers with decreasing opacity (simulated with same color at different offsets)
-    x, y = position
-    for radius in range(glow_radius, 0, -1):
-        for offset_x in range(-radius, radius + 1):
-            for offset_y in range(-radius, radius + 1):
-                if offset_x != 0 or offset_y != 0:
-                    draw.text((x + offset_x, y + offset_y), text, fill=glow_color, font=font)
-
-    # Draw main text
-    draw.text(position, text, fill=text_color, font=font)
-
-    return frame
+    # Grow the glyph mask by the radius, then blur it so the glow is solid
+    # next to the text and fades out beyond the radius
+    return _draw_text_effect(frame, text, position, font_size, text_color,
+                             [(glow_color, (0, 0), glow_radius, glow_radius / 2)],
+                             centered, bold)
 
 
 def draw_text_in_box(
@@ -6,13 +6,35 @@ This module provides high-impact visual effects that make animations feel
 professional and dynamic while keeping file sizes reasonable.
 """
 
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFilter
 import numpy as np
 import math
-import random
 from typing import Optional
 
 
+def _draw_particle(draw: ImageDraw.ImageDraw, x: int, y: int, size: int,
+                   color, shape: str):
+    """Draw one particle shape centered at (x, y)."""
+    if shape == 'circle':
+        bbox = [x - size, y - size, x + size, y + size]
+        draw.ellipse(bbox, fill=color)
+    elif shape == 'square':
+        bbox = [x - size, y - size, x + size, y + size]
+        draw.rectangle(bbox, fill=color)
+    elif shape == 'star':
+        # Simple 4-point star
+        points = [
+            (x, y - size),
+            (x - size // 2, y),
+            (x, y),
+            (x, y + size),
+            (x, y),
+            (x + size // 2, y),
+        ]
+        draw.line(points, fill=color, width=2)
+
+
 class Particle:
     """A single particle in a particle system."""
 
@@ -83,32 +105,95 @@ class Particle:
         # Draw based on shape
         x, y = int(self.x), int(self.y)
         size = max(1, int(self.size * alpha))
+        _draw_particle(draw, x, y, size, color, self.shape)
 
-        if self.shape == 'circle':
-            bbox = [x - size, y - size, x + size, y + size]
-            draw.ellipse(bbox, fill=color)
-        elif self.shape == 'square':
-            bbox = [x - size, y - size, x + size, y + size]
-            draw.rectangle(bbox, fill=color)
-        elif self.shape == 'star':
-            # Simple 4-point star
-            points = [
-                (x, y - size),
-                (x - size // 2, y),
-                (x, y),
-                (x, y + size),
-                (x, y),
-                (x + size // 2, y),
-            ]
-            draw.line(points, fill=color, width=2)
+
+# Particle shapes by shape code, as stored in ParticleSystem.shape
+PARTICLE_SHAPES = ('circle', 'square', 'star')
+
+
+@lru_cache(maxsize=256)
+def _particle_stencil(shape: int, size: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pixel offsets covered by a particle, rasterized once with PIL.
+
+    Args:
+        shape: Index into PARTICLE_SHAPES
+        size: Particle size in pixels
+
+    Returns:
+        (dy, dx) int arrays of offsets from the particle position
+    """
+    pad = 2 * size + 2
+    mask = Image.new('L', (2 * pad + 1, 2 * pad + 1), 0)
+    _draw_particle(ImageDraw.Draw(mask), pad, pad, size, 255, PARTICLE_SHAPES[shape])
+    dy, dx = np.nonzero(np.asarray(mask))
+    return dy - pad, dx - pad
 
 
 class ParticleSystem:
-    """Manages a collection of particles."""
+    """
+    Manages a collection of particles.
 
-    def __init__(self):
-        """Initialize particle system."""
-        self.particles: list[Particle] = []
+    Particles are stored as parallel NumPy arrays (struct of arrays), so
+    physics, culling and rendering are vectorized over all particles.
+    """
+
+    def __init__(self, seed: int | np.random.Generator | None = None):
+        """
+        Initialize particle system.
+
+        Args:
+            seed: Seed or Generator for emission randomness (None = unseeded).
+                A fixed seed makes the same emit calls produce the same particles.
+        """
+        self.rng = np.random.default_rng(seed)
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.vx = np.zeros(0)
+        self.vy = np.zeros(0)
+        self.lifetime = np.zeros(0)
+        self.max_lifetime = np.zeros(0)
+        self.size = np.zeros(0)
+        self.gravity = np.zeros(0)  # Pixels per frame squared
+        self.drag = np.zeros(0)     # Velocity multiplier per frame
+        self.color = np.zeros((0, 3), dtype=np.uint8)
+        self.shape = np.zeros(0, dtype=np.uint8)  # Index into PARTICLE_SHAPES
+
+    def add(self, x, y, vx, vy, lifetime, color, size=3, shape: str | np.ndarray = 'circle',
+            gravity=0.5, drag=0.98):
+        """
+        Add particles from arrays (scalars are broadcast to all new particles).
+
+        Args:
+            x, y: Starting positions
+            vx, vy: Velocities
+            lifetime: Lifetimes in frames
+            color: RGB color, or (N, 3) array of colors
+            size: Particle sizes in pixels
+            shape: Shape name, or array of PARTICLE_SHAPES indices
+            gravity: Downward acceleration per frame
+            drag: Velocity multiplier per frame
+        """
+        count = np.broadcast(x, y, vx, vy, lifetime, size).size
+        if isinstance(shape, str):
+            shape = PARTICLE_SHAPES.index(shape)
+
+        def column(values, dtype=np.float64):
+            return np.broadcast_to(np.asarray(values, dtype=dtype), (count,))
+
+        self.x = np.concatenate([self.x, column(x)])
+        self.y = np.concatenate([self.y, column(y)])
+        self.vx = np.concatenate([self.vx, column(vx)])
+        self.vy = np.concatenate([self.vy, column(vy)])
+        self.lifetime = np.concatenate([self.lifetime, column(lifetime)])
+        self.max_lifetime = np.concatenate([self.max_lifetime, column(lifetime)])
+        self.size = np.concatenate([self.size, column(size)])
+        self.gravity = np.concatenate([self.gravity, column(gravity)])
+        self.drag = np.concatenate([self.drag, column(drag)])
+        colors = np.broadcast_to(np.asarray(color, dtype=np.uint8), (count, 3))
+        self.color = np.concatenate([self.color, colors])
+        self.shape = np.concatenate([self.shape, column(shape, np.uint8)])
 
     def emit(self, x: int, y: int, count: int = 10,
              spread: float = 2.0, speed: float = 5.0,
@@ -127,18 +212,12 @@ class ParticleSystem:
             size: Particle size
             shape: Particle shape
         """
-        for _ in range(count):
-            # Random angle and speed
-            angle = random.uniform(0, 2 * math.pi)
-            vel_mag = random.uniform(speed * 0.5, speed * 1.5)
-            vx = math.cos(angle) * vel_mag
-            vy = math.sin(angle) * vel_mag
-
-            # Random lifetime variation
-            life = random.uniform(lifetime * 0.7, lifetime * 1.3)
-
-            particle = Particle(x, y, vx, vy, life, color, size, shape)
-            self.particles.append(particle)
+        # Random angle and speed, with random lifetime variation
+        angle = self.rng.uniform(0, 2 * math.pi, count)
+        vel_mag = self.rng.uniform(speed * 0.5, speed * 1.5, count)
+        life = self.rng.uniform(lifetime * 0.7, lifetime * 1.3, count)
+        self.add(x, y, np.cos(angle) * vel_mag, np.sin(angle) * vel_mag, life,
+                 color, size, shape)
 
     def emit_confetti(self, x: int, y: int, count: int = 20,
                       colors: Optional[list[tuple[int, int, int]]] = None):
@@ -156,17 +235,15 @@ class ParticleSystem:
                 (107, 185, 240), (162, 155, 254), (255, 182, 193)
             ]
 
-        for _ in range(count):
-            color = random.choice(colors)
-            vx = random.uniform(-3, 3)
-            vy = random.uniform(-8, -2)
-            shape = random.choice(['square', 'circle'])
-            size = random.randint(2, 4)
-            lifetime = random.uniform(40, 60)
-
-            particle = Particle(x, y, vx, vy, lifetime, color, size, shape)
-            particle.gravity = 0.3  # Lighter gravity for confetti
-            self.particles.append(particle)
+        color = np.asarray(colors, dtype=np.uint8)[self.rng.integers(len(colors), size=count)]
+        vx = self.rng.uniform(-3, 3, count)
+        vy = self.rng.uniform(-8, -2, count)
+        shape = self.rng.choice([PARTICLE_SHAPES.index('square'),
+                                 PARTICLE_SHAPES.index('circle')], size=count)
+        size = self.rng.integers(2, 5, size=count)
+        lifetime = self.rng.uniform(40, 60, count)
+        # Lighter gravity for confetti
+        self.add(x, y, vx, vy, lifetime, color, size, shape, gravity=0.3)
 
     def emit_sparkles(self, x: int, y: int, count: int = 15):
         """
@@ -176,38 +253,95 @@ class ParticleSystem:
             x, y: Emission position
             count: Number of sparkles
         """
-        colors = [(255, 255, 200), (255, 255, 255), (255, 255, 150)]
-
-        for _ in range(count):
-            color = random.choice(colors)
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 3)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            lifetime = random.uniform(15, 30)
+        colors = np.array([(255, 255, 200), (255, 255, 255), (255, 255, 150)], dtype=np.uint8)
 
-            particle = Particle(x, y, vx, vy, lifetime, color, 2, 'star')
-            particle.gravity = 0
-            particle.drag = 0.95
-            self.particles.append(particle)
+        color = colors[self.rng.integers(len(colors), size=count)]
+        angle = self.rng.uniform(0, 2 * math.pi, count)
+        speed = self.rng.uniform(1, 3, count)
+        lifetime = self.rng.uniform(15, 30, count)
+        self.add(x, y, np.cos(angle) * speed, np.sin(angle) * speed, lifetime,
+                 color, 2, 'star', gravity=0, drag=0.95)
 
     def update(self):
         """Update all particles."""
-        # Update alive particles
-        for particle in self.particles:
-            particle.update()
+        # Apply physics
+        self.vy += self.gravity
+        self.vx *= self.drag
+        self.vy *= self.drag
+        self.x += self.vx
+        self.y += self.vy
+        self.lifetime -= 1
 
         # Remove dead particles
-        self.particles = [p for p in self.particles if p.is_alive()]
+        alive = self.lifetime > 0
+        if not alive.all():
+            for name in ('x', 'y', 'vx', 'vy', 'lifetime', 'max_lifetime', 'size',
+                         'gravity', 'drag', 'color', 'shape'):
+                setattr(self, name, getattr(self, name)[alive])
 
-    def render(self, frame: Image.Image):
-        """Render all particles to frame."""
-        for particle in self.particles:
-            particle.render(frame)
+    def render(self, frame: Image.Image | np.ndarray):
+        """
+        Render all particles to frame.
+
+        Each particle shape/size is rasterized once and splatted into the
+        frame's pixels for runs of particles at a time, in emission order.
+
+        Args:
+            frame: PIL Image or writable (H, W, 3) or (H, W, 4) uint8 array,
+                drawn on in place. On RGBA frames particle pixels become
+                opaque and all other pixels keep their alpha.
+        """
+        if len(self.x) == 0:
+            return
+
+        is_image = isinstance(frame, Image.Image)
+        if is_image:
+            pixels = np.array(frame if frame.mode == 'RGBA' else frame.convert('RGB'))
+        else:
+            pixels = frame
+        height, width = pixels.shape[:2]
+
+        # Fade color and shrink with remaining lifetime
+        alpha = np.clip(self.lifetime / self.max_lifetime, 0, 1)
+        colors = (self.color * alpha[:, None]).astype(np.uint8)
+        if pixels.shape[2] == 4:
+            colors = np.concatenate([colors, np.full((len(colors), 1), 255, dtype=np.uint8)], axis=1)
+        sizes = np.maximum(1, (self.size * alpha).astype(np.int64))
+        xs = self.x.astype(np.int64)
+        ys = self.y.astype(np.int64)
+
+        # One scatter per run of consecutive particles sharing a (shape, size)
+        # stencil, so later particles still land on top of earlier ones
+        keys = self.shape.astype(np.int64) * 65536 + sizes
+        starts = np.concatenate([[0], np.flatnonzero(keys[1:] != keys[:-1]) + 1, [len(keys)]])
+        for start, stop in zip(starts[:-1], starts[1:]):
+            key = keys[start]
+            dy, dx = _particle_stencil(int(key // 65536), int(key % 65536))
+            py = (ys[start:stop, None] + dy).ravel()
+            px = (xs[start:stop, None] + dx).ravel()
+            inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+            pixels[py[inside], px[inside]] = np.repeat(colors[start:stop], len(dy), axis=0)[inside]
+
+        if is_image:
+            frame.paste(Image.fromarray(pixels))
 
     def get_particle_count(self) -> int:
         """Get number of active particles."""
-        return len(self.particles)
+        return len(self.x)
+
+    @property
+    def particles(self) -> list[Particle]:
+        """Snapshot of the active particles as Particle objects."""
+        particles = []
+        for i in range(len(self.x)):
+            particle = Particle(self.x[i], self.y[i], self.vx[i], self.vy[i],
+                                self.max_lifetime[i], tuple(int(c) for c in self.color[i]),
+                                self.size[i], PARTICLE_SHAPES[self.shape[i]])
+            particle.lifetime = self.lifetime[i]
+            particle.gravity = self.gravity[i]
+            particle.drag = self.drag[i]
+            particles.append(particle)
+        return particles
 
 
 def add_motion_blur(frame: Image.Image, prev_frame: Optional[Image.Image],
@@ -409,7 +543,8 @@ def add_drop_shadow(frame: Image.Image, object_bounds: tuple[int, int, int, int]
 
 def create_speed_lines(frame: Image.Image, position: tuple[int, int],
                        direction: float, length: int = 50,
-                       count: int = 5, color: tuple[int, int, int] = (200, 200, 200)) -> Image.Image:
+                       count: int = 5, color: tuple[int, int, int] = (200, 200, 200),
+                       seed: int | np.random.Generator | None = None) -> Image.Image:
     """
     Create speed lines for motion effect.
 
@@ -420,10 +555,12 @@ def create_speed_lines(frame: Image.Image, position: tuple[int, int],
         length: Line length
         count: Number of lines
         color: Line color
+        seed: Seed or Generator for line placement (None = unseeded)
 
     Returns:
         Modified frame
     """
+    rng = np.random.default_rng(seed)
     draw = ImageDraw.Draw(frame)
     x, y = position
 
@@ -432,19 +569,17 @@ def create_speed_lines(frame: Image.Image, position: tuple[int, int],
 
     for i in range(count):
         # Offset from center
-        offset_angle = trail_angle + random.uniform(-0.3, 0.3)
-        offset_dist = random.uniform(10, 30)
+        offset_angle = trail_angle + rng.uniform(-0.3, 0.3)
+        offset_dist = rng.uniform(10, 30)
         start_x = x + math.cos(offset_angle) * offset_dist
         start_y = y + math.sin(offset_angle) * offset_dist
 
         # End point
-        line_length = random.uniform(length * 0.7, length * 1.3)
+        line_length = rng.uniform(length * 0.7, length * 1.3)
         end_x = start_x + math.cos(trail_angle) * line_length
         end_y = start_y + math.sin(trail_angle) * line_length
 
-        # Draw line with varying opacity
-        alpha = random.randint(100, 200)
-        width = random.randint(1, 3)
+        width = int(rng.integers(1, 4))
 
         # Simple line (full opacity simulation)
         draw.line([(start_x, start_y), (end_x, end_y)], fill=color, width=width)
@@ -452,26 +587,28 @@ def create_speed_lines(frame: Image.Image, position: tuple[int, int],
     return frame
 
 
-def create_screen_shake_offset(intensity: int, frame_index: int) -> tuple[int, int]:
+def create_screen_shake_offset(intensity: int, frame_index: int, seed: int = 0) -> tuple[int, int]:
     """
     Calculate screen shake offset for a frame.
 
     Args:
         intensity: Shake intensity in pixels
         frame_index: Current frame number
+        seed: Shake pattern seed (same seed and frame = same offset)
 
     Returns:
         (x, y) offset tuple
     """
-    # Use frame index for deterministic but random-looking shake
-    random.seed(frame_index)
-    offset_x = random.randint(-intensity, intensity)
-    offset_y = random.randint(-intensity, intensity)
-    random.seed()  # Reset seed
-    return (offset_x, offset_y)
+    # A private generator keyed on (seed, frame) gives a deterministic but
+    # random-looking shake without touching the global random state. Seeding
+    # needs non-negative entropy, so any int seed is first wrapped to 64 bits
+    rng = np.random.default_rng([seed % 2**64, frame_index % 2**64])
+    offset_x, offset_y = rng.integers(-intensity, intensity + 1, size=2)
+    return (int(offset_x), int(offset_y))
 
 
-def apply_screen_shake(frame: Image.Image, intensity: int, frame_index: int) -> Image.Image:
+def apply_screen_shake(frame: Image.Image, intensity: int, frame_index: int,
+                       seed: int = 0) -> Image.Image:
     """
     Apply screen shake effect to entire frame.
 
@@ -479,11 +616,12 @@ def apply_screen_shake(frame: Image.Image, intensity: int, frame_index: int) ->
         frame: PIL Image
         intensity: Shake intensity
         frame_index: Current frame number
+        seed: Shake pattern seed
 
     Returns:
         Shaken frame
     """
-    offset_x, offset_y = create_screen_shake_offset(intensity, frame_index)
+    offset_x, offset_y = create_screen_shake_offset(intensity, frame_index, seed)
 
     # Create new frame with background
     shaken = Image.new('RGB', frame.size, (0, 0, 0))
@@ -6,14 +6,17 @@ Use this to make objects bounce up and down or horizontally with realistic physi
 """
 
 import sys
+from concurrent.futures import Executor
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from core.gif_builder import GIFBuilder
+from PIL import Image
+from core.gif_builder import GIFBuilder, HeldFrame
 from core.frame_composer import create_blank_frame, draw_circle, draw_emoji
-from core.easing import ease_out_bounce, interpolate
+from core.easing import ease_out_bounce, interpolate, timeline
+from core.render import render_frames
 
 
 def create_bounce_animation(
@@ -25,7 +28,10 @@ def create_bounce_animation(
     start_x: int = 240,
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    hold_frames: int = 0,
+    workers: int | None = None,
+    executor: Executor | None = None
 ) -> list:
     """
     Create frames for a bouncing animation.
@@ -40,12 +46,14 @@ def create_bounce_animation(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        hold_frames: Extra frame intervals to show the last frame for, returned
+            as a HeldFrame instead of copies of the frame
+        workers: Render frames on this many processes (None = serial)
+        executor: Existing process pool to render frames on
 
     Returns:
         List of frames
     """
-    frames = []
-
     # Default object data
     if object_data is None:
         if object_type == 'circle':
@@ -53,35 +61,53 @@ def create_bounce_animation(
         elif object_type == 'emoji':
             object_data = {'emoji': '⚽', 'size': 60}
 
-    for i in range(num_frames):
-        # Create blank frame
-        frame = create_blank_frame(frame_width, frame_height, bg_color)
+    # Height above the ground for every frame, using bounce easing
+    heights = timeline(num_frames, ease_out_bounce, 0, bounce_height)
 
-        # Calculate progress (0.0 to 1.0)
-        t = i / (num_frames - 1) if num_frames > 1 else 0
+    ctx = {
+        'object_type': object_type,
+        'object_data': object_data,
+        'heights': heights,
+        'ground_y': ground_y,
+        'start_x': start_x,
+        'frame_size': (frame_width, frame_height),
+        'bg_color': bg_color,
+    }
+    frames = render_frames(_render_bounce_frame, num_frames, ctx, workers=workers, executor=executor)
 
-        # Calculate Y position using bounce easing
-        y = ground_y - int(ease_out_bounce(t) * bounce_height)
+    if hold_frames > 0 and frames:
+        frames[-1] = HeldFrame(frames[-1], hold_frames + 1)
 
-        # Draw object
-        if object_type == 'circle':
-            draw_circle(
-                frame,
-                center=(start_x, y),
-                radius=object_data['radius'],
-                fill_color=object_data['color']
-            )
-        elif object_type == 'emoji':
-            draw_emoji(
-                frame,
-                emoji=object_data['emoji'],
-                position=(start_x - object_data['size'] // 2, y - object_data['size'] // 2),
-                size=object_data['size']
-            )
+    return frames
 
-        frames.append(frame)
 
-    return frames
+def _render_bounce_frame(i: int, t: float, ctx: dict) -> Image.Image:
+    """Render one bounce frame from precomputed heights (see core.render)."""
+    object_type, object_data = ctx['object_type'], ctx['object_data']
+    start_x = ctx['start_x']
+
+    # Create blank frame
+    frame = create_blank_frame(*ctx['frame_size'], ctx['bg_color'])
+
+    y = ctx['ground_y'] - int(ctx['heights'][i])
+
+    # Draw object
+    if object_type == 'circle':
+        draw_circle(
+            frame,
+            center=(start_x, y),
+            radius=object_data['radius'],
+            fill_color=object_data['color']
+        )
+    elif object_type == 'emoji':
+        draw_emoji(
+            frame,
+            emoji=object_data['emoji'],
+            position=(start_x - object_data['size'] // 2, y - object_data['size'] // 2),
+            size=object_data['size']
+        )
+
+    return frame
 
 
 # Example usage
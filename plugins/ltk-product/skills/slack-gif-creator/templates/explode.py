@@ -6,9 +6,9 @@ Creates explosion, shatter, and particle burst effects.
 """
 
 import sys
+from concurrent.futures import Executor
 from pathlib import Path
 import math
-import random
 
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -17,7 +17,8 @@ import numpy as np
 from core.gif_builder import GIFBuilder
 from core.frame_composer import create_blank_frame, draw_emoji_enhanced
 from core.visual_effects import ParticleSystem
-from core.easing import interpolate
+from core.keyframes import Track, compile_tracks
+from core.render import render_frames
 
 
 def create_explode_animation(
@@ -30,7 +31,10 @@ def create_explode_animation(
     center_pos: tuple[int, int] = (240, 240),
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    seed: int | np.random.Generator | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None
 ) -> list[Image.Image]:
     """
     Create explosion animation.
@@ -46,11 +50,14 @@ def create_explode_animation(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        seed: Seed or Generator for the pieces (same seed = same explosion)
+        workers: Render frames on this many processes (None = serial)
+        executor: Existing process pool to render frames on
 
     Returns:
         List of frames
     """
-    frames = []
+    rng = np.random.default_rng(seed)
 
     # Default object data
     if object_data is None:
@@ -60,17 +67,13 @@ def create_explode_animation(
     # Generate pieces/particles
     pieces = []
     for _ in range(num_pieces):
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(explosion_speed * 0.5, explosion_speed * 1.5)
+        angle = rng.uniform(0, 2 * math.pi)
+        speed = rng.uniform(explosion_speed * 0.5, explosion_speed * 1.5)
         vx = math.cos(angle) * speed
         vy = math.sin(angle) * speed
-        size = random.randint(3, 12)
-        color = (
-            random.randint(100, 255),
-            random.randint(100, 255),
-            random.randint(100, 255)
-        )
-        rotation_speed = random.uniform(-20, 20)
+        size = int(rng.integers(3, 13))
+        color = tuple(int(c) for c in rng.integers(100, 256, size=3))
+        rotation_speed = rng.uniform(-20, 20)
 
         pieces.append({
             'vx': vx,
@@ -81,160 +84,195 @@ def create_explode_animation(
             'rotation_speed': rotation_speed
         })
 
-    for i in range(num_frames):
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-        frame = create_blank_frame(frame_width, frame_height, bg_color)
-        draw = ImageDraw.Draw(frame)
-
-        if explode_type == 'burst':
-            # Show object at start, then explode
-            if t < 0.2:
-                # Object still intact
-                scale = interpolate(1.0, 1.2, t / 0.2, 'ease_out')
-                if object_type == 'emoji':
-                    size = int(object_data['size'] * scale)
-                    draw_emoji_enhanced(
-                        frame,
-                        emoji=object_data['emoji'],
-                        position=(center_pos[0] - size // 2, center_pos[1] - size // 2),
-                        size=size,
-                        shadow=False
-                    )
-            else:
-                # Exploded - draw pieces
-                explosion_t = (t - 0.2) / 0.8
-                for piece in pieces:
-                    # Update position
-                    x = center_pos[0] + piece['vx'] * explosion_t * 50
-                    y = center_pos[1] + piece['vy'] * explosion_t * 50 + 0.5 * 300 * explosion_t ** 2  # Gravity
-
-                    # Fade out
-                    alpha = 1.0 - explosion_t
-                    if alpha > 0:
-                        color = tuple(int(c * alpha) for c in piece['color'])
-                        size = int(piece['size'] * (1 - explosion_t * 0.5))
-
-                        draw.ellipse(
-                            [x - size, y - size, x + size, y + size],
-                            fill=color
-                        )
-
-        elif explode_type == 'shatter':
-            # Break into geometric pieces
-            if t < 0.15:
-                # Object intact
-                if object_type == 'emoji':
-                    draw_emoji_enhanced(
-                        frame,
-                        emoji=object_data['emoji'],
-                        position=(center_pos[0] - object_data['size'] // 2,
-                                center_pos[1] - object_data['size'] // 2),
-                        size=object_data['size'],
-                        shadow=False
-                    )
-            else:
-                # Shattered
-                shatter_t = (t - 0.15) / 0.85
-
-                # Draw triangular shards
-                for piece in pieces[:min(10, len(pieces))]:
-                    x = center_pos[0] + piece['vx'] * shatter_t * 30
-                    y = center_pos[1] + piece['vy'] * shatter_t * 30 + 0.5 * 200 * shatter_t ** 2
-
-                    # Update rotation
-                    rotation = piece['rotation_speed'] * shatter_t * 100
-
-                    # Draw triangle shard
-                    shard_size = piece['size'] * 2
-                    points = []
-                    for j in range(3):
-                        angle = (rotation + j * 120) * math.pi / 180
-                        px = x + shard_size * math.cos(angle)
-                        py = y + shard_size * math.sin(angle)
-                        points.append((px, py))
-
-                    alpha = 1.0 - shatter_t
-                    if alpha > 0:
-                        color = tuple(int(c * alpha) for c in piece['color'])
-                        draw.polygon(points, fill=color)
-
-        elif explode_type == 'dissolve':
-            # Dissolve into particles
-            dissolve_scale = interpolate(1.0, 0.0, t, 'ease_in')
-
-            if dissolve_scale > 0.1:
-                # Draw fading object
-                if object_type == 'emoji':
-                    size = int(object_data['size'] * dissolve_scale)
-                    size = max(12, size)
-
-                    emoji_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-                    draw_emoji_enhanced(
-                        emoji_canvas,
-                        emoji=object_data['emoji'],
-                        position=(center_pos[0] - size // 2, center_pos[1] - size // 2),
-                        size=size,
-                        shadow=False
-                    )
-
-                    # Apply opacity
-                    from templates.fade import apply_opacity
-                    emoji_canvas = apply_opacity(emoji_canvas, dissolve_scale)
-
-                    frame_rgba = frame.convert('RGBA')
-                    frame = Image.alpha_composite(frame_rgba, emoji_canvas)
-                    frame = frame.convert('RGB')
-                    draw = ImageDraw.Draw(frame)
-
-            # Draw outward-moving particles
+    # Per-frame object scale, progress through the explosion phase, and which
+    # phase is showing: stepped 0/1 tracks switch between the intact object
+    # and its pieces
+    if explode_type == 'burst':
+        # Object swells for the first 20%, then bursts
+        tracks = compile_tracks(num_frames,
+                                scale=Track(1.0).to(0.2, 1.2, 'ease_out'),
+                                phase_t=Track(0.0).hold(0.2).to(1.0, 1.0),
+                                intact=Track(1.0).hold(0.2).to(0.2, 0.0),
+                                shattered=Track(0.0).hold(0.2).to(0.2, 1.0))
+    elif explode_type == 'shatter':
+        tracks = compile_tracks(num_frames,
+                                phase_t=Track(0.0).hold(0.15).to(1.0, 1.0),
+                                intact=Track(1.0).hold(0.15).to(0.15, 0.0),
+                                shattered=Track(0.0).hold(0.15).to(0.15, 1.0))
+    elif explode_type == 'dissolve':
+        tracks = compile_tracks(num_frames, scale=Track(1.0).to(1.0, 0.0, 'ease_in'))
+    else:
+        # Pieces converge for 70%, then the object reforms
+        tracks = compile_tracks(num_frames,
+                                phase_t=Track(1.0).to(0.7, 0.0),
+                                scale=Track(0.5).hold(0.7).to(1.0, 1.0, 'elastic_out'),
+                                shattered=Track(1.0).hold(0.7).to(0.7, 0.0),
+                                intact=Track(0.0).hold(0.7).to(0.7, 1.0))
+
+    ctx = {
+        'object_type': object_type,
+        'object_data': object_data,
+        'explode_type': explode_type,
+        'pieces': pieces,
+        'tracks': tracks,
+        'center_pos': center_pos,
+        'frame_size': (frame_width, frame_height),
+        'bg_color': bg_color,
+    }
+    return render_frames(_render_explode_frame, num_frames, ctx, workers=workers, executor=executor)
+
+
+def _render_explode_frame(i: int, t: float, ctx: dict) -> Image.Image:
+    """Render one explosion frame from the precomputed pieces and tracks (see core.render)."""
+    object_type, object_data = ctx['object_type'], ctx['object_data']
+    explode_type, pieces, tracks = ctx['explode_type'], ctx['pieces'], ctx['tracks']
+    center_pos = ctx['center_pos']
+    frame_width, frame_height = ctx['frame_size']
+    frame = create_blank_frame(frame_width, frame_height, ctx['bg_color'])
+    draw = ImageDraw.Draw(frame)
+
+    if explode_type == 'burst':
+        # Show object at start, then explode
+        if tracks['intact'][i]:
+            scale = tracks['scale'][i]
+            if object_type == 'emoji':
+                size = int(object_data['size'] * scale)
+                draw_emoji_enhanced(
+                    frame,
+                    emoji=object_data['emoji'],
+                    position=(center_pos[0] - size // 2, center_pos[1] - size // 2),
+                    size=size,
+                    shadow=False
+                )
+        if tracks['shattered'][i]:
+            # Exploded - draw pieces
+            explosion_t = tracks['phase_t'][i]
             for piece in pieces:
-                x = center_pos[0] + piece['vx'] * t * 40
-                y = center_pos[1] + piece['vy'] * t * 40
+                # Update position
+                x = center_pos[0] + piece['vx'] * explosion_t * 50
+                y = center_pos[1] + piece['vy'] * explosion_t * 50 + 0.5 * 300 * explosion_t ** 2  # Gravity
 
-                alpha = 1.0 - t
+                # Fade out
+                alpha = 1.0 - explosion_t
                 if alpha > 0:
                     color = tuple(int(c * alpha) for c in piece['color'])
-                    size = int(piece['size'] * (1 - t * 0.5))
-                    draw.ellipse(
-                        [x - size, y - size, x + size, y + size],
-                        fill=color
-                    )
-
-        elif explode_type == 'implode':
-            # Reverse explosion - pieces fly inward
-            if t < 0.7:
-                # Pieces converging
-                implode_t = 1.0 - (t / 0.7)
-                for piece in pieces:
-                    x = center_pos[0] + piece['vx'] * implode_t * 50
-                    y = center_pos[1] + piece['vy'] * implode_t * 50
-
-                    alpha = 1.0 - (1.0 - implode_t) * 0.5
-                    color = tuple(int(c * alpha) for c in piece['color'])
-                    size = int(piece['size'] * alpha)
+                    size = int(piece['size'] * (1 - explosion_t * 0.5))
 
                     draw.ellipse(
                         [x - size, y - size, x + size, y + size],
                         fill=color
                     )
-            else:
-                # Object reforms
-                reform_t = (t - 0.7) / 0.3
-                scale = interpolate(0.5, 1.0, reform_t, 'elastic_out')
-
-                if object_type == 'emoji':
-                    size = int(object_data['size'] * scale)
-                    draw_emoji_enhanced(
-                        frame,
-                        emoji=object_data['emoji'],
-                        position=(center_pos[0] - size // 2, center_pos[1] - size // 2),
-                        size=size,
-                        shadow=False
-                    )
 
-        frames.append(frame)
-
-    return frames
+    elif explode_type == 'shatter':
+        # Break into geometric pieces
+        if tracks['intact'][i]:
+            if object_type == 'emoji':
+                draw_emoji_enhanced(
+                    frame,
+                    emoji=object_data['emoji'],
+                    position=(center_pos[0] - object_data['size'] // 2,
+                            center_pos[1] - object_data['size'] // 2),
+                    size=object_data['size'],
+                    shadow=False
+                )
+        if tracks['shattered'][i]:
+            shatter_t = tracks['phase_t'][i]
+
+            # Draw triangular shards
+            for piece in pieces[:min(10, len(pieces))]:
+                x = center_pos[0] + piece['vx'] * shatter_t * 30
+                y = center_pos[1] + piece['vy'] * shatter_t * 30 + 0.5 * 200 * shatter_t ** 2
+
+                # Update rotation
+                rotation = piece['rotation_speed'] * shatter_t * 100
+
+                # Draw triangle shard
+                shard_size = piece['size'] * 2
+                points = []
+                for j in range(3):
+                    angle = (rotation + j * 120) * math.pi / 180
+                    px = x + shard_size * math.cos(angle)
+                    py = y + shard_size * math.sin(angle)
+                    points.append((px, py))
+
+                alpha = 1.0 - shatter_t
+                if alpha > 0:
+                    color = tuple(int(c * alpha) for c in piece['color'])
+                    draw.polygon(points, fill=color)
+
+    elif explode_type == 'dissolve':
+        # Dissolve into particles
+        dissolve_scale = tracks['scale'][i]
+
+        if dissolve_scale > 0.1:
+            # Draw fading object
+            if object_type == 'emoji':
+                size = int(object_data['size'] * dissolve_scale)
+                size = max(12, size)
+
+                emoji_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
+                draw_emoji_enhanced(
+                    emoji_canvas,
+                    emoji=object_data['emoji'],
+                    position=(center_pos[0] - size // 2, center_pos[1] - size // 2),
+                    size=size,
+                    shadow=False
+                )
+
+                # Apply opacity
+                from templates.fade import apply_opacity
+                emoji_canvas = apply_opacity(emoji_canvas, dissolve_scale)
+
+                frame_rgba = frame.convert('RGBA')
+                frame = Image.alpha_composite(frame_rgba, emoji_canvas)
+                frame = frame.convert('RGB')
+                draw = ImageDraw.Draw(frame)
+
+        # Draw outward-moving particles
+        for piece in pieces:
+            x = center_pos[0] + piece['vx'] * t * 40
+            y = center_pos[1] + piece['vy'] * t * 40
+
+            alpha = 1.0 - t
+            if alpha > 0:
+                color = tuple(int(c * alpha) for c in piece['color'])
+                size = int(piece['size'] * (1 - t * 0.5))
+                draw.ellipse(
+                    [x - size, y - size, x + size, y + size],
+                    fill=color
+                )
+
+    elif explode_type == 'implode':
+        # Reverse explosion - pieces fly inward
+        if tracks['shattered'][i]:
+            implode_t = tracks['phase_t'][i]
+            for piece in pieces:
+                x = center_pos[0] + piece['vx'] * implode_t * 50
+                y = center_pos[1] + piece['vy'] * implode_t * 50
+
+                alpha = 1.0 - (1.0 - implode_t) * 0.5
+                color = tuple(int(c * alpha) for c in piece['color'])
+                size = int(piece['size'] * alpha)
+
+                draw.ellipse(
+                    [x - size, y - size, x + size, y + size],
+                    fill=color
+                )
+        if tracks['intact'][i]:
+            # Object reforms
+            scale = tracks['scale'][i]
+
+            if object_type == 'emoji':
+                size = int(object_data['size'] * scale)
+                draw_emoji_enhanced(
+                    frame,
+                    emoji=object_data['emoji'],
+                    position=(center_pos[0] - size // 2, center_pos[1] - size // 2),
+                    size=size,
+                    shadow=False
+                )
+
+    return frame
 
 
 def create_particle_burst(
@@ -244,7 +282,8 @@ def create_particle_burst(
     colors: list[tuple[int, int, int]] | None = None,
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    seed: int | np.random.Generator | None = None
 ) -> list[Image.Image]:
     """
     Create simple particle burst effect.
@@ -257,11 +296,13 @@ def create_particle_burst(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        seed: Seed or Generator for the particles (same seed = same burst)
 
     Returns:
         List of frames
     """
-    particles = ParticleSystem()
+    rng = np.random.default_rng(seed)
+    particles = ParticleSystem(seed=rng)
 
     # Emit particles
     if colors is None:
@@ -270,14 +311,14 @@ def create_particle_burst(
         colors = [palette['primary'], palette['secondary'], palette['accent']]
 
     for _ in range(particle_count):
-        color = random.choice(colors)
+        color = colors[rng.integers(len(colors))]
         particles.emit(
             center_pos[0], center_pos[1],
             count=1,
-            speed=random.uniform(3, 8),
+            speed=rng.uniform(3, 8),
             color=color,
-            lifetime=random.uniform(20, 30),
-            size=random.randint(3, 8),
+            lifetime=rng.uniform(20, 30),
+            size=int(rng.integers(3, 9)),
             shape='star'
         )
 
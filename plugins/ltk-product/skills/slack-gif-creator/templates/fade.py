@@ -6,15 +6,19 @@ Creates smooth opacity transitions for appearing, disappearing, and transitionin
 """
 
 import sys
+from concurrent.futures import Executor
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
 from PIL import Image, ImageDraw
-import numpy as np
-from core.gif_builder import GIFBuilder
-from core.frame_composer import create_blank_frame, draw_emoji_enhanced
-from core.easing import interpolate
+from core.gif_builder import GIFBuilder, HeldFrame
+from core.frame_composer import create_blank_frame
+from core.easing import timeline
+from core.keyframes import Track
+from core.layers import Layer, LayerCompositor
+from core.render import render_frames
+from core.sprites import get_sprite_cache, with_opacity
 
 
 def create_fade_animation(
@@ -26,7 +30,10 @@ def create_fade_animation(
     center_pos: tuple[int, int] = (240, 240),
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    hold_frames: int = 0,
+    workers: int | None = None,
+    executor: Executor | None = None
 ) -> list[Image.Image]:
     """
     Create fade animation.
@@ -41,135 +48,95 @@ def create_fade_animation(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        hold_frames: Extra frame intervals to show the last frame for, returned
+            as a HeldFrame instead of copies of the frame
+        workers: Render frames on this many processes (None = serial)
+        executor: Existing process pool to render frames on
 
     Returns:
         List of frames
     """
-    frames = []
-
     # Default object data
     if object_data is None:
         if object_type == 'emoji':
             object_data = {'emoji': '✨', 'size': 100}
 
-    for i in range(num_frames):
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-
-        # Calculate opacity based on fade type
-        if fade_type == 'in':
-            opacity = interpolate(0, 1, t, easing)
-        elif fade_type == 'out':
-            opacity = interpolate(1, 0, t, easing)
-        elif fade_type == 'in_out':
-            if t < 0.5:
-                opacity = interpolate(0, 1, t * 2, easing)
-            else:
-                opacity = interpolate(1, 0, (t - 0.5) * 2, easing)
-        elif fade_type == 'blink':
-            # Quick fade out and back in
-            if t < 0.2:
-                opacity = interpolate(1, 0, t / 0.2, 'ease_in')
-            elif t < 0.4:
-                opacity = interpolate(0, 1, (t - 0.2) / 0.2, 'ease_out')
-            else:
-                opacity = 1.0
-        else:
-            opacity = interpolate(0, 1, t, easing)
-
-        # Create background
-        frame_bg = create_blank_frame(frame_width, frame_height, bg_color)
-
-        # Create object layer with transparency
-        if object_type == 'emoji':
-            # Create RGBA canvas for emoji
-            emoji_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-            emoji_size = object_data['size']
-            draw_emoji_enhanced(
-                emoji_canvas,
-                emoji=object_data['emoji'],
-                position=(center_pos[0] - emoji_size // 2, center_pos[1] - emoji_size // 2),
-                size=emoji_size,
-                shadow=object_data.get('shadow', False)
-            )
-
-            # Apply opacity
-            emoji_canvas = apply_opacity(emoji_canvas, opacity)
-
-            # Composite onto background
-            frame_bg_rgba = frame_bg.convert('RGBA')
-            frame = Image.alpha_composite(frame_bg_rgba, emoji_canvas)
-            frame = frame.convert('RGB')
-
-        elif object_type == 'text':
-            from core.typography import draw_text_with_outline
-
-            # Create text on separate layer
-            text_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-            text_canvas_rgb = text_canvas.convert('RGB')
-            text_canvas_rgb.paste(bg_color, (0, 0, frame_width, frame_height))
-
-            draw_text_with_outline(
-                text_canvas_rgb,
-                text=object_data.get('text', 'FADE'),
-                position=center_pos,
-                font_size=object_data.get('font_size', 60),
-                text_color=object_data.get('text_color', (0, 0, 0)),
-                outline_color=object_data.get('outline_color', (255, 255, 255)),
-                outline_width=3,
-                centered=True
-            )
-
-            # Convert to RGBA and make background transparent
-            text_canvas = text_canvas_rgb.convert('RGBA')
-            data = text_canvas.getdata()
-            new_data = []
-            for item in data:
-                if item[:3] == bg_color:
-                    new_data.append((255, 255, 255, 0))
-                else:
-                    new_data.append(item)
-            text_canvas.putdata(new_data)
-
-            # Apply opacity
-            text_canvas = apply_opacity(text_canvas, opacity)
-
-            # Composite
-            frame_bg_rgba = frame_bg.convert('RGBA')
-            frame = Image.alpha_composite(frame_bg_rgba, text_canvas)
-            frame = frame.convert('RGB')
-
-        else:
-            frame = frame_bg
-
-        frames.append(frame)
+    # Calculate the opacity of every frame based on fade type
+    if fade_type == 'in':
+        opacities = timeline(num_frames, easing, 0, 1)
+    elif fade_type == 'out':
+        opacities = timeline(num_frames, easing, 1, 0)
+    elif fade_type == 'in_out':
+        opacities = Track(0.0).to(0.5, 1.0, easing).to(1.0, 0.0, easing).compile(num_frames)
+    elif fade_type == 'blink':
+        # Quick fade out and back in, then stay visible
+        opacities = Track(1.0).to(0.2, 0.0, 'ease_in').to(0.4, 1.0, 'ease_out').compile(num_frames)
+    else:
+        opacities = timeline(num_frames, easing, 0, 1)
+
+    # Rasterize the object once; each frame blends its tile onto the background
+    compositor = LayerCompositor(frame_width, frame_height, bg_color)
+    sprite, position, centered = None, center_pos, False
+    if object_type == 'emoji':
+        emoji_size = object_data['size']
+        sprite = get_sprite_cache().emoji(object_data['emoji'], size=emoji_size,
+                                          shadow=object_data.get('shadow', False))
+        position = (center_pos[0] - emoji_size // 2, center_pos[1] - emoji_size // 2)
+    elif object_type == 'text':
+        sprite = get_sprite_cache().text(
+            object_data.get('text', 'FADE'),
+            font_size=object_data.get('font_size', 60),
+            text_color=object_data.get('text_color', (0, 0, 0)),
+            effect='outline',
+            outline_color=object_data.get('outline_color', (255, 255, 255)),
+            outline_width=3
+        )
+        centered = True
+
+    ctx = {
+        'compositor': compositor,
+        'sprite': sprite,
+        'position': position,
+        'centered': centered,
+        'opacities': opacities,
+    }
+    frames = render_frames(_render_fade_frame, num_frames, ctx, workers=workers, executor=executor,
+                           reused=True)
+
+    if hold_frames > 0 and frames:
+        frames[-1] = HeldFrame(frames[-1], hold_frames + 1)
 
     return frames
 
 
+def _render_fade_frame(i: int, t: float, ctx: dict) -> Image.Image:
+    """Composite the object at one frame's opacity (see core.render)."""
+    layers = []
+    if ctx['sprite'] is not None:
+        layers.append(Layer.from_sprite(ctx['sprite'], ctx['position'],
+                                        opacity=float(ctx['opacities'][i]),
+                                        centered=ctx['centered']))
+    return ctx['compositor'].compose(layers, reuse=True)
+
+
 def apply_opacity(image: Image.Image, opacity: float) -> Image.Image:
     """
     Apply opacity to an RGBA image.
 
+    Alpha is scaled through a cached lookup table per opacity level; opacity
+    1.0 leaves the alpha untouched and 0.0 just clears it.
+
     Args:
         image: RGBA image
         opacity: Opacity value (0.0 to 1.0)
 
     Returns:
-        Image with adjusted opacity
+        New image with adjusted opacity (the input is never modified or returned)
     """
     if image.mode != 'RGBA':
         image = image.convert('RGBA')
-
-    # Get alpha channel
-    r, g, b, a = image.split()
-
-    # Multiply alpha by opacity
-    a_array = np.array(a, dtype=np.float32)
-    a_array = a_array * opacity
-    a = Image.fromarray(a_array.astype(np.uint8))
-
-    # Merge back
-    return Image.merge('RGBA', (r, g, b, a))
+    faded = with_opacity(image, opacity)
+    return faded.copy() if faded is image else faded
 
 
 def create_crossfade(
@@ -181,7 +148,9 @@ def create_crossfade(
     center_pos: tuple[int, int] = (240, 240),
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    workers: int | None = None,
+    executor: Executor | None = None
 ) -> list[Image.Image]:
     """
     Crossfade between two objects.
@@ -196,56 +165,41 @@ def create_crossfade(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        workers: Render frames on this many processes (None = serial)
+        executor: Existing process pool to render frames on
 
     Returns:
         List of frames
     """
-    frames = []
-
-    for i in range(num_frames):
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-
-        # Calculate opacities
-        opacity1 = interpolate(1, 0, t, easing)
-        opacity2 = interpolate(0, 1, t, easing)
-
-        # Create background
-        frame = create_blank_frame(frame_width, frame_height, bg_color)
-
-        if object_type == 'emoji':
-            # Create first emoji
-            emoji1_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-            size1 = object1_data['size']
-            draw_emoji_enhanced(
-                emoji1_canvas,
-                emoji=object1_data['emoji'],
-                position=(center_pos[0] - size1 // 2, center_pos[1] - size1 // 2),
-                size=size1,
-                shadow=False
-            )
-            emoji1_canvas = apply_opacity(emoji1_canvas, opacity1)
-
-            # Create second emoji
-            emoji2_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-            size2 = object2_data['size']
-            draw_emoji_enhanced(
-                emoji2_canvas,
-                emoji=object2_data['emoji'],
-                position=(center_pos[0] - size2 // 2, center_pos[1] - size2 // 2),
-                size=size2,
-                shadow=False
-            )
-            emoji2_canvas = apply_opacity(emoji2_canvas, opacity2)
-
-            # Composite both
-            frame_rgba = frame.convert('RGBA')
-            frame_rgba = Image.alpha_composite(frame_rgba, emoji1_canvas)
-            frame_rgba = Image.alpha_composite(frame_rgba, emoji2_canvas)
-            frame = frame_rgba.convert('RGB')
-
-        frames.append(frame)
-
-    return frames
+    # Calculate opacities
+    opacities1 = timeline(num_frames, easing, 1, 0)
+    opacities2 = timeline(num_frames, easing, 0, 1)
+
+    compositor = LayerCompositor(frame_width, frame_height, bg_color)
+    sprites = []
+    if object_type == 'emoji':
+        for data in (object1_data, object2_data):
+            size = data['size']
+            sprites.append((get_sprite_cache().emoji(data['emoji'], size=size, shadow=False),
+                            (center_pos[0] - size // 2, center_pos[1] - size // 2)))
+
+    ctx = {
+        'compositor': compositor,
+        'sprites': sprites,
+        'opacities1': opacities1,
+        'opacities2': opacities2,
+    }
+    return render_frames(_render_crossfade_frame, num_frames, ctx, workers=workers,
+                         executor=executor, reused=True)
+
+
+def _render_crossfade_frame(i: int, t: float, ctx: dict) -> Image.Image:
+    """Composite both objects at one frame's opacities (see core.render)."""
+    opacity1 = float(ctx['opacities1'][i])
+    opacity2 = float(ctx['opacities2'][i])
+    layers = [Layer.from_sprite(sprite, position, opacity=opacity)
+              for (sprite, position), opacity in zip(ctx['sprites'], (opacity1, opacity2))]
+    return ctx['compositor'].compose(layers, reuse=True)
 
 
 def create_fade_to_color(
@@ -272,15 +226,12 @@ def create_fade_to_color(
     """
     frames = []
 
-    for i in range(num_frames):
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-
-        # Interpolate each color channel
-        r = int(interpolate(start_color[0], end_color[0], t, easing))
-        g = int(interpolate(start_color[1], end_color[1], t, easing))
-        b = int(interpolate(start_color[2], end_color[2], t, easing))
+    # Interpolate each color channel
+    channels = [timeline(num_frames, easing, start, end)
+                for start, end in zip(start_color, end_color)]
 
-        color = (r, g, b)
+    for i in range(num_frames):
+        color = tuple(int(channel[i]) for channel in channels)
         frame = create_blank_frame(frame_width, frame_height, color)
         frames.append(frame)
 
@@ -6,6 +6,7 @@ Creates horizontal and vertical flips with perspective.
 """
 
 import sys
+from concurrent.futures import Executor
 from pathlib import Path
 import math
 
@@ -14,7 +15,8 @@ sys.path.append(str(Path(__file__).parent.parent))
 from PIL import Image
 from core.gif_builder import GIFBuilder
 from core.frame_composer import create_blank_frame, draw_emoji_enhanced
-from core.easing import interpolate
+from core.easing import timeline
+from core.render import render_frames
 
 
 def create_flip_animation(
@@ -27,7 +29,9 @@ def create_flip_animation(
     center_pos: tuple[int, int] = (240, 240),
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    workers: int | None = None,
+    executor: Executor | None = None
 ) -> list[Image.Image]:
     """
     Create 3D-style flip animation.
@@ -43,153 +47,175 @@ def create_flip_animation(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        workers: Render frames on this many processes (None = serial)
+        executor: Existing process pool to render frames on
 
     Returns:
         List of frames
     """
-    frames = []
-
     if object2_data is None:
         object2_data = object1_data
 
-    for i in range(num_frames):
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-        frame = create_blank_frame(frame_width, frame_height, bg_color)
-
-        # Calculate rotation angle (0 to 180 degrees)
-        angle = interpolate(0, 180, t, easing)
-
-        # Determine which side is visible and calculate scale
-        if angle < 90:
-            # Front side visible
-            current_object = object1_data
-            scale_factor = math.cos(math.radians(angle))
+    # Rotation angle for every frame (0 to 180 degrees)
+    angles = timeline(num_frames, easing, 0, 180)
+
+    ctx = {
+        'object_type': object_type,
+        'object1_data': object1_data,
+        'object2_data': object2_data,
+        'angles': angles,
+        'flip_axis': flip_axis,
+        'center_pos': center_pos,
+        'frame_width': frame_width,
+        'frame_height': frame_height,
+        'bg_color': bg_color,
+    }
+    return render_frames(_render_flip_frame, num_frames, ctx, workers=workers, executor=executor)
+
+
+def _render_flip_frame(i: int, t: float, ctx: dict) -> Image.Image:
+    """Render one flip frame from precomputed values (see core.render)."""
+    object_type = ctx['object_type']
+    object1_data = ctx['object1_data']
+    object2_data = ctx['object2_data']
+    angles = ctx['angles']
+    flip_axis = ctx['flip_axis']
+    center_pos = ctx['center_pos']
+    frame_width = ctx['frame_width']
+    frame_height = ctx['frame_height']
+    bg_color = ctx['bg_color']
+
+    frame = create_blank_frame(frame_width, frame_height, bg_color)
+    angle = float(angles[i])
+
+    # Determine which side is visible and calculate scale
+    if angle < 90:
+        # Front side visible
+        current_object = object1_data
+        scale_factor = math.cos(math.radians(angle))
+    else:
+        # Back side visible
+        current_object = object2_data
+        scale_factor = abs(math.cos(math.radians(angle)))
+
+    # Don't draw when edge-on (very thin)
+    if scale_factor < 0.05:
+        return frame
+
+    if object_type == 'emoji':
+        size = current_object['size']
+
+        # Create emoji on canvas
+        canvas_size = size * 2
+        emoji_canvas = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
+
+        draw_emoji_enhanced(
+            emoji_canvas,
+            emoji=current_object['emoji'],
+            position=(canvas_size // 2 - size // 2, canvas_size // 2 - size // 2),
+            size=size,
+            shadow=False
+        )
+
+        # Apply flip scaling
+        if flip_axis == 'horizontal':
+            # Scale horizontally for horizontal flip
+            new_width = max(1, int(canvas_size * scale_factor))
+            new_height = canvas_size
         else:
-            # Back side visible
-            current_object = object2_data
-            scale_factor = abs(math.cos(math.radians(angle)))
-
-        # Don't draw when edge-on (very thin)
-        if scale_factor < 0.05:
-            frames.append(frame)
-            continue
-
-        if object_type == 'emoji':
-            size = current_object['size']
-
-            # Create emoji on canvas
-            canvas_size = size * 2
-            emoji_canvas = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
-
-            draw_emoji_enhanced(
-                emoji_canvas,
-                emoji=current_object['emoji'],
-                position=(canvas_size // 2 - size // 2, canvas_size // 2 - size // 2),
-                size=size,
-                shadow=False
-            )
-
-            # Apply flip scaling
-            if flip_axis == 'horizontal':
-                # Scale horizontally for horizontal flip
-                new_width = max(1, int(canvas_size * scale_factor))
-                new_height = canvas_size
-            else:
-                # Scale vertically for vertical flip
-                new_width = canvas_size
-                new_height = max(1, int(canvas_size * scale_factor))
-
-            # Resize to simulate 3D rotation
-            emoji_scaled = emoji_canvas.resize((new_width, new_height), Image.LANCZOS)
-
-            # Position centered
-            paste_x = center_pos[0] - new_width // 2
-            paste_y = center_pos[1] - new_height // 2
-
-            # Composite onto frame
-            frame_rgba = frame.convert('RGBA')
-            frame_rgba.paste(emoji_scaled, (paste_x, paste_y), emoji_scaled)
-            frame = frame_rgba.convert('RGB')
-
-        elif object_type == 'text':
-            from core.typography import draw_text_with_outline
-
-            # Create text on canvas
-            text = current_object.get('text', 'FLIP')
-            font_size = current_object.get('font_size', 50)
-
-            canvas_size = max(frame_width, frame_height)
-            text_canvas = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
-
-            # Draw on RGB for text rendering
-            text_canvas_rgb = text_canvas.convert('RGB')
-            text_canvas_rgb.paste(bg_color, (0, 0, canvas_size, canvas_size))
-
-            draw_text_with_outline(
-                text_canvas_rgb,
-                text=text,
-                position=(canvas_size // 2, canvas_size // 2),
-                font_size=font_size,
-                text_color=current_object.get('text_color', (0, 0, 0)),
-                outline_color=current_object.get('outline_color', (255, 255, 255)),
-                outline_width=3,
-                centered=True
-            )
-
-            # Make background transparent
-            text_canvas = text_canvas_rgb.convert('RGBA')
-            data = text_canvas.getdata()
-            new_data = []
-            for item in data:
-                if item[:3] == bg_color:
-                    new_data.append((255, 255, 255, 0))
-                else:
-                    new_data.append(item)
-            text_canvas.putdata(new_data)
-
-            # Apply flip scaling
-            if flip_axis == 'horizontal':
-                new_width = max(1, int(canvas_size * scale_factor))
-                new_height = canvas_size
-            else:
-                new_width = canvas_size
-                new_height = max(1, int(canvas_size * scale_factor))
-
-            text_scaled = text_canvas.resize((new_width, new_height), Image.LANCZOS)
-
-            # Center and crop
-            if flip_axis == 'horizontal':
-                left = (new_width - frame_width) // 2 if new_width > frame_width else 0
-                top = (canvas_size - frame_height) // 2
-                paste_x = center_pos[0] - min(new_width, frame_width) // 2
-                paste_y = 0
-
-                text_cropped = text_scaled.crop((
-                    left,
-                    top,
-                    left + min(new_width, frame_width),
-                    top + frame_height
-                ))
+            # Scale vertically for vertical flip
+            new_width = canvas_size
+            new_height = max(1, int(canvas_size * scale_factor))
+
+        # Resize to simulate 3D rotation
+        emoji_scaled = emoji_canvas.resize((new_width, new_height), Image.LANCZOS)
+
+        # Position centered
+        paste_x = center_pos[0] - new_width // 2
+        paste_y = center_pos[1] - new_height // 2
+
+        # Composite onto frame
+        frame_rgba = frame.convert('RGBA')
+        frame_rgba.paste(emoji_scaled, (paste_x, paste_y), emoji_scaled)
+        frame = frame_rgba.convert('RGB')
+
+    elif object_type == 'text':
+        from core.typography import draw_text_with_outline
+
+        # Create text on canvas
+        text = current_object.get('text', 'FLIP')
+        font_size = current_object.get('font_size', 50)
+
+        canvas_size = max(frame_width, frame_height)
+        text_canvas = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
+
+        # Draw on RGB for text rendering
+        text_canvas_rgb = text_canvas.convert('RGB')
+        text_canvas_rgb.paste(bg_color, (0, 0, canvas_size, canvas_size))
+
+        draw_text_with_outline(
+            text_canvas_rgb,
+            text=text,
+            position=(canvas_size // 2, canvas_size // 2),
+            font_size=font_size,
+            text_color=current_object.get('text_color', (0, 0, 0)),
+            outline_color=current_object.get('outline_color', (255, 255, 255)),
+            outline_width=3,
+            centered=True
+        )
+
+        # Make background transparent
+        text_canvas = text_canvas_rgb.convert('RGBA')
+        data = text_canvas.getdata()
+        new_data = []
+        for item in data:
+            if item[:3] == bg_color:
+                new_data.append((255, 255, 255, 0))
             else:
-                left = (canvas_size - frame_width) // 2
-                top = (new_height - frame_height) // 2 if new_height > frame_height else 0
-                paste_x = 0
-                paste_y = center_pos[1] - min(new_height, frame_height) // 2
+                new_data.append(item)
+        text_canvas.putdata(new_data)
 
-                text_cropped = text_scaled.crop((
-                    left,
-                    top,
-                    left + frame_width,
-                    top + min(new_height, frame_height)
-                ))
-
-            frame_rgba = frame.convert('RGBA')
-            frame_rgba.paste(text_cropped, (paste_x, paste_y), text_cropped)
-            frame = frame_rgba.convert('RGB')
-
-        frames.append(frame)
-
-    return frames
+        # Apply flip scaling
+        if flip_axis == 'horizontal':
+            new_width = max(1, int(canvas_size * scale_factor))
+            new_height = canvas_size
+        else:
+            new_width = canvas_size
+            new_height = max(1, int(canvas_size * scale_factor))
+
+        text_scaled = text_canvas.resize((new_width, new_height), Image.LANCZOS)
+
+        # Center and crop
+        if flip_axis == 'horizontal':
+            left = (new_width - frame_width) // 2 if new_width > frame_width else 0
+            top = (canvas_size - frame_height) // 2
+            paste_x = center_pos[0] - min(new_width, frame_width) // 2
+            paste_y = 0
+
+            text_cropped = text_scaled.crop((
+                left,
+                top,
+                left + min(new_width, frame_width),
+                top + frame_height
+            ))
+        else:
+            left = (canvas_size - frame_width) // 2
+            top = (new_height - frame_height) // 2 if new_height > frame_height else 0
+            paste_x = 0
+            paste_y = center_pos[1] - min(new_height, frame_height) // 2
+
+            text_cropped = text_scaled.crop((
+                left,
+                top,
+                left + frame_width,
+                top + min(new_height, frame_height)
+            ))
+
+        frame_rgba = frame.convert('RGBA')
+        frame_rgba.paste(text_cropped, (paste_x, paste_y), text_cropped)
+        frame = frame_rgba.convert('RGB')
+
+    return frame
 
 
 def create_quick_flip(
@@ -6,6 +6,8 @@ Apply kaleidoscope effects to frames or objects for psychedelic visuals.
 """
 
 import sys
+from concurrent.futures import Executor
+from functools import lru_cache
 from pathlib import Path
 import math
 
@@ -13,72 +15,153 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from PIL import Image, ImageOps, ImageDraw
 import numpy as np
+from core.render import render_frames
 
 
-def apply_kaleidoscope(frame: Image.Image, segments: int = 8,
-                       center: tuple[int, int] | None = None) -> Image.Image:
+@lru_cache(maxsize=16)
+def _kaleidoscope_geometry(width: int, height: int, segments: int,
+                           center: tuple[int, int]) -> tuple[np.ndarray, ...]:
     """
-    Apply kaleidoscope effect by mirroring/rotating frame sections.
+    Polar geometry of the kaleidoscope transform.
 
     Args:
-        frame: Input frame
-        segments: Number of mirror segments (4, 6, 8, 12 work well)
-        center: Center point for effect (None = frame center)
+        width: Frame width
+        height: Frame height
+        segments: Number of mirror segments
+        center: Center point of the effect
 
     Returns:
-        Frame with kaleidoscope effect
+        Read-only (H, W) arrays: distance from center, source angle and own
+        angle (radians), and whether the source pixel lies inside the frame
     """
-    width, height = frame.size
+    center_x, center_y = center
+    angle_per_segment = 360 / segments
 
-    if center is None:
-        center = (width // 2, height // 2)
+    dy, dx = np.mgrid[0:height, 0:width].astype(np.float64)
+    dx -= center_x
+    dy -= center_y
 
-    # Create output frame
-    output = Image.new('RGB', (width, height))
+    # Angle from center and which segment each pixel falls in
+    own_angle = np.arctan2(dy, dx)
+    angle = (np.degrees(own_angle) + 180) % 360
+    distance = np.sqrt(dx * dx + dy * dy)
+    segment = (angle / angle_per_segment).astype(np.int64)
 
-    # Calculate angle per segment
-    angle_per_segment = 360 / segments
+    # Mirror angle within every other segment
+    segment_angle = angle % angle_per_segment
+    segment_angle = np.where(segment % 2 == 1, angle_per_segment - segment_angle, segment_angle)
+    source_angle = segment_angle + (segment // 2) * angle_per_segment * 2
+    source_angle_rad = np.radians(source_angle - 180)
+
+    # Source position (truncated toward zero, like int()) must land in the frame
+    source_x = np.trunc(center_x + distance * np.cos(source_angle_rad))
+    source_y = np.trunc(center_y + distance * np.sin(source_angle_rad))
+    inside = (source_x >= 0) & (source_x < width) & (source_y >= 0) & (source_y < height)
 
-    # For simplicity, we'll create a radial mirror effect
-    # A full implementation would rotate and mirror properly
-    # This is a simplified version that creates interesting patterns
+    geometry = (distance, source_angle_rad, own_angle, inside)
+    for array in geometry:
+        array.flags.writeable = False
+    return geometry
 
-    # Convert to numpy for easier manipulation
-    frame_array = np.array(frame)
-    output_array = np.zeros_like(frame_array)
 
+@lru_cache(maxsize=16)
+def _kaleidoscope_map(width: int, height: int, segments: int,
+                      center: tuple[int, int]) -> np.ndarray:
+    """
+    Source pixel for every output pixel of the kaleidoscope transform.
+
+    Returns:
+        Read-only flat (H * W,) array of source indices into the flattened frame
+    """
+    distance, source_angle, _, inside = _kaleidoscope_geometry(width, height, segments, center)
     center_x, center_y = center
+    source_x = np.trunc(center_x + distance * np.cos(source_angle)).astype(np.intp)
+    source_y = np.trunc(center_y + distance * np.sin(source_angle)).astype(np.intp)
+
+    # Out-of-bounds sources keep the pixel's own color
+    own = np.arange(width * height).reshape(height, width)
+    index_map = np.where(inside, source_y * width + source_x, own).ravel()
+    index_map.flags.writeable = False
+    return index_map
+
+
+@lru_cache(maxsize=16)
+def _kaleidoscope_polar_grid(width: int, height: int, segments: int,
+                             center: tuple[int, int]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Polar coordinates to sample an unrotated base frame at, per output pixel.
 
-    # Create wedge mask and mirror it
-    for y in range(height):
-        for x in range(width):
-            # Calculate angle from center
-            dx = x - center_x
-            dy = y - center_y
+    Rotating the base frame only adds an offset to these angles, so one grid
+    serves every frame of a rotating animation.
 
-            angle = (math.degrees(math.atan2(dy, dx)) + 180) % 360
-            distance = math.sqrt(dx * dx + dy * dy)
+    Returns:
+        Read-only float32 (H, W) arrays of distance and angle (radians)
+    """
+    distance, source_angle, own_angle, inside = _kaleidoscope_geometry(
+        width, height, segments, center)
+    angle = np.where(inside, source_angle, own_angle).astype(np.float32)
+    distance = distance.astype(np.float32)
+    angle.flags.writeable = False
+    distance.flags.writeable = False
+    return distance, angle
 
-            # Which segment does this pixel belong to?
-            segment = int(angle / angle_per_segment)
 
-            # Mirror angle within segment
-            segment_angle = angle % angle_per_segment
-            if segment % 2 == 1:  # Mirror every other segment
-                segment_angle = angle_per_segment - segment_angle
+def _render_rotated_kaleidoscope(base_array: np.ndarray, segments: int,
+                                 center: tuple[int, int], angle: float) -> np.ndarray:
+    """
+    Kaleidoscope of the base frame rotated counter-clockwise by angle degrees.
+
+    Equivalent to apply_kaleidoscope(base.rotate(angle)) with nearest-neighbour
+    sampling: one vectorized index computation and one gather.
+    """
+    height, width = base_array.shape[:2]
+    distance, polar_angle = _kaleidoscope_polar_grid(width, height, segments, center)
+    center_x, center_y = center
 
-            # Calculate source position
-            source_angle = segment_angle + (segment // 2) * angle_per_segment * 2
-            source_angle_rad = math.radians(source_angle - 180)
+    sample_angle = polar_angle + np.float32(math.radians(angle))
+    source_x = np.rint(center_x + distance * np.cos(sample_angle)).astype(np.intp)
+    source_y = np.rint(center_y + distance * np.sin(sample_angle)).astype(np.intp)
 
-            source_x = int(center_x + distance * math.cos(source_angle_rad))
-            source_y = int(center_y + distance * math.sin(source_angle_rad))
+    # Areas rotated in from outside the base frame are black, as with Image.rotate
+    valid = (source_x >= 0) & (source_x < width) & (source_y >= 0) & (source_y < height)
+    index = np.where(valid, source_y * width + source_x, 0).ravel()
+    pixels = base_array.reshape(width * height, -1)
+    output = np.take(pixels, index, axis=0).reshape(base_array.shape)
+    output[~valid] = 0
+    return output
 
-            # Bounds check
-            if 0 <= source_x < width and 0 <= source_y < height:
-                output_array[y, x] = frame_array[source_y, source_x]
-            else:
-                output_array[y, x] = frame_array[y, x]
+
+def _render_kaleidoscope_frame(i: int, t: float, ctx: dict) -> np.ndarray:
+    """Render one rotation angle of the animation (see core.render)."""
+    return _render_rotated_kaleidoscope(ctx['base_array'], ctx['segments'], ctx['center'],
+                                        ctx['angles'][i])
+
+
+def apply_kaleidoscope(frame: Image.Image, segments: int = 8,
+                       center: tuple[int, int] | None = None) -> Image.Image:
+    """
+    Apply kaleidoscope effect by mirroring/rotating frame sections.
+
+    The source-pixel map is computed once per (size, segments, center) and
+    cached, so each call is a single gather over the frame's pixels.
+
+    Args:
+        frame: Input frame
+        segments: Number of mirror segments (4, 6, 8, 12 work well)
+        center: Center point for effect (None = frame center)
+
+    Returns:
+        Frame with kaleidoscope effect
+    """
+    width, height = frame.size
+
+    if center is None:
+        center = (width // 2, height // 2)
+
+    index_map = _kaleidoscope_map(width, height, segments, tuple(center))
+    frame_array = np.asarray(frame)
+    pixels = frame_array.reshape(width * height, -1)
+    output_array = np.take(pixels, index_map, axis=0).reshape(frame_array.shape)
 
     return Image.fromarray(output_array)
 
@@ -143,7 +226,9 @@ def create_kaleidoscope_animation(
     segments: int = 8,
     rotation_speed: float = 1.0,
     width: int = 480,
-    height: int = 480
+    height: int = 480,
+    workers: int | None = None,
+    executor: Executor | None = None
 ) -> list[Image.Image]:
     """
     Create animated kaleidoscope effect.
@@ -155,12 +240,12 @@ def create_kaleidoscope_animation(
         rotation_speed: How fast pattern rotates (0.5-2.0)
         width: Frame width if generating demo
         height: Frame height if generating demo
+        workers: Render chunks of frames on this many processes (None = serial)
+        executor: Existing process/thread pool to render chunks on
 
     Returns:
         List of frames with kaleidoscope effect
     """
-    frames = []
-
     # Create demo pattern if no base frame
     if base_frame is None:
         base_frame = Image.new('RGB', (width, height), (255, 255, 255))
@@ -177,19 +262,17 @@ def create_kaleidoscope_animation(
             y = height // 2 + int(100 * math.sin(i * 2 * math.pi / 3))
             draw.ellipse([x - 40, y - 40, x + 40, y + 40], fill=color)
 
-    # Rotate base frame and apply kaleidoscope
-    for i in range(num_frames):
-        angle = (i / num_frames) * 360 * rotation_speed
-
-        # Rotate base frame
-        rotated = base_frame.rotate(angle, resample=Image.BICUBIC)
-
-        # Apply kaleidoscope
-        kaleido_frame = apply_kaleidoscope(rotated, segments=segments)
-
-        frames.append(kaleido_frame)
-
-    return frames
+    # Rotation is an angular offset into one shared polar grid, so each frame
+    # is a single gather from the unrotated base frame
+    # Each worker process computes (and caches) the polar grid once
+    ctx = {
+        'base_array': np.asarray(base_frame.convert('RGB')),
+        'segments': segments,
+        'center': (base_frame.width // 2, base_frame.height // 2),
+        'angles': [(i / num_frames) * 360 * rotation_speed for i in range(num_frames)],
+    }
+    return render_frames(_render_kaleidoscope_frame, num_frames, ctx,
+                         workers=workers, executor=executor)
 
 
 # Example usage
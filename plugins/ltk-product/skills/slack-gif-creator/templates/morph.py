@@ -6,6 +6,7 @@ Creates smooth transitions and transformations.
 """
 
 import sys
+from concurrent.futures import Executor
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
@@ -13,8 +14,11 @@ sys.path.append(str(Path(__file__).parent.parent))
 from PIL import Image
 import numpy as np
 from core.gif_builder import GIFBuilder
-from core.frame_composer import create_blank_frame, draw_emoji_enhanced, draw_circle
+from core.frame_composer import create_blank_frame, draw_circle
 from core.easing import interpolate
+from core.layers import Layer, LayerCompositor
+from core.render import render_frames
+from core.sprites import get_sprite_cache
 
 
 def create_morph_animation(
@@ -27,7 +31,9 @@ def create_morph_animation(
     center_pos: tuple[int, int] = (240, 240),
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    workers: int | None = None,
+    executor: Executor | None = None
 ) -> list[Image.Image]:
     """
     Create morphing animation between two objects.
@@ -43,158 +49,109 @@ def create_morph_animation(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        workers: Render frames on this many processes (None = serial)
+        executor: Existing process pool to render frames on
 
     Returns:
         List of frames
     """
-    frames = []
-
-    for i in range(num_frames):
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-        frame = create_blank_frame(frame_width, frame_height, bg_color)
-
-        if morph_type == 'crossfade':
-            # Simple crossfade between two objects
-            opacity1 = interpolate(1, 0, t, easing)
-            opacity2 = interpolate(0, 1, t, easing)
-
-            if object_type == 'emoji':
-                # Create first emoji
-                emoji1_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-                size1 = object1_data['size']
-                draw_emoji_enhanced(
-                    emoji1_canvas,
-                    emoji=object1_data['emoji'],
-                    position=(center_pos[0] - size1 // 2, center_pos[1] - size1 // 2),
-                    size=size1,
-                    shadow=False
-                )
-
-                # Apply opacity
-                from templates.fade import apply_opacity
-                emoji1_canvas = apply_opacity(emoji1_canvas, opacity1)
-
-                # Create second emoji
-                emoji2_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-                size2 = object2_data['size']
-                draw_emoji_enhanced(
-                    emoji2_canvas,
-                    emoji=object2_data['emoji'],
-                    position=(center_pos[0] - size2 // 2, center_pos[1] - size2 // 2),
-                    size=size2,
-                    shadow=False
-                )
-
-                emoji2_canvas = apply_opacity(emoji2_canvas, opacity2)
-
-                # Composite both
-                frame_rgba = frame.convert('RGBA')
-                frame_rgba = Image.alpha_composite(frame_rgba, emoji1_canvas)
-                frame_rgba = Image.alpha_composite(frame_rgba, emoji2_canvas)
-                frame = frame_rgba.convert('RGB')
-
-            elif object_type == 'circle':
-                # Morph between two circles
-                radius1 = object1_data['radius']
-                radius2 = object2_data['radius']
-                color1 = object1_data['color']
-                color2 = object2_data['color']
-
-                # Interpolate properties
-                current_radius = int(interpolate(radius1, radius2, t, easing))
-                current_color = tuple(
-                    int(interpolate(color1[i], color2[i], t, easing))
-                    for i in range(3)
-                )
-
-                draw_circle(frame, center_pos, current_radius, fill_color=current_color)
-
-        elif morph_type == 'scale':
-            # First object scales down as second scales up
-            if object_type == 'emoji':
-                scale1 = interpolate(1.0, 0.0, t, easing)
-                scale2 = interpolate(0.0, 1.0, t, easing)
-
-                # Draw first emoji (shrinking)
-                if scale1 > 0.05:
-                    size1 = int(object1_data['size'] * scale1)
-                    size1 = max(12, size1)
-                    emoji1_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-                    draw_emoji_enhanced(
-                        emoji1_canvas,
-                        emoji=object1_data['emoji'],
-                        position=(center_pos[0] - size1 // 2, center_pos[1] - size1 // 2),
-                        size=size1,
-                        shadow=False
-                    )
-
-                    frame_rgba = frame.convert('RGBA')
-                    frame = Image.alpha_composite(frame_rgba, emoji1_canvas)
-                    frame = frame.convert('RGB')
-
-                # Draw second emoji (growing)
-                if scale2 > 0.05:
-                    size2 = int(object2_data['size'] * scale2)
-                    size2 = max(12, size2)
-                    emoji2_canvas = Image.new('RGBA', (frame_width, frame_height), (0, 0, 0, 0))
-                    draw_emoji_enhanced(
-                        emoji2_canvas,
-                        emoji=object2_data['emoji'],
-                        position=(center_pos[0] - size2 // 2, center_pos[1] - size2 // 2),
-                        size=size2,
-                        shadow=False
-                    )
-
-                    frame_rgba = frame.convert('RGBA')
-                    frame = Image.alpha_composite(frame_rgba, emoji2_canvas)
-                    frame = frame.convert('RGB')
-
-        elif morph_type == 'spin_morph':
-            # Spin while morphing (flip-like)
-            import math
-
-            # Calculate rotation (0 to 180 degrees)
-            angle = interpolate(0, 180, t, easing)
-            scale_factor = abs(math.cos(math.radians(angle)))
-
-            # Determine which object to show
-            if angle < 90:
-                current_object = object1_data
-            else:
-                current_object = object2_data
-
-            # Skip when edge-on
-            if scale_factor < 0.05:
-                frames.append(frame)
-                continue
-
-            if object_type == 'emoji':
-                size = current_object['size']
-                canvas_size = size * 2
-                emoji_canvas = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
-
-                draw_emoji_enhanced(
-                    emoji_canvas,
-                    emoji=current_object['emoji'],
-                    position=(canvas_size // 2 - size // 2, canvas_size // 2 - size // 2),
-                    size=size,
-                    shadow=False
-                )
-
-                # Scale horizontally for spin effect
-                new_width = max(1, int(canvas_size * scale_factor))
-                emoji_scaled = emoji_canvas.resize((new_width, canvas_size), Image.LANCZOS)
-
-                paste_x = center_pos[0] - new_width // 2
-                paste_y = center_pos[1] - canvas_size // 2
-
-                frame_rgba = frame.convert('RGBA')
-                frame_rgba.paste(emoji_scaled, (paste_x, paste_y), emoji_scaled)
-                frame = frame_rgba.convert('RGB')
-
-        frames.append(frame)
-
-    return frames
+    # Rasterize both emojis once; frames blend their tiles onto the background
+    compositor = LayerCompositor(frame_width, frame_height, bg_color)
+    sprite1 = sprite2 = None
+    if object_type == 'emoji':
+        sprite1 = get_sprite_cache().emoji(object1_data['emoji'], size=object1_data['size'], shadow=False)
+        sprite2 = get_sprite_cache().emoji(object2_data['emoji'], size=object2_data['size'], shadow=False)
+
+    ctx = {
+        'object1_data': object1_data,
+        'object2_data': object2_data,
+        'morph_type': morph_type,
+        'easing': easing,
+        'object_type': object_type,
+        'center_pos': center_pos,
+        'compositor': compositor,
+        'sprites': (sprite1, sprite2),
+    }
+    return render_frames(_render_morph_frame, num_frames, ctx, workers=workers, executor=executor,
+                         reused=True)
+
+
+def _render_morph_frame(i: int, t: float, ctx: dict) -> Image.Image:
+    """Composite one morph frame at progress t (see core.render)."""
+    object1_data, object2_data = ctx['object1_data'], ctx['object2_data']
+    morph_type, easing, object_type = ctx['morph_type'], ctx['easing'], ctx['object_type']
+    center_pos, compositor = ctx['center_pos'], ctx['compositor']
+    sprite1, sprite2 = ctx['sprites']
+
+    layers = []
+
+    if morph_type == 'crossfade':
+        # Simple crossfade between two objects
+        opacity1 = interpolate(1, 0, t, easing)
+        opacity2 = interpolate(0, 1, t, easing)
+
+        if object_type == 'emoji':
+            size1, size2 = object1_data['size'], object2_data['size']
+            layers.append(Layer.from_sprite(
+                sprite1, (center_pos[0] - size1 // 2, center_pos[1] - size1 // 2), opacity=opacity1))
+            layers.append(Layer.from_sprite(
+                sprite2, (center_pos[0] - size2 // 2, center_pos[1] - size2 // 2), opacity=opacity2))
+
+        elif object_type == 'circle':
+            # Morph between two circles
+            radius1 = object1_data['radius']
+            radius2 = object2_data['radius']
+            color1 = object1_data['color']
+            color2 = object2_data['color']
+
+            # Interpolate properties
+            current_radius = int(interpolate(radius1, radius2, t, easing))
+            current_color = tuple(
+                int(interpolate(color1[i], color2[i], t, easing))
+                for i in range(3)
+            )
+
+            # Drawn straight onto the frame rather than as a layer, so the
+            # compositor couldn't restore it; give it a fresh canvas instead
+            frame = compositor.compose([])
+            draw_circle(frame, center_pos, current_radius, fill_color=current_color)
+            return frame
+
+    elif morph_type == 'scale':
+        # First object scales down as second scales up
+        if object_type == 'emoji':
+            scale1 = interpolate(1.0, 0.0, t, easing)
+            scale2 = interpolate(0.0, 1.0, t, easing)
+
+            # First emoji (shrinking), then second emoji (growing) on top
+            for sprite, data, scale in ((sprite1, object1_data, scale1),
+                                        (sprite2, object2_data, scale2)):
+                if scale > 0.05:
+                    size = max(12, int(data['size'] * scale))
+                    layers.append(Layer.from_sprite(
+                        sprite, (center_pos[0] - size // 2, center_pos[1] - size // 2),
+                        scale=size / max(12, data['size'])))
+
+    elif morph_type == 'spin_morph':
+        # Spin while morphing (flip-like)
+        import math
+
+        # Calculate rotation (0 to 180 degrees)
+        angle = interpolate(0, 180, t, easing)
+        scale_factor = abs(math.cos(math.radians(angle)))
+
+        # Determine which object to show (skip when edge-on)
+        if object_type == 'emoji' and scale_factor >= 0.05:
+            sprite, data = (sprite1, object1_data) if angle < 90 else (sprite2, object2_data)
+            size = data['size']
+            tile, (x, y) = sprite.place((center_pos[0] - size // 2, center_pos[1] - size // 2))
+
+            # Scale horizontally about the center for spin effect
+            new_width = max(1, int(tile.width * scale_factor))
+            layers.append(Layer(tile.resize((new_width, tile.height), Image.LANCZOS),
+                                (center_pos[0] + round((x - center_pos[0]) * scale_factor), y)))
+
+    return compositor.compose(layers, reuse=True)
 
 
 def create_reaction_morph(
@@ -6,14 +6,17 @@ Provides flexible movement primitives for objects along linear, arc, or custom p
 """
 
 import sys
+from concurrent.futures import Executor
 from pathlib import Path
 import math
 
 sys.path.append(str(Path(__file__).parent.parent))
 
+from PIL import Image
 from core.gif_builder import GIFBuilder
 from core.frame_composer import create_blank_frame, draw_circle, draw_emoji_enhanced
 from core.easing import interpolate, calculate_arc_motion
+from core.render import render_frames
 
 
 def create_move_animation(
@@ -27,7 +30,9 @@ def create_move_animation(
     motion_params: dict | None = None,
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    workers: int | None = None,
+    executor: Executor | None = None
 ) -> list:
     """
     Create frames showing object moving along a path.
@@ -44,12 +49,12 @@ def create_move_animation(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        workers: Render frames on this many processes (None = serial)
+        executor: Existing process pool to render frames on
 
     Returns:
         List of frames
     """
-    frames = []
-
     # Default object data
     if object_data is None:
         if object_type == 'circle':
@@ -61,100 +66,115 @@ def create_move_animation(
     if motion_params is None:
         motion_params = {}
 
-    for i in range(num_frames):
-        frame = create_blank_frame(frame_width, frame_height, bg_color)
-
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-
-        # Calculate position based on motion type
-        if motion_type == 'linear':
-            # Straight line with easing
-            x = interpolate(start_pos[0], end_pos[0], t, easing)
-            y = interpolate(start_pos[1], end_pos[1], t, easing)
-
-        elif motion_type == 'arc':
-            # Parabolic arc
-            arc_height = motion_params.get('arc_height', 100)
-            x, y = calculate_arc_motion(start_pos, end_pos, arc_height, t)
-
-        elif motion_type == 'circle':
-            # Circular motion around a center
-            center = motion_params.get('center', (frame_width // 2, frame_height // 2))
-            radius = motion_params.get('radius', 150)
-            start_angle = motion_params.get('start_angle', 0)
-            angle_range = motion_params.get('angle_range', 360)  # Full circle
-
-            angle = start_angle + (angle_range * t)
-            angle_rad = math.radians(angle)
-
-            x = center[0] + radius * math.cos(angle_rad)
-            y = center[1] + radius * math.sin(angle_rad)
-
-        elif motion_type == 'wave':
-            # Move in straight line but add wave motion
-            wave_amplitude = motion_params.get('wave_amplitude', 50)
-            wave_frequency = motion_params.get('wave_frequency', 2)
-
-            # Base linear motion
-            base_x = interpolate(start_pos[0], end_pos[0], t, easing)
-            base_y = interpolate(start_pos[1], end_pos[1], t, easing)
-
-            # Add wave offset perpendicular to motion direction
-            dx = end_pos[0] - start_pos[0]
-            dy = end_pos[1] - start_pos[1]
-            length = math.sqrt(dx * dx + dy * dy)
-
-            if length > 0:
-                # Perpendicular direction
-                perp_x = -dy / length
-                perp_y = dx / length
-
-                # Wave offset
-                wave_offset = math.sin(t * wave_frequency * 2 * math.pi) * wave_amplitude
-
-                x = base_x + perp_x * wave_offset
-                y = base_y + perp_y * wave_offset
-            else:
-                x, y = base_x, base_y
-
-        elif motion_type == 'bezier':
-            # Quadratic bezier curve
-            control_point = motion_params.get('control_point', (
-                (start_pos[0] + end_pos[0]) // 2,
-                (start_pos[1] + end_pos[1]) // 2 - 100
-            ))
-
-            # Quadratic Bezier formula: B(t) = (1-t)²P0 + 2(1-t)tP1 + t²P2
-            x = (1 - t) ** 2 * start_pos[0] + 2 * (1 - t) * t * control_point[0] + t ** 2 * end_pos[0]
-            y = (1 - t) ** 2 * start_pos[1] + 2 * (1 - t) * t * control_point[1] + t ** 2 * end_pos[1]
-
+    ctx = {
+        'object_type': object_type,
+        'object_data': object_data,
+        'start_pos': start_pos,
+        'end_pos': end_pos,
+        'motion_type': motion_type,
+        'easing': easing,
+        'motion_params': motion_params,
+        'frame_size': (frame_width, frame_height),
+        'bg_color': bg_color,
+    }
+    return render_frames(_render_move_frame, num_frames, ctx, workers=workers, executor=executor)
+
+
+def _render_move_frame(i: int, t: float, ctx: dict) -> Image.Image:
+    """Render one frame of the object at its position along the path (see core.render)."""
+    object_type, object_data = ctx['object_type'], ctx['object_data']
+    start_pos, end_pos = ctx['start_pos'], ctx['end_pos']
+    motion_type, easing, motion_params = ctx['motion_type'], ctx['easing'], ctx['motion_params']
+    frame_width, frame_height = ctx['frame_size']
+    frame = create_blank_frame(frame_width, frame_height, ctx['bg_color'])
+
+    # Calculate position based on motion type
+    if motion_type == 'linear':
+        # Straight line with easing
+        x = interpolate(start_pos[0], end_pos[0], t, easing)
+        y = interpolate(start_pos[1], end_pos[1], t, easing)
+
+    elif motion_type == 'arc':
+        # Parabolic arc
+        arc_height = motion_params.get('arc_height', 100)
+        x, y = calculate_arc_motion(start_pos, end_pos, arc_height, t)
+
+    elif motion_type == 'circle':
+        # Circular motion around a center
+        center = motion_params.get('center', (frame_width // 2, frame_height // 2))
+        radius = motion_params.get('radius', 150)
+        start_angle = motion_params.get('start_angle', 0)
+        angle_range = motion_params.get('angle_range', 360)  # Full circle
+
+        angle = start_angle + (angle_range * t)
+        angle_rad = math.radians(angle)
+
+        x = center[0] + radius * math.cos(angle_rad)
+        y = center[1] + radius * math.sin(angle_rad)
+
+    elif motion_type == 'wave':
+        # Move in straight line but add wave motion
+        wave_amplitude = motion_params.get('wave_amplitude', 50)
+        wave_frequency = motion_params.get('wave_frequency', 2)
+
+        # Base linear motion
+        base_x = interpolate(start_pos[0], end_pos[0], t, easing)
+        base_y = interpolate(start_pos[1], end_pos[1], t, easing)
+
+        # Add wave offset perpendicular to motion direction
+        dx = end_pos[0] - start_pos[0]
+        dy = end_pos[1] - start_pos[1]
+        length = math.sqrt(dx * dx + dy * dy)
+
+        if length > 0:
+            # Perpendicular direction
+            perp_x = -dy / length
+            perp_y = dx / length
+
+            # Wave offset
+            wave_offset = math.sin(t * wave_frequency * 2 * math.pi) * wave_amplitude
+
+            x = base_x + perp_x * wave_offset
+            y = base_y + perp_y * wave_offset
         else:
-            # Default to linear
-            x = interpolate(start_pos[0], end_pos[0], t, easing)
-            y = interpolate(start_pos[1], end_pos[1], t, easing)
-
-        # Draw object at calculated position
-        x, y = int(x), int(y)
-
-        if object_type == 'circle':
-            draw_circle(
-                frame,
-                center=(x, y),
-                radius=object_data['radius'],
-                fill_color=object_data['color']
-            )
-        elif object_type == 'emoji':
-            draw_emoji_enhanced(
-                frame,
-                emoji=object_data['emoji'],
-                position=(x - object_data['size'] // 2, y - object_data['size'] // 2),
-                size=object_data['size'],
-                shadow=object_data.get('shadow', True)
-            )
-
-        frames.append(frame)
-
-    return frames
+            x, y = base_x, base_y
+
+    elif motion_type == 'bezier':
+        # Quadratic bezier curve
+        control_point = motion_params.get('control_point', (
+            (start_pos[0] + end_pos[0]) // 2,
+            (start_pos[1] + end_pos[1]) // 2 - 100
+        ))
+
+        # Quadratic Bezier formula: B(t) = (1-t)²P0 + 2(1-t)tP1 + t²P2
+        x = (1 - t) ** 2 * start_pos[0] + 2 * (1 - t) * t * control_point[0] + t ** 2 * end_pos[0]
+        y = (1 - t) ** 2 * start_pos[1] + 2 * (1 - t) * t * control_point[1] + t ** 2 * end_pos[1]
+
+    else:
+        # Default to linear
+        x = interpolate(start_pos[0], end_pos[0], t, easing)
+        y = interpolate(start_pos[1], end_pos[1], t, easing)
+
+    # Draw object at calculated position
+    x, y = int(x), int(y)
+
+    if object_type == 'circle':
+        draw_circle(
+            frame,
+            center=(x, y),
+            radius=object_data['radius'],
+            fill_color=object_data['color']
+        )
+    elif object_type == 'emoji':
+        draw_emoji_enhanced(
+            frame,
+            emoji=object_data['emoji'],
+            position=(x - object_data['size'] // 2, y - object_data['size'] // 2),
+            size=object_data['size'],
+            shadow=object_data.get('shadow', True)
+        )
+
+    return frame
 
 
 def create_path_from_points(points: list[tuple[int, int]],
@@ -6,15 +6,20 @@ Creates pulsing, heartbeat, and throbbing effects.
 """
 
 import sys
+from concurrent.futures import Executor
 from pathlib import Path
 import math
 
 sys.path.append(str(Path(__file__).parent.parent))
 
 from PIL import Image
+import numpy as np
 from core.gif_builder import GIFBuilder
-from core.frame_composer import create_blank_frame, draw_emoji_enhanced, draw_circle
-from core.easing import interpolate
+from core.frame_composer import create_blank_frame, draw_circle
+from core.easing import progress
+from core.keyframes import Track
+from core.render import render_frames
+from core.sprites import get_sprite_cache
 
 
 def create_pulse_animation(
@@ -27,7 +32,9 @@ def create_pulse_animation(
     center_pos: tuple[int, int] = (240, 240),
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    workers: int | None = None,
+    executor: Executor | None = None
 ) -> list[Image.Image]:
     """
     Create pulsing/scaling animation.
@@ -43,12 +50,12 @@ def create_pulse_animation(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        workers: Render frames on this many processes (None = serial)
+        executor: Existing process pool to render frames on
 
     Returns:
         List of frames
     """
-    frames = []
-
     # Default object data
     if object_data is None:
         if object_type == 'emoji':
@@ -58,99 +65,108 @@ def create_pulse_animation(
 
     min_scale, max_scale = scale_range
 
-    for i in range(num_frames):
-        frame = create_blank_frame(frame_width, frame_height, bg_color)
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-
-        # Calculate scale based on pulse type
-        if pulse_type == 'smooth':
-            # Simple sinusoidal pulse
-            scale = min_scale + (max_scale - min_scale) * (
-                0.5 + 0.5 * math.sin(t * pulses * 2 * math.pi - math.pi / 2)
-            )
-
-        elif pulse_type == 'heartbeat':
-            # Double pump like a heartbeat
-            phase = (t * pulses) % 1.0
-            if phase < 0.15:
-                # First pump
-                scale = interpolate(min_scale, max_scale, phase / 0.15, 'ease_out')
-            elif phase < 0.25:
-                # First release
-                scale = interpolate(max_scale, min_scale, (phase - 0.15) / 0.10, 'ease_in')
-            elif phase < 0.35:
-                # Second pump (smaller)
-                scale = interpolate(min_scale, (min_scale + max_scale) / 2, (phase - 0.25) / 0.10, 'ease_out')
-            elif phase < 0.45:
-                # Second release
-                scale = interpolate((min_scale + max_scale) / 2, min_scale, (phase - 0.35) / 0.10, 'ease_in')
-            else:
-                # Rest period
-                scale = min_scale
-
-        elif pulse_type == 'throb':
-            # Sharp pulse with quick return
-            phase = (t * pulses) % 1.0
-            if phase < 0.2:
-                scale = interpolate(min_scale, max_scale, phase / 0.2, 'ease_out')
-            else:
-                scale = interpolate(max_scale, min_scale, (phase - 0.2) / 0.8, 'ease_in')
-
-        elif pulse_type == 'pop':
-            # Pop out and back with overshoot
-            phase = (t * pulses) % 1.0
-            if phase < 0.3:
-                # Pop out with overshoot
-                scale = interpolate(min_scale, max_scale * 1.1, phase / 0.3, 'elastic_out')
-            else:
-                # Settle back
-                scale = interpolate(max_scale * 1.1, min_scale, (phase - 0.3) / 0.7, 'ease_out')
-
-        else:
-            scale = min_scale + (max_scale - min_scale) * (
-                0.5 + 0.5 * math.sin(t * pulses * 2 * math.pi)
-            )
-
-        # Draw object at calculated scale
-        if object_type == 'emoji':
-            base_size = object_data['size']
-            current_size = int(base_size * scale)
-            draw_emoji_enhanced(
-                frame,
-                emoji=object_data['emoji'],
-                position=(center_pos[0] - current_size // 2, center_pos[1] - current_size // 2),
-                size=current_size,
-                shadow=object_data.get('shadow', True)
-            )
-
-        elif object_type == 'circle':
-            base_radius = object_data['radius']
-            current_radius = int(base_radius * scale)
-            draw_circle(
-                frame,
-                center=center_pos,
-                radius=current_radius,
-                fill_color=object_data['color']
-            )
-
-        elif object_type == 'text':
-            from core.typography import draw_text_with_outline
-            base_size = object_data.get('font_size', 50)
-            current_size = int(base_size * scale)
-            draw_text_with_outline(
-                frame,
-                text=object_data.get('text', 'PULSE'),
-                position=center_pos,
-                font_size=current_size,
-                text_color=object_data.get('text_color', (255, 100, 100)),
-                outline_color=object_data.get('outline_color', (0, 0, 0)),
-                outline_width=3,
-                centered=True
-            )
-
-        frames.append(frame)
-
-    return frames
+    # Scale of every frame; the keyframed pulses repeat `pulses` times
+    t = progress(num_frames)
+    if pulse_type == 'smooth':
+        # Simple sinusoidal pulse
+        scales = min_scale + (max_scale - min_scale) * (
+            0.5 + 0.5 * np.sin(t * pulses * 2 * math.pi - math.pi / 2)
+        )
+
+    elif pulse_type == 'heartbeat':
+        # Double pump like a heartbeat, then rest
+        scales = (Track(min_scale, cycles=pulses)
+                  .to(0.15, max_scale, 'ease_out')                      # First pump
+                  .to(0.25, min_scale, 'ease_in')                       # First release
+                  .to(0.35, (min_scale + max_scale) / 2, 'ease_out')    # Second pump (smaller)
+                  .to(0.45, min_scale, 'ease_in')                       # Second release
+                  .compile(num_frames))
+
+    elif pulse_type == 'throb':
+        # Sharp pulse with quick return
+        scales = (Track(min_scale, cycles=pulses)
+                  .to(0.2, max_scale, 'ease_out')
+                  .to(1.0, min_scale, 'ease_in')
+                  .compile(num_frames))
+
+    elif pulse_type == 'pop':
+        # Pop out with overshoot, then settle back
+        scales = (Track(min_scale, cycles=pulses)
+                  .to(0.3, max_scale * 1.1, 'elastic_out')
+                  .to(1.0, min_scale, 'ease_out')
+                  .compile(num_frames))
+
+    else:
+        scales = min_scale + (max_scale - min_scale) * (
+            0.5 + 0.5 * np.sin(t * pulses * 2 * math.pi)
+        )
+
+    # Rasterize the object once, big enough for the largest (overshooting) scale;
+    # each frame then blits a cached downscaled copy
+    sprite_scale = max_scale * 1.2
+    sprite, sprite_size = None, 1
+    if object_type == 'emoji':
+        sprite_size = max(12, int(object_data['size'] * sprite_scale))
+        sprite = get_sprite_cache().emoji(object_data['emoji'], size=sprite_size,
+                                          shadow=object_data.get('shadow', True))
+    elif object_type == 'text':
+        sprite_size = max(1, int(object_data.get('font_size', 50) * sprite_scale))
+        sprite = get_sprite_cache().text(
+            object_data.get('text', 'PULSE'),
+            font_size=sprite_size,
+            text_color=object_data.get('text_color', (255, 100, 100)),
+            effect='outline',
+            outline_color=object_data.get('outline_color', (0, 0, 0)),
+            outline_width=max(1, round(3 * sprite_scale))
+        )
+
+    ctx = {
+        'object_type': object_type,
+        'object_data': object_data,
+        'scales': scales,
+        'sprite': sprite,
+        'sprite_size': sprite_size,
+        'center_pos': center_pos,
+        'frame_size': (frame_width, frame_height),
+        'bg_color': bg_color,
+    }
+    return render_frames(_render_pulse_frame, num_frames, ctx, workers=workers, executor=executor)
+
+
+def _render_pulse_frame(i: int, t: float, ctx: dict) -> Image.Image:
+    """Render one pulse frame from precomputed scales (see core.render)."""
+    object_type, object_data = ctx['object_type'], ctx['object_data']
+    center_pos = ctx['center_pos']
+    frame = create_blank_frame(*ctx['frame_size'], ctx['bg_color'])
+    scale = float(ctx['scales'][i])
+
+    # Draw object at calculated scale
+    if object_type == 'emoji':
+        base_size = object_data['size']
+        current_size = int(base_size * scale)
+        ctx['sprite'].blit(
+            frame,
+            position=(center_pos[0] - current_size // 2, center_pos[1] - current_size // 2),
+            scale=current_size / ctx['sprite_size']
+        )
+
+    elif object_type == 'circle':
+        base_radius = object_data['radius']
+        current_radius = int(base_radius * scale)
+        draw_circle(
+            frame,
+            center=center_pos,
+            radius=current_radius,
+            fill_color=object_data['color']
+        )
+
+    elif object_type == 'text':
+        base_size = object_data.get('font_size', 50)
+        current_size = int(base_size * scale)
+        ctx['sprite'].blit(frame, position=center_pos, scale=current_size / ctx['sprite_size'],
+                           centered=True)
+
+    return frame
 
 
 def create_attention_pulse(
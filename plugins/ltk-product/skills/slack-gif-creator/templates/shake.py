@@ -7,13 +7,16 @@ Use this for impact effects, emphasis, or nervous/excited reactions.
 
 import sys
 import math
+from concurrent.futures import Executor
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
+from PIL import Image
 from core.gif_builder import GIFBuilder
 from core.frame_composer import create_blank_frame, draw_circle, draw_emoji, draw_text
 from core.easing import ease_out_quad
+from core.render import render_frames
 
 
 def create_shake_animation(
@@ -26,7 +29,9 @@ def create_shake_animation(
     direction: str = 'horizontal',  # 'horizontal', 'vertical', or 'both'
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    workers: int | None = None,
+    executor: Executor | None = None
 ) -> list:
     """
     Create frames for a shaking animation.
@@ -42,12 +47,12 @@ def create_shake_animation(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        workers: Render frames on this many processes (None = serial)
+        executor: Existing process pool to render frames on
 
     Returns:
         List of frames
     """
-    frames = []
-
     # Default object data
     if object_data is None:
         if object_type == 'emoji':
@@ -55,58 +60,69 @@ def create_shake_animation(
         elif object_type == 'text':
             object_data = {'text': 'SHAKE!', 'font_size': 50, 'color': (255, 0, 0)}
 
-    for i in range(num_frames):
-        frame = create_blank_frame(frame_width, frame_height, bg_color)
-
-        # Calculate progress
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-
-        # Decay shake intensity over time
-        intensity = shake_intensity * (1 - ease_out_quad(t))
-
-        # Calculate shake offset using sine wave for smooth oscillation
-        freq = 3  # Oscillation frequency
-        offset_x = 0
-        offset_y = 0
-
-        if direction in ['horizontal', 'both']:
-            offset_x = int(math.sin(t * freq * 2 * math.pi) * intensity)
-
-        if direction in ['vertical', 'both']:
-            offset_y = int(math.cos(t * freq * 2 * math.pi) * intensity)
-
-        # Apply offset
-        x = center_x + offset_x
-        y = center_y + offset_y
-
-        # Draw object
-        if object_type == 'emoji':
-            draw_emoji(
-                frame,
-                emoji=object_data['emoji'],
-                position=(x - object_data['size'] // 2, y - object_data['size'] // 2),
-                size=object_data['size']
-            )
-        elif object_type == 'text':
-            draw_text(
-                frame,
-                text=object_data['text'],
-                position=(x, y),
-                font_size=object_data['font_size'],
-                color=object_data['color'],
-                centered=True
-            )
-        elif object_type == 'circle':
-            draw_circle(
-                frame,
-                center=(x, y),
-                radius=object_data.get('radius', 30),
-                fill_color=object_data.get('color', (100, 100, 255))
-            )
-
-        frames.append(frame)
-
-    return frames
+    ctx = {
+        'object_type': object_type,
+        'object_data': object_data,
+        'shake_intensity': shake_intensity,
+        'center': (center_x, center_y),
+        'direction': direction,
+        'frame_size': (frame_width, frame_height),
+        'bg_color': bg_color,
+    }
+    return render_frames(_render_shake_frame, num_frames, ctx, workers=workers, executor=executor)
+
+
+def _render_shake_frame(i: int, t: float, ctx: dict) -> Image.Image:
+    """Render one shake frame at progress t (see core.render)."""
+    object_type, object_data = ctx['object_type'], ctx['object_data']
+    shake_intensity, direction = ctx['shake_intensity'], ctx['direction']
+    center_x, center_y = ctx['center']
+    frame = create_blank_frame(*ctx['frame_size'], ctx['bg_color'])
+
+    # Decay shake intensity over time
+    intensity = shake_intensity * (1 - ease_out_quad(t))
+
+    # Calculate shake offset using sine wave for smooth oscillation
+    freq = 3  # Oscillation frequency
+    offset_x = 0
+    offset_y = 0
+
+    if direction in ['horizontal', 'both']:
+        offset_x = int(math.sin(t * freq * 2 * math.pi) * intensity)
+
+    if direction in ['vertical', 'both']:
+        offset_y = int(math.cos(t * freq * 2 * math.pi) * intensity)
+
+    # Apply offset
+    x = center_x + offset_x
+    y = center_y + offset_y
+
+    # Draw object
+    if object_type == 'emoji':
+        draw_emoji(
+            frame,
+            emoji=object_data['emoji'],
+            position=(x - object_data['size'] // 2, y - object_data['size'] // 2),
+            size=object_data['size']
+        )
+    elif object_type == 'text':
+        draw_text(
+            frame,
+            text=object_data['text'],
+            position=(x, y),
+            font_size=object_data['font_size'],
+            color=object_data['color'],
+            centered=True
+        )
+    elif object_type == 'circle':
+        draw_circle(
+            frame,
+            center=(x, y),
+            radius=object_data.get('radius', 30),
+            fill_color=object_data.get('color', (100, 100, 255))
+        )
+
+    return frame
 
 
 # Example usage
@@ -6,14 +6,16 @@ Creates smooth entrance and exit animations.
 """
 
 import sys
+from concurrent.futures import Executor
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
 from PIL import Image
-from core.gif_builder import GIFBuilder
+from core.gif_builder import GIFBuilder, HeldFrame
 from core.frame_composer import create_blank_frame, draw_emoji_enhanced
-from core.easing import interpolate
+from core.easing import interpolate, timeline
+from core.render import render_frames
 
 
 def create_slide_animation(
@@ -27,7 +29,10 @@ def create_slide_animation(
     final_pos: tuple[int, int] | None = None,
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    hold_frames: int = 0,
+    workers: int | None = None,
+    executor: Executor | None = None
 ) -> list[Image.Image]:
     """
     Create slide animation.
@@ -44,12 +49,14 @@ def create_slide_animation(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        hold_frames: Extra frame intervals to show the last frame for, returned
+            as a HeldFrame instead of copies of the frame
+        workers: Render frames on this many processes (None = serial)
+        executor: Existing process pool to render frames on
 
     Returns:
         List of frames
     """
-    frames = []
-
     # Default object data
     if object_data is None:
         if object_type == 'emoji':
@@ -100,43 +107,59 @@ def create_slide_animation(
     if overshoot and slide_type == 'in':
         easing = 'back_out'
 
-    for i in range(num_frames):
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-        frame = create_blank_frame(frame_width, frame_height, bg_color)
-
-        # Calculate current position
-        x = int(interpolate(start_pos[0], end_pos[0], t, easing))
-        y = int(interpolate(start_pos[1], end_pos[1], t, easing))
+    # Position for every frame
+    xs = timeline(num_frames, easing, start_pos[0], end_pos[0])
+    ys = timeline(num_frames, easing, start_pos[1], end_pos[1])
 
-        # Draw object
-        if object_type == 'emoji':
-            size = object_data['size']
-            draw_emoji_enhanced(
-                frame,
-                emoji=object_data['emoji'],
-                position=(x - size // 2, y - size // 2),
-                size=size,
-                shadow=object_data.get('shadow', True)
-            )
-
-        elif object_type == 'text':
-            from core.typography import draw_text_with_outline
-            draw_text_with_outline(
-                frame,
-                text=object_data.get('text', 'SLIDE'),
-                position=(x, y),
-                font_size=object_data.get('font_size', 50),
-                text_color=object_data.get('text_color', (0, 0, 0)),
-                outline_color=object_data.get('outline_color', (255, 255, 255)),
-                outline_width=3,
-                centered=True
-            )
+    ctx = {
+        'object_type': object_type,
+        'object_data': object_data,
+        'xs': xs,
+        'ys': ys,
+        'frame_size': (frame_width, frame_height),
+        'bg_color': bg_color,
+    }
+    frames = render_frames(_render_slide_frame, num_frames, ctx, workers=workers, executor=executor)
 
-        frames.append(frame)
+    if hold_frames > 0 and frames:
+        frames[-1] = HeldFrame(frames[-1], hold_frames + 1)
 
     return frames
 
 
+def _render_slide_frame(i: int, t: float, ctx: dict) -> Image.Image:
+    """Render one slide frame from precomputed positions (see core.render)."""
+    object_type, object_data = ctx['object_type'], ctx['object_data']
+    frame = create_blank_frame(*ctx['frame_size'], ctx['bg_color'])
+    x, y = int(ctx['xs'][i]), int(ctx['ys'][i])
+
+    # Draw object
+    if object_type == 'emoji':
+        size = object_data['size']
+        draw_emoji_enhanced(
+            frame,
+            emoji=object_data['emoji'],
+            position=(x - size // 2, y - size // 2),
+            size=size,
+            shadow=object_data.get('shadow', True)
+        )
+
+    elif object_type == 'text':
+        from core.typography import draw_text_with_outline
+        draw_text_with_outline(
+            frame,
+            text=object_data.get('text', 'SLIDE'),
+            position=(x, y),
+            font_size=object_data.get('font_size', 50),
+            text_color=object_data.get('text_color', (0, 0, 0)),
+            outline_color=object_data.get('outline_color', (255, 255, 255)),
+            outline_width=3,
+            centered=True
+        )
+
+    return frame
+
+
 def create_multi_slide(
     objects: list[dict],
     num_frames: int = 30,
@@ -6,15 +6,19 @@ Creates zoom in, zoom out, and dramatic scaling effects.
 """
 
 import sys
+from concurrent.futures import Executor
 from pathlib import Path
 import math
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from PIL import Image, ImageFilter
+from PIL import Image, ImageFilter, ImageOps
 from core.gif_builder import GIFBuilder
 from core.frame_composer import create_blank_frame, draw_emoji_enhanced
-from core.easing import interpolate
+from core.easing import interpolate, timeline
+from core.keyframes import Track
+from core.render import render_frames
+from core.sprites import get_sprite_cache, paste_tile
 
 
 def create_zoom_animation(
@@ -28,7 +32,9 @@ def create_zoom_animation(
     center_pos: tuple[int, int] = (240, 240),
     frame_width: int = 480,
     frame_height: int = 480,
-    bg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (255, 255, 255),
+    workers: int | None = None,
+    executor: Executor | None = None
 ) -> list[Image.Image]:
     """
     Create zoom animation.
@@ -45,12 +51,12 @@ def create_zoom_animation(
         frame_width: Frame width
         frame_height: Frame height
         bg_color: Background color
+        workers: Render frames on this many processes (None = serial)
+        executor: Existing process pool to render frames on
 
     Returns:
         List of frames
     """
-    frames = []
-
     # Default object data
     if object_data is None:
         if object_type == 'emoji':
@@ -59,93 +65,113 @@ def create_zoom_animation(
     base_size = object_data.get('size', 100) if object_type == 'emoji' else object_data.get('font_size', 60)
     start_scale, end_scale = scale_range
 
-    for i in range(num_frames):
-        t = i / (num_frames - 1) if num_frames > 1 else 0
-
-        # Calculate scale based on zoom type
-        if zoom_type == 'in':
-            scale = interpolate(start_scale, end_scale, t, easing)
-        elif zoom_type == 'out':
-            scale = interpolate(end_scale, start_scale, t, easing)
-        elif zoom_type == 'in_out':
-            if t < 0.5:
-                scale = interpolate(start_scale, end_scale, t * 2, easing)
-            else:
-                scale = interpolate(end_scale, start_scale, (t - 0.5) * 2, easing)
-        elif zoom_type == 'punch':
-            # Quick zoom in with overshoot then settle
-            if t < 0.3:
-                scale = interpolate(start_scale, end_scale * 1.2, t / 0.3, 'ease_out')
-            else:
-                scale = interpolate(end_scale * 1.2, end_scale, (t - 0.3) / 0.7, 'elastic_out')
-        else:
-            scale = interpolate(start_scale, end_scale, t, easing)
-
-        # Create frame
-        frame = create_blank_frame(frame_width, frame_height, bg_color)
-
-        if object_type == 'emoji':
-            current_size = int(base_size * scale)
-
-            # Clamp size to reasonable bounds
-            current_size = max(12, min(current_size, frame_width * 2))
-
-            # Create emoji on transparent background
-            canvas_size = max(frame_width, frame_height, current_size) * 2
-            emoji_canvas = Image.new('RGBA', (canvas_size, canvas_size), (0, 0, 0, 0))
-
-            draw_emoji_enhanced(
-                emoji_canvas,
-                emoji=object_data['emoji'],
-                position=(canvas_size // 2 - current_size // 2, canvas_size // 2 - current_size // 2),
-                size=current_size,
-                shadow=False
-            )
-
-            # Optional motion blur for fast zooms
-            if add_motion_blur and abs(scale - 1.0) > 0.5:
-                blur_amount = min(5, int(abs(scale - 1.0) * 3))
-                emoji_canvas = emoji_canvas.filter(ImageFilter.GaussianBlur(blur_amount))
-
-            # Crop to frame size centered
-            left = (canvas_size - frame_width) // 2
-            top = (canvas_size - frame_height) // 2
-            emoji_cropped = emoji_canvas.crop((left, top, left + frame_width, top + frame_height))
-
-            # Composite
-            frame_rgba = frame.convert('RGBA')
-            frame = Image.alpha_composite(frame_rgba, emoji_cropped)
-            frame = frame.convert('RGB')
-
-        elif object_type == 'text':
-            from core.typography import draw_text_with_outline
-
-            current_size = int(base_size * scale)
-            current_size = max(10, min(current_size, 500))
-
-            # Create oversized canvas for large text
-            canvas_size = max(frame_width, frame_height, current_size * 10)
-            text_canvas = Image.new('RGB', (canvas_size, canvas_size), bg_color)
-
-            draw_text_with_outline(
-                text_canvas,
-                text=object_data.get('text', 'ZOOM'),
-                position=(canvas_size // 2, canvas_size // 2),
-                font_size=current_size,
-                text_color=object_data.get('text_color', (0, 0, 0)),
-                outline_color=object_data.get('outline_color', (255, 255, 255)),
-                outline_width=max(2, int(current_size * 0.05)),
-                centered=True
-            )
-
-            # Crop to frame
-            left = (canvas_size - frame_width) // 2
-            top = (canvas_size - frame_height) // 2
-            frame = text_canvas.crop((left, top, left + frame_width, top + frame_height))
+    # Calculate the scale of every frame based on zoom type
+    if zoom_type == 'in':
+        scales = timeline(num_frames, easing, start_scale, end_scale)
+    elif zoom_type == 'out':
+        scales = timeline(num_frames, easing, end_scale, start_scale)
+    elif zoom_type == 'in_out':
+        scales = (Track(start_scale)
+                  .to(0.5, end_scale, easing)
+                  .to(1.0, start_scale, easing)
+                  .compile(num_frames))
+    elif zoom_type == 'punch':
+        # Quick zoom in with overshoot then settle
+        scales = (Track(start_scale)
+                  .to(0.3, end_scale * 1.2, 'ease_out')
+                  .to(1.0, end_scale, 'elastic_out')
+                  .compile(num_frames))
+    else:
+        scales = timeline(num_frames, easing, start_scale, end_scale)
+
+    sprite, sprite_size = None, None
+    if object_type == 'emoji':
+        # Rasterize once at the largest size reached; smaller frames blit
+        # cached mip-mapped copies
+        sprite_size = max(12, min(int(base_size * (float(scales.max()) if num_frames else end_scale)), frame_width * 2))
+        sprite = get_sprite_cache().emoji(object_data['emoji'], size=sprite_size, shadow=False)
+
+    ctx = {
+        'object_type': object_type,
+        'object_data': object_data,
+        'scales': scales,
+        'base_size': base_size,
+        'sprite': sprite,
+        'sprite_size': sprite_size,
+        'add_motion_blur': add_motion_blur,
+        'frame_width': frame_width,
+        'frame_height': frame_height,
+        'bg_color': bg_color,
+    }
+    return render_frames(_render_zoom_frame, num_frames, ctx, workers=workers, executor=executor)
+
+
+def _render_zoom_frame(i: int, t: float, ctx: dict) -> Image.Image:
+    """Render one zoom frame from precomputed values (see core.render)."""
+    object_type = ctx['object_type']
+    object_data = ctx['object_data']
+    scales = ctx['scales']
+    base_size = ctx['base_size']
+    sprite = ctx['sprite']
+    sprite_size = ctx['sprite_size']
+    add_motion_blur = ctx['add_motion_blur']
+    frame_width = ctx['frame_width']
+    frame_height = ctx['frame_height']
+    bg_color = ctx['bg_color']
+
+    scale = float(scales[i])
+
+    # Create frame
+    frame = create_blank_frame(frame_width, frame_height, bg_color)
+
+    if object_type == 'emoji':
+        current_size = int(base_size * scale)
+
+        # Clamp size to reasonable bounds
+        current_size = max(12, min(current_size, frame_width * 2))
+
+        # Emoji stays centered in the frame
+        tile, (offset_x, offset_y), _ = sprite.scaled(current_size / sprite_size)
+        x = frame_width // 2 - current_size // 2 + offset_x
+        y = frame_height // 2 - current_size // 2 + offset_y
+
+        # Optional motion blur for fast zooms (padded so the blur isn't clipped)
+        if add_motion_blur and abs(scale - 1.0) > 0.5:
+            blur_amount = min(5, int(abs(scale - 1.0) * 3))
+            pad = blur_amount * 3
+            tile = ImageOps.expand(tile, pad, fill=(0, 0, 0, 0))
+            tile = tile.filter(ImageFilter.GaussianBlur(blur_amount))
+            x, y = x - pad, y - pad
+
+        paste_tile(frame, tile, (x, y))
+
+    elif object_type == 'text':
+        from core.typography import draw_text_with_outline
+
+        current_size = int(base_size * scale)
+        current_size = max(10, min(current_size, 500))
+
+        # Create oversized canvas for large text
+        canvas_size = max(frame_width, frame_height, current_size * 10)
+        text_canvas = Image.new('RGB', (canvas_size, canvas_size), bg_color)
+
+        draw_text_with_outline(
+            text_canvas,
+            text=object_data.get('text', 'ZOOM'),
+            position=(canvas_size // 2, canvas_size // 2),
+            font_size=current_size,
+            text_color=object_data.get('text_color', (0, 0, 0)),
+            outline_color=object_data.get('outline_color', (255, 255, 255)),
+            outline_width=max(2, int(current_size * 0.05)),
+            centered=True
+        )
 
-        frames.append(frame)
+        # Crop to frame
+        left = (canvas_size - frame_width) // 2
+        top = (canvas_size - frame_height) // 2
+        frame = text_canvas.crop((left, top, left + frame_width, top + frame_height))
 
-    return frames
+    return frame
 
 
 def create_explosion_zoom(
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Core modules are imported as `core.*`, as the templates do
+sys.path.insert(0, str(Path(__file__).parent.parent))
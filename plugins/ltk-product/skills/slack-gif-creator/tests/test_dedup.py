@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from core.gif_builder import GIFBuilder, _frame_signature, _frame_similarity
+
+
+def _mean_abs_diff(a, b):
+    return np.abs(a.astype(np.int16) - b).mean()
+
+
+@pytest.mark.parametrize('height, width', [(80, 96), (7, 5), (481, 333), (64, 64), (1, 40)])
+def test_signature_distance_is_a_lower_bound(height, width):
+    rng = np.random.default_rng(height * 1000 + width)
+    for _ in range(5):
+        a = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+        b = np.clip(a + rng.integers(-60, 60, a.shape), 0, 255).astype(np.uint8)
+        # Concentrate a change in the edge pixels a cropped signature would miss
+        b[-1:, :] = 255 - b[-1:, :]
+        distance = np.abs(_frame_signature(a) - _frame_signature(b)).mean()
+        assert distance <= _mean_abs_diff(a, b) + 1e-9
+
+
+def test_signature_of_a_stack_matches_single_frames():
+    frames = np.random.default_rng(0).integers(0, 256, (4, 50, 70, 3), dtype=np.uint8)
+    stacked = _frame_signature(frames)
+    for frame, row in zip(frames, stacked):
+        np.testing.assert_allclose(_frame_signature(frame), row)
+
+
+def _reference_kept(frames, threshold):
+    kept = [0]
+    for i in range(1, len(frames)):
+        if _frame_similarity(frames[kept[-1]], frames[i]) < threshold:
+            kept.append(i)
+    return kept
+
+
+@pytest.mark.parametrize('threshold', [0.98, 0.99, 0.995])
+def test_deduplicate_matches_full_resolution_comparison(threshold):
+    rng = np.random.default_rng(7)
+    base = rng.integers(0, 256, (80, 96, 3), dtype=np.uint8)
+    frames = []
+    frame = base.copy()
+    for _ in range(40):
+        # Small drifts, occasionally a large local change confined to one corner
+        frame = np.clip(frame + rng.integers(-4, 5, frame.shape), 0, 255).astype(np.uint8)
+        if rng.random() < 0.2:
+            frame[-6:, -6:] = rng.integers(0, 256, (6, 6, 3))
+        frames.append(frame.copy())
+
+    builder = GIFBuilder(width=96, height=80, fps=10)
+    for frame in frames:
+        builder.add_frame(frame)
+    removed = builder.deduplicate_frames(threshold=threshold)
+
+    kept = _reference_kept(frames, threshold)
+    assert removed == len(frames) - len(kept)
+    assert [np.array_equal(a, frames[i]) for a, i in zip(builder.frames, kept)] == [True] * len(kept)
+
+
+def test_local_change_is_not_merged():
+    frame = np.full((64, 64, 3), 128, dtype=np.uint8)
+    changed = frame.copy()
+    # A checkerboard whose block means equal the flat frame's
+    changed[::2, ::2] = 255
+    changed[1::2, 1::2] = 255
+    changed[::2, 1::2] = 1
+    changed[1::2, ::2] = 1
+    assert np.abs(_frame_signature(frame) - _frame_signature(changed)).mean() < 1
+
+    builder = GIFBuilder(width=64, height=64, fps=10)
+    builder.add_frame(frame)
+    builder.add_frame(changed)
+    assert builder.deduplicate_frames(threshold=0.9) == 0
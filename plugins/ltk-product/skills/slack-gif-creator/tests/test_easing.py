@@ -0,0 +1,91 @@
+import math
+
+import numpy as np
+import pytest
+
+from core import easing
+from core.easing import EASING_FUNCTIONS, interpolate, progress, timeline
+
+
+# Scalar curves easing.py had before they took arrays
+def _old_out_bounce(t):
+    for limit, center, height in ((1 / 2.75, 0.0, 0.0), (2 / 2.75, 1.5 / 2.75, 0.75),
+                                  (2.5 / 2.75, 2.25 / 2.75, 0.9375)):
+        if t < limit:
+            return 7.5625 * (t - center) ** 2 + height
+    return 7.5625 * (t - 2.625 / 2.75) ** 2 + 0.984375
+
+
+def _old_in_out_elastic(t):
+    if t == 0 or t == 1:
+        return t
+    t = t * 2 - 1
+    if t < 0:
+        return -0.5 * math.pow(2, 10 * t) * math.sin((t - 0.1) * 5 * math.pi)
+    return math.pow(2, -10 * t) * math.sin((t - 0.1) * 5 * math.pi) * 0.5 + 1
+
+
+def _old_back_in_out(t):
+    c2 = 1.70158 * 1.525
+    if t < 0.5:
+        return (pow(2 * t, 2) * ((c2 + 1) * 2 * t - c2)) / 2
+    return (pow(2 * t - 2, 2) * ((c2 + 1) * (t * 2 - 2) + c2) + 2) / 2
+
+
+OLD_CURVES = {
+    'linear': lambda t: t,
+    'ease_in': lambda t: t * t,
+    'ease_out': lambda t: t * (2 - t),
+    'ease_in_out': lambda t: 2 * t * t if t < 0.5 else -1 + (4 - 2 * t) * t,
+    'bounce_in': lambda t: 1 - _old_out_bounce(1 - t),
+    'bounce_out': _old_out_bounce,
+    'bounce': lambda t: ((1 - _old_out_bounce(1 - t * 2)) * 0.5 if t < 0.5
+                         else _old_out_bounce(t * 2 - 1) * 0.5 + 0.5),
+    'elastic_in': lambda t: (t if t in (0, 1) else
+                             -math.pow(2, 10 * (t - 1)) * math.sin((t - 1.1) * 5 * math.pi)),
+    'elastic_out': lambda t: (t if t in (0, 1) else
+                              math.pow(2, -10 * t) * math.sin((t - 0.1) * 5 * math.pi) + 1),
+    'elastic': _old_in_out_elastic,
+    'back_in': lambda t: 2.70158 * t * t * t - 1.70158 * t * t,
+    'back_out': lambda t: 1 + 2.70158 * pow(t - 1, 3) + 1.70158 * pow(t - 1, 2),
+    'back_in_out': _old_back_in_out,
+}
+OLD_CURVES['anticipate'] = OLD_CURVES['back_in']
+OLD_CURVES['overshoot'] = OLD_CURVES['back_out']
+
+
+def test_every_named_curve_has_a_reference():
+    assert set(OLD_CURVES) == set(EASING_FUNCTIONS)
+
+
+@pytest.mark.parametrize('name', sorted(OLD_CURVES))
+@pytest.mark.parametrize('num_frames', [2, 17, 60])
+def test_timeline_matches_per_frame_interpolation(name, num_frames):
+    expected = [-20 + 70 * OLD_CURVES[name](i / (num_frames - 1)) for i in range(num_frames)]
+    np.testing.assert_allclose(timeline(num_frames, name, -20, 50), expected, rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize('func', [easing.ease_in_cubic, easing.ease_out_cubic,
+                                  easing.ease_in_out_cubic, easing.ease_back_in,
+                                  easing.ease_back_out, easing.ease_back_in_out])
+def test_array_input_matches_scalar_input(func):
+    t = np.linspace(0, 1, 41)
+    np.testing.assert_allclose(func(t), [func(float(value)) for value in t], rtol=0, atol=1e-12)
+
+
+def test_interpolate_accepts_arrays_and_scalars():
+    t = progress(9)
+    values = interpolate(10, 30, t, 'ease_out')
+    assert isinstance(values, np.ndarray)
+    assert list(values) == [interpolate(10, 30, float(value), 'ease_out') for value in t]
+    assert isinstance(interpolate(10, 30, 0.5, 'ease_out'), float)
+
+
+def test_timeline_takes_a_callable_and_shares_read_only_curves():
+    np.testing.assert_array_equal(timeline(5, easing.ease_in_cubic), progress(5) ** 3)
+    assert not progress(5).flags.writeable
+    assert timeline(1, 'ease_in', 3, 8).tolist() == [3.0]
+    # The cached curve is unaffected by what callers do with their result
+    values = timeline(6, 'bounce_out')
+    values[:] = 0
+    assert timeline(6, 'bounce_out')[-1] == pytest.approx(1.0)
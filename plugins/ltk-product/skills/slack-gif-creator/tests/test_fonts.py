@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+from core.fonts import BOLD_FONT_PATHS, TEXT_FONT_PATHS, FontRegistry
+from core.typography import get_font
+
+DEJAVU = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
+needs_dejavu = pytest.mark.skipif(not Path(DEJAVU).is_file(), reason='DejaVu Sans not installed')
+
+
+def _old_get_font(size, bold):
+    """Candidate loop get_font() used before the shared registry."""
+    for path in BOLD_FONT_PATHS if bold else TEXT_FONT_PATHS:
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+def _draw(font, text='Hey 42!'):
+    image = Image.new('L', (160, 60))
+    ImageDraw.Draw(image).text((4, 4), text, font=font, fill=255)
+    return np.asarray(image)
+
+
+@needs_dejavu
+def test_registry_evicts_least_recently_used_font():
+    registry = FontRegistry(max_fonts=2)
+    font10 = registry.get(DEJAVU, 10)
+    registry.get(DEJAVU, 20)
+    assert registry.get(DEJAVU, 10) is font10  # 20 is now least recently used
+    registry.get(DEJAVU, 30)
+
+    assert registry.stats()['fonts'] == 2
+    assert registry.get(DEJAVU, 10) is font10
+    assert registry.stats()['hits'] == 2 and registry.stats()['misses'] == 3
+    registry.get(DEJAVU, 20)
+    assert registry.stats()['misses'] == 4
+
+
+def test_failed_loads_are_cached(tmp_path):
+    broken = tmp_path / 'broken.ttf'
+    broken.write_bytes(b'not a font')
+    registry = FontRegistry()
+    for _ in range(3):
+        assert registry.get(str(broken), 12) is None
+        assert registry.get(str(tmp_path / 'missing.ttf'), 12) is None
+        assert registry.first((str(tmp_path / 'missing.ttf'), str(broken)), 12) is None
+
+    assert registry.stats()['failures'] == 1 and registry.stats()['misses'] == 2
+
+
+@pytest.mark.parametrize('bold', [False, True])
+@pytest.mark.parametrize('size', [14, 40])
+def test_shared_fonts_draw_like_freshly_loaded_ones(size, bold):
+    assert np.array_equal(_draw(get_font(size, bold=bold)), _draw(_old_get_font(size, bold)))
+    assert get_font(size, bold=bold) is get_font(size, bold=bold)
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from core.frame_composer import (_gradient_array, _vignette_mask, add_vignette,
+                                 create_gradient_background)
+
+
+def _reference_vignette(frame, strength):
+    """Per-pixel overlay and float multiply add_vignette used before the fixed-point mask."""
+    width, height = frame.size
+    center_x, center_y = width // 2, height // 2
+    max_dist = ((width / 2) ** 2 + (height / 2) ** 2) ** 0.5
+    overlay = np.zeros((height, width, 3), dtype=np.uint8)
+    for y in range(height):
+        for x in range(width):
+            dist = ((x - center_x) ** 2 + (y - center_y) ** 2) ** 0.5
+            overlay[y, x] = int(255 * (1 - min(1, (dist / max_dist) * strength)))
+    result = np.array(frame, dtype=np.float32) / 255 * (overlay.astype(np.float32) / 255)
+    return (result * 255).astype(np.uint8)
+
+
+def _reference_gradient(width, height, top_color, bottom_color):
+    """Row-by-row line drawing create_gradient_background used before NumPy."""
+    frame = Image.new('RGB', (width, height))
+    draw = ImageDraw.Draw(frame)
+    for y in range(height):
+        ratio = y / height
+        color = tuple(int(top * (1 - ratio) + bottom * ratio)
+                      for top, bottom in zip(top_color, bottom_color))
+        draw.line([(0, y), (width, y)], fill=color)
+    return np.asarray(frame)
+
+
+@pytest.mark.parametrize('strength', [0.0, 0.3, 0.5, 1.0])
+@pytest.mark.parametrize('size', [(64, 48), (31, 17)])
+def test_vignette_matches_float_multiply(strength, size):
+    frame = Image.fromarray(np.random.default_rng(size[0]).integers(
+        0, 256, (size[1], size[0], 3), dtype=np.uint8))
+    expected = _reference_vignette(frame, strength).astype(np.int16)
+    result = np.asarray(add_vignette(frame, strength)).astype(np.int16)
+    # 8.8 fixed point rounds where the float path truncated
+    assert np.abs(result - expected).max() <= 1
+    if strength == 0.0:
+        assert np.array_equal(result, np.asarray(frame))
+
+
+def test_vignette_mask_is_cached_and_read_only():
+    _vignette_mask.cache_clear()
+    frame = Image.new('RGB', (40, 30), (200, 100, 50))
+    first = add_vignette(frame, 0.5)
+    assert np.array_equal(np.asarray(add_vignette(frame, 0.5)), np.asarray(first))
+    assert _vignette_mask.cache_info().misses == 1
+    assert not _vignette_mask(40, 30, 0.5).flags.writeable
+    # The input frame is left alone
+    assert frame.getpixel((0, 0)) == (200, 100, 50)
+
+
+@pytest.mark.parametrize('size', [(60, 45), (7, 120)])
+def test_vertical_gradient_matches_line_drawing(size):
+    top, bottom = (250, 10, 120), (5, 200, 60)
+    expected = _reference_gradient(*size, top, bottom)
+    assert np.array_equal(np.asarray(create_gradient_background(*size, top, bottom)), expected)
+
+
+def test_gradient_directions_run_from_start_to_end_color():
+    start, end = (0, 0, 0), (200, 100, 240)
+    horizontal = np.asarray(create_gradient_background(50, 40, start, end, 'horizontal'))
+    assert (horizontal[0, 0] == start).all() and (horizontal == horizontal[:1]).all()
+    diagonal = np.asarray(create_gradient_background(50, 40, start, end, 'diagonal'))
+    assert (diagonal[0, 0] == start).all() and (diagonal[-1, -1] > diagonal[20, 25]).all()
+    radial = np.asarray(create_gradient_background(50, 40, start, end, 'radial'))
+    assert (radial[20, 25] == start).all() and (radial[0, 0] >= radial[10, 12]).all()
+    with pytest.raises(ValueError):
+        create_gradient_background(50, 40, start, end, 'spiral')
+
+
+def test_cached_gradient_is_not_shared_with_callers():
+    _gradient_array.cache_clear()
+    first = create_gradient_background(30, 20, [255, 0, 0], [0, 0, 255])
+    first.paste((0, 255, 0), (0, 0, 30, 20))
+    second = create_gradient_background(30, 20, (255, 0, 0), (0, 0, 255))
+
+    assert _gradient_array.cache_info().misses == 1
+    assert second.getpixel((0, 0)) == (255, 0, 0)
+    assert not _gradient_array(30, 20, (255, 0, 0), (0, 0, 255), 'vertical').flags.writeable
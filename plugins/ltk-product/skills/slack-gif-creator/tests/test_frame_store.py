@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from core.frame_store import ArrayFrameStore, FrameStore, MemmapFrameStore, MemoryFrameStore
+from core.gif_builder import GIFBuilder
+
+
+def test_incomplete_store_fails_on_creation():
+    class ListStore(FrameStore):
+        def __init__(self):
+            self.frames = []
+
+        def __len__(self):
+            return len(self.frames)
+
+        def __getitem__(self, index):
+            return self.frames[index]
+
+        def append(self, frame):
+            self.frames.append(frame)
+
+    with pytest.raises(TypeError):
+        ListStore()
+
+
+def test_memory_store_keeps_selected_frames():
+    store = MemoryFrameStore()
+    for value in range(5):
+        store.append(np.full((2, 2, 3), value, dtype=np.uint8))
+    store.keep([0, 2, 4])
+    assert [int(frame[0, 0, 0]) for frame in store] == [0, 2, 4]
+
+
+def test_memmap_store_at_explicit_path_stays_next_to_it(tmp_path):
+    path = tmp_path / 'render.frames'
+    builder = GIFBuilder(width=200, height=200, frame_store=MemmapFrameStore(path))
+    for value in range(4):
+        builder.add_frame(np.full((200, 200, 3), value * 60, dtype=np.uint8))
+
+    builder.save(tmp_path / 'out.gif', optimize_for_emoji=True, remove_duplicates=False)
+
+    # The 128x128 frames moved to the sibling file, and a second rebuild moves them back
+    assert builder.frames.path == tmp_path / 'render.frames.swap'
+    assert builder.frames.as_array().shape == (4, 128, 128, 3)
+    builder.frames = builder.frames[::2]
+    assert builder.frames.path == path
+    assert len(builder.frames) == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        'out.gif', 'render.frames', 'render.frames.swap']
+
+
+def _frames(count, shape=(6, 5, 3)):
+    return [np.full(shape, value * 20, dtype=np.uint8) + np.arange(shape[1], dtype=np.uint8)[:, None]
+            for value in range(count)]
+
+
+def test_array_store_grows_geometrically_and_matches_a_list():
+    store, reference = ArrayFrameStore(capacity=2), MemoryFrameStore()
+    capacities = []
+    for frame in _frames(9):
+        store.append(frame)
+        reference.append(frame)
+        capacities.append(store.capacity)
+
+    assert capacities == [2, 2, 4, 4, 8, 8, 8, 8, 16]
+    assert store.as_array().flags['C_CONTIGUOUS'] and store.as_array().shape == (9, 6, 5, 3)
+    assert all(np.array_equal(a, b) for a, b in zip(store, reference))
+
+    store.keep([0, 3, 4, 8])
+    reference.keep([0, 3, 4, 8])
+    assert len(store) == 4
+    assert all(np.array_equal(a, b) for a, b in zip(store, reference))
+
+
+def test_array_store_rejects_a_different_frame_shape():
+    store = ArrayFrameStore(capacity=2)
+    store.append(_frames(1)[0])
+    with pytest.raises(ValueError):
+        store.append(np.zeros((5, 6, 3), dtype=np.uint8))
+
+
+def test_new_frame_draws_into_the_store(tmp_path):
+    drawn = GIFBuilder(width=20, height=16, fps=10, expected_frames=2)
+    added = GIFBuilder(width=20, height=16, fps=10)
+    for i in range(5):
+        frame = drawn.new_frame(bg_color=(255, 255, 255))
+        frame[2:8, i * 3:i * 3 + 4] = (200, 0, 0)
+        assert np.shares_memory(frame, drawn.frames.as_array())
+
+        # The old path: draw into a PIL image, then add it
+        image = Image.new('RGB', (20, 16), (255, 255, 255))
+        image.paste((200, 0, 0), (i * 3, 2, i * 3 + 4, 8))
+        added.add_frame(image)
+
+    assert drawn.durations == added.durations
+    drawn.save(tmp_path / 'drawn.gif', remove_duplicates=False)
+    added.save(tmp_path / 'added.gif', remove_duplicates=False)
+    assert (tmp_path / 'drawn.gif').read_bytes() == (tmp_path / 'added.gif').read_bytes()
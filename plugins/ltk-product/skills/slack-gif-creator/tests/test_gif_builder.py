@@ -0,0 +1,114 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from core.gif_builder import GIFBuilder, HeldFrame, _group_durations
+
+
+def _builder(num_frames=8, width=48, height=40, fps=10):
+    rng = np.random.default_rng(num_frames)
+    builder = GIFBuilder(width=width, height=height, fps=fps)
+    y, x = np.mgrid[0:height, 0:width]
+    for i in range(num_frames):
+        frame = np.stack([(x * 5 + i * 9) % 256, (y * 6) % 256,
+                          np.full_like(x, i * 30 % 256)], axis=-1).astype(np.uint8)
+        frame[5:15, 5 + i * 4:15 + i * 4] = rng.integers(0, 256, 3)
+        builder.add_frame(frame)
+    return builder
+
+
+def _played(path):
+    """Displayed RGB frames of a GIF, one per 10 ms of its duration."""
+    shown = []
+    with Image.open(path) as gif:
+        for i in range(gif.n_frames):
+            gif.seek(i)
+            frame = np.asarray(gif.convert('RGB'))
+            shown.extend([frame] * (gif.info['duration'] // 10))
+    return shown
+
+
+@pytest.mark.parametrize('dither', [True, False])
+def test_parallel_quantize_matches_serial(dither):
+    builder = _builder()
+    serial, palette = builder.quantize_frames(32, dither=dither)
+
+    with ThreadPoolExecutor(3) as threads, ProcessPoolExecutor(2) as processes:
+        for options in ({'workers': 3}, {'executor': threads}, {'executor': processes}):
+            indexed, parallel_palette = builder.quantize_frames(32, dither=dither, **options)
+            assert np.array_equal(parallel_palette.colors, palette.colors)
+            assert all(np.array_equal(a, b) for a, b in zip(indexed, serial))
+            assert len(indexed) == len(serial)
+
+
+def test_parallel_per_frame_palettes_match_serial():
+    builder = _builder()
+    serial = builder.optimize_colors(16, use_global_palette=False)
+    parallel = builder.optimize_colors(16, use_global_palette=False, workers=4)
+    assert all(np.array_equal(a, b) for a, b in zip(parallel, serial))
+
+
+def test_parallel_save_writes_the_same_file(tmp_path):
+    _builder().save(tmp_path / 'serial.gif', num_colors=32)
+    _builder().save(tmp_path / 'parallel.gif', num_colors=32, workers=3)
+    assert (tmp_path / 'parallel.gif').read_bytes() == (tmp_path / 'serial.gif').read_bytes()
+
+
+@pytest.mark.parametrize('keep_every', [1, 2, 3, 4])
+def test_grouped_durations_cover_the_dropped_frames(keep_every):
+    durations = [100, 50, 50, 200, 100, 80, 70, 30, 120, 100]
+    grouped = _group_durations(durations, keep_every)
+    assert len(grouped) == len(range(0, len(durations), keep_every))
+    assert sum(grouped) == sum(durations)
+    assert grouped[0] == sum(durations[:keep_every])
+
+
+def _flat_frames():
+    """Two frames of a few flat colors, which any palette reproduces exactly."""
+    first = np.full((40, 48, 3), (255, 255, 255), dtype=np.uint8)
+    first[5:15, 5:15] = (200, 30, 30)
+    second = first.copy()
+    second[20:30, 20:40] = (10, 120, 240)
+    return first, second
+
+
+def test_held_frame_plays_like_repeated_frames(tmp_path):
+    first, second = _flat_frames()
+    held = GIFBuilder(width=48, height=40, fps=10)
+    held.add_frames([first, HeldFrame(second, 3), first])
+    held.hold(200)
+    repeated = GIFBuilder(width=48, height=40, fps=10)
+    repeated.add_frames([first, second, second, second, first, first, first])
+
+    held_info = held.save(tmp_path / 'held.gif', remove_duplicates=False, dither=False)
+    repeated.save(tmp_path / 'repeated.gif', remove_duplicates=False, dither=False)
+
+    assert held_info['frame_count'] == 3
+    assert held.durations == [100, 300, 300]
+    old, new = _played(tmp_path / 'repeated.gif'), _played(tmp_path / 'held.gif')
+    assert len(new) == len(old) == 70
+    assert all(np.array_equal(a, b) for a, b in zip(new, old))
+    assert np.array_equal(new[0], first) and np.array_equal(new[10], second)
+
+
+def test_removed_duplicates_keep_their_time(tmp_path):
+    first, second = _flat_frames()
+    builder = GIFBuilder(width=48, height=40, fps=10)
+    builder.add_frames([first, first, first, second, second])
+    info = builder.save(tmp_path / 'clip.gif', dither=False)
+
+    assert info['frame_count'] == 2 and info['duration_seconds'] == pytest.approx(0.5)
+    assert builder.durations == [300, 200]
+    assert len(_played(tmp_path / 'clip.gif')) == 50
+
+
+def test_emoji_decimation_keeps_playback_time(tmp_path):
+    builder = _builder(num_frames=30, fps=15)
+    info = builder.save(tmp_path / 'emoji.gif', optimize_for_emoji=True, remove_duplicates=False)
+
+    # Keeping every other frame at a fixed 1000/fps used to halve the playback time
+    assert info['frame_count'] == 15
+    assert info['duration_seconds'] == pytest.approx(2.0)
+    assert len(_played(tmp_path / 'emoji.gif')) == 200
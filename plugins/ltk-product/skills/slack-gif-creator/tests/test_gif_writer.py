@@ -0,0 +1,287 @@
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from core.gif_builder import GIFBuilder
+from core.gif_writer import GIFWriter, changed_bbox
+
+PALETTE = np.array([[255, 255, 255], [0, 0, 0], [255, 0, 0], [0, 0, 255]], dtype=np.uint8)
+
+
+def _clip(num_frames=6, width=40, height=30):
+    """Index frames of a square moving over a static pattern."""
+    base = np.zeros((height, width), dtype=np.uint8)
+    base[::4, :] = 3
+    frames = []
+    for i in range(num_frames):
+        frame = base.copy()
+        frame[5:15, 3 + i * 5:13 + i * 5] = 2
+        frame[20:25, 30:35] = 1 if i % 2 else 0
+        frames.append(frame)
+    return frames
+
+
+def _decode(data):
+    """Displayed RGB frames and per-frame info of a GIF."""
+    frames, infos = [], []
+    with Image.open(io.BytesIO(data)) as gif:
+        for i in range(gif.n_frames):
+            gif.seek(i)
+            # The tile (the frame's encoded region) is cleared once the frame loads
+            infos.append({**gif.info, 'disposal': gif.disposal_method, 'box': gif.tile[0][1]})
+            frames.append(np.asarray(gif.convert('RGB')))
+    return frames, infos
+
+
+def _transparent_indices(data):
+    """Transparent index per frame from its graphic control extension (None if unset)."""
+    indices, start = [], 0
+    while (start := data.find(b'\x21\xf9\x04', start) + 1):
+        packed, index = data[start + 2], data[start + 5]
+        indices.append(index if packed & 1 else None)
+    return indices
+
+
+def _write(frames, durations, **options):
+    output = io.BytesIO()
+    with GIFWriter(output, frames[0].shape[1], frames[0].shape[0], PALETTE, **options) as writer:
+        for indices, duration in zip(frames, durations):
+            writer.write_frame(indices, duration)
+    return output.getvalue(), writer
+
+
+@pytest.mark.parametrize('options', [
+    {'crop_unchanged': False},
+    {'crop_unchanged': True},
+    {'crop_unchanged': True, 'transparency': True},
+    {'crop_unchanged': True, 'transparency': True, 'optimize_disposal': True},
+])
+def test_round_trip_frames_and_durations(options):
+    frames = _clip()
+    data, writer = _write(frames, [100, 50, 50, 200, 100, 100], **options)
+    decoded, infos = _decode(data)
+
+    assert writer.frame_count == len(decoded) == len(frames)
+    assert writer.bytes_written == len(data)
+    for indices, shown in zip(frames, decoded):
+        assert np.array_equal(shown, PALETTE[indices])
+    assert [info['duration'] for info in infos] == [100, 50, 50, 200, 100, 100]
+    assert infos[0]['loop'] == 0
+
+
+def test_durations_carry_rounding_to_keep_total_time():
+    frames = _clip(num_frames=6)
+    data, _ = _write(frames, [1000 / 30] * 6)
+    durations = [info['duration'] for info in _decode(data)[1]]
+    assert all(duration % 10 == 0 for duration in durations)
+    assert sum(durations) == 200
+    assert max(durations) - min(durations) == 10
+
+
+def test_delta_frames_crop_to_the_changed_box():
+    frames = _clip()
+    data, _ = _write(frames, [100] * len(frames))
+    _, infos = _decode(data)
+
+    assert infos[0]['box'] == (0, 0, 40, 30)
+    for previous, current, info in zip(frames, frames[1:], infos[1:]):
+        assert info['box'] == changed_bbox(previous, current)
+
+    full, _ = _write(frames, [100] * len(frames), crop_unchanged=False)
+    assert len(data) < len(full)
+
+
+def test_unchanged_pixels_in_the_box_are_transparent():
+    # Changes in opposite corners make the box cover a noisy area that did not change
+    noise = np.random.default_rng(0).integers(0, len(PALETTE), (30, 40), dtype=np.uint8)
+    moved = noise.copy()
+    moved[:2, :2] = moved[-2:, -2:] = 2
+    frames = [noise, moved]
+    data, writer = _write(frames, [100, 100], transparency=True)
+    decoded, infos = _decode(data)
+
+    assert writer.transparent_index == len(PALETTE)
+    assert infos[1]['box'] == (0, 0, 40, 30)
+    assert _transparent_indices(data) == [None, writer.transparent_index]
+    assert np.array_equal(decoded[1], PALETTE[moved])
+    assert len(data) < len(_write(frames, [100, 100])[0])
+
+
+def test_optimize_disposal_restores_for_a_flash():
+    # A mark that appears for one frame is cheapest to undo by restoring the canvas
+    base = np.zeros((30, 40), dtype=np.uint8)
+    flash = base.copy()
+    flash[10:20, 10:30] = 2
+    frames = [base, flash, base, base]
+    data, _ = _write(frames, [100] * 4, optimize_disposal=True)
+    decoded, infos = _decode(data)
+
+    assert infos[1]['disposal'] == 3
+    assert all(np.array_equal(shown, PALETTE[indices]) for indices, shown in zip(frames, decoded))
+
+
+def test_palette_leaves_room_for_transparency():
+    with pytest.raises(ValueError):
+        GIFWriter(io.BytesIO(), 4, 4, np.zeros((0, 3), dtype=np.uint8))
+    full = np.repeat(np.arange(256, dtype=np.uint8)[:, None], 3, axis=1)
+    writer = GIFWriter(io.BytesIO(), 4, 4, full, transparency=True)
+    assert writer.transparent_index is None
+    writer.close()
+
+
+@pytest.mark.parametrize('delta_frames', [True, False])
+def test_builder_save_round_trip(tmp_path, delta_frames):
+    rng = np.random.default_rng(0)
+    colors = rng.integers(0, 256, (5, 3), dtype=np.uint8)
+    builder = GIFBuilder(width=40, height=30, fps=10)
+    for indices in _clip(num_frames=5):
+        builder.add_frame(Image.fromarray(colors[indices]))
+    indexed, palette = builder.quantize_frames(64, dither=False)
+
+    info = builder.save(tmp_path / 'clip.gif', num_colors=64, dither=False,
+                        remove_duplicates=False, delta_frames=delta_frames)
+    decoded, infos = _decode((tmp_path / 'clip.gif').read_bytes())
+
+    assert info['frame_count'] == len(decoded) == 5
+    assert [frame_info['duration'] for frame_info in infos] == [100] * 5
+    for indices, shown in zip(indexed, decoded):
+        assert np.array_equal(shown, palette.to_rgb(indices))
+    # Frames after the first are cropped to what changed, with or without delta frames
+    assert infos[0]['box'] == (0, 0, 40, 30)
+    assert all(frame_info['box'] != (0, 0, 40, 30) for frame_info in infos[1:])
+
+
+def test_plain_frames_are_no_larger_than_pillow(tmp_path):
+    rng = np.random.default_rng(0)
+    colors = rng.integers(0, 256, (5, 3), dtype=np.uint8)
+    builder = GIFBuilder(width=40, height=30, fps=10)
+    for indices in _clip(num_frames=6):
+        builder.add_frame(Image.fromarray(colors[indices]))
+    indexed, palette = builder.quantize_frames(64, dither=False)
+
+    builder.save(tmp_path / 'clip.gif', num_colors=64, dither=False,
+                 remove_duplicates=False, delta_frames=False)
+
+    # The same indexed frames through Pillow's own GIF encoder (the old save path)
+    images = []
+    for indices in indexed:
+        image = Image.fromarray(indices, mode='P')
+        image.putpalette(palette.colors.tobytes())
+        images.append(image)
+    reference = io.BytesIO()
+    images[0].save(reference, format='GIF', save_all=True, append_images=images[1:],
+                   duration=100, loop=0)
+
+    assert (tmp_path / 'clip.gif').stat().st_size <= len(reference.getvalue())
+
+
+@pytest.mark.parametrize('dither', [True, False])
+def test_size_search_keeps_the_dither_setting(tmp_path, dither):
+    # A smooth gradient is where dithering would otherwise be worth trying
+    ramp = np.linspace(0, 255, 64, dtype=np.uint8)
+    builder = GIFBuilder(width=64, height=32, fps=10)
+    for shift in range(4):
+        frame = np.zeros((32, 64, 3), dtype=np.uint8)
+        frame[..., 0] = np.roll(ramp, shift * 8)[None, :]
+        frame[..., 2] = 255 - frame[..., 0]
+        builder.add_frame(frame)
+
+    info = builder.save(tmp_path / 'clip.gif', num_colors=64, dither=dither,
+                        remove_duplicates=False, target_kb=1000)
+
+    assert info['search']['chosen']['dither'] is dither
+    assert all(attempt['dither'] is dither for attempt in info['search']['iterations'])
+
+
+def _stream_frames(num_frames=5):
+    colors = np.random.default_rng(0).integers(0, 256, (5, 3), dtype=np.uint8)
+    return [colors[indices] for indices in _clip(num_frames=num_frames)]
+
+
+@pytest.mark.parametrize('delta_frames', [True, False])
+def test_stream_round_trip_with_a_sample_longer_than_the_clip(tmp_path, delta_frames):
+    frames = _stream_frames(num_frames=3)
+    builder = GIFBuilder(width=40, height=30, fps=10)
+    with builder.open_stream(tmp_path / 'clip.gif', num_colors=64, palette_sample=8,
+                             dither=False, delta_frames=delta_frames) as stream:
+        for frame in frames:
+            stream.add_frame(frame)
+    decoded, infos = _decode((tmp_path / 'clip.gif').read_bytes())
+
+    assert stream.info['frame_count'] == len(decoded) == 3
+    assert [info['duration'] for info in infos] == [100] * 3
+    for frame, shown in zip(frames, decoded):
+        assert np.array_equal(shown, frame)
+
+
+@pytest.mark.parametrize('palette_sample', [1, 8])
+def test_stream_folds_duplicates_and_holds_into_durations(tmp_path, palette_sample):
+    first, second = _stream_frames(num_frames=2)
+    builder = GIFBuilder(width=40, height=30, fps=10)
+    with builder.open_stream(tmp_path / 'clip.gif', palette_sample=palette_sample,
+                             dither=False) as stream:
+        stream.add_frame(first)
+        stream.add_frame(first.copy())
+        stream.hold(150)
+        stream.add_frame(second)
+        stream.hold(250)
+    decoded, infos = _decode((tmp_path / 'clip.gif').read_bytes())
+
+    assert stream.info['frame_count'] == len(decoded) == 2
+    assert [info['duration'] for info in infos] == [350, 350]
+    assert stream.info['duration_seconds'] == pytest.approx(0.7)
+    assert np.array_equal(decoded[0], first)
+    # With a one-frame sample the palette may lack the second frame's new colors
+    assert np.array_equal(decoded[1], second) or palette_sample == 1
+    assert not np.array_equal(decoded[1], decoded[0])
+
+
+def test_stream_hold_needs_a_frame(tmp_path):
+    stream = GIFBuilder(width=40, height=30).open_stream(tmp_path / 'clip.gif')
+    with pytest.raises(ValueError):
+        stream.hold(100)
+
+
+def test_stream_keeps_total_time_under_centisecond_rounding(tmp_path):
+    frames = _stream_frames(num_frames=7)
+    builder = GIFBuilder(width=40, height=30, fps=30)
+    with builder.open_stream(tmp_path / 'clip.gif', palette_sample=3) as stream:
+        stream.add_frames(frames)
+    durations = [info['duration'] for info in _decode((tmp_path / 'clip.gif').read_bytes())[1]]
+
+    assert len(durations) == 7
+    assert all(duration % 10 == 0 for duration in durations)
+    assert sum(durations) == round(7 * 1000 / 30, -1)
+
+
+@pytest.mark.parametrize('num_frames', [2, 6])
+def test_stream_error_in_block_leaves_no_file(tmp_path, num_frames):
+    builder = GIFBuilder(width=40, height=30, fps=10)
+    with pytest.raises(RuntimeError):
+        with builder.open_stream(tmp_path / 'clip.gif', palette_sample=4) as stream:
+            stream.add_frames(_stream_frames(num_frames=num_frames))
+            raise RuntimeError('render failed')
+
+    assert not (tmp_path / 'clip.gif').exists()
+    assert stream._writer is None or stream._writer.closed
+    with pytest.raises(ValueError):
+        stream.add_frame(_stream_frames(num_frames=1)[0])
+
+
+def test_stream_error_in_close_releases_the_file(tmp_path):
+    builder = GIFBuilder(width=40, height=30, fps=10)
+    stream = builder.open_stream(tmp_path / 'clip.gif', palette_sample=1)
+    stream.add_frames(_stream_frames(num_frames=3))
+    writer = stream._writer
+
+    def fail(*args):
+        raise OSError('disk full')
+
+    writer.write_frame = fail
+    with pytest.raises(OSError):
+        stream.close()
+
+    assert writer.closed and writer._fp.closed
+    assert not (tmp_path / 'clip.gif').exists()
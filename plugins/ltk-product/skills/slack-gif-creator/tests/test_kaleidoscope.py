@@ -0,0 +1,95 @@
+import itertools
+import math
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from templates.kaleidoscope import (_kaleidoscope_map, apply_kaleidoscope,
+                                    create_kaleidoscope_animation)
+
+
+def _reference_kaleidoscope(frame, segments, center, nudge=(0.0, 0.0)):
+    """
+    Per-pixel loop apply_kaleidoscope used before the precomputed source map.
+
+    nudge shifts (x, y) source coordinates before truncation, to model last-bit
+    differences between math and NumPy trig on coordinates that land exactly
+    on a pixel edge.
+    """
+    width, height = frame.size
+    center_x, center_y = center
+    angle_per_segment = 360 / segments
+    frame_array = np.array(frame)
+    output_array = np.zeros_like(frame_array)
+    for y in range(height):
+        for x in range(width):
+            dx, dy = x - center_x, y - center_y
+            angle = (math.degrees(math.atan2(dy, dx)) + 180) % 360
+            distance = math.sqrt(dx * dx + dy * dy)
+            segment = int(angle / angle_per_segment)
+            segment_angle = angle % angle_per_segment
+            if segment % 2 == 1:
+                segment_angle = angle_per_segment - segment_angle
+            source_angle = segment_angle + (segment // 2) * angle_per_segment * 2
+            source_angle_rad = math.radians(source_angle - 180)
+            source_x = int(center_x + distance * math.cos(source_angle_rad) + nudge[0])
+            source_y = int(center_y + distance * math.sin(source_angle_rad) + nudge[1])
+            if 0 <= source_x < width and 0 <= source_y < height:
+                output_array[y, x] = frame_array[source_y, source_x]
+            else:
+                output_array[y, x] = frame_array[y, x]
+    return output_array
+
+
+def _pattern(width=90, height=70):
+    base = Image.new('RGB', (width, height), (255, 255, 255))
+    draw = ImageDraw.Draw(base)
+    for i, color in enumerate([(220, 40, 40), (40, 160, 60), (30, 60, 220)]):
+        x = width // 2 + int(25 * math.cos(i * 2 * math.pi / 3))
+        y = height // 2 + int(25 * math.sin(i * 2 * math.pi / 3))
+        draw.ellipse([x - 12, y - 12, x + 12, y + 12], fill=color)
+    return base
+
+
+@pytest.mark.parametrize('segments', [4, 6, 8, 12])
+@pytest.mark.parametrize('center', [None, (20, 50)])
+def test_kaleidoscope_matches_per_pixel_loop(segments, center):
+    frame = Image.fromarray(np.random.default_rng(segments).integers(
+        0, 256, (37, 53, 3), dtype=np.uint8))
+    center = center or (53 // 2, 37 // 2)
+    output = np.asarray(apply_kaleidoscope(frame, segments, center))
+
+    old = _reference_kaleidoscope(frame, segments, center)
+    same = (output == old).all(axis=-1)
+    assert same.mean() > 0.95
+    # The rest are pixels whose source lands exactly on a pixel edge
+    for nudge in itertools.product((-1e-9, 0.0, 1e-9), repeat=2):
+        same |= (output == _reference_kaleidoscope(frame, segments, center, nudge)).all(axis=-1)
+    assert same.all()
+
+
+def test_source_map_is_computed_once_per_geometry():
+    _kaleidoscope_map.cache_clear()
+    frame = _pattern()
+    for _ in range(3):
+        apply_kaleidoscope(frame, segments=6)
+    assert _kaleidoscope_map.cache_info().misses == 1
+    assert not _kaleidoscope_map(90, 70, 6, (45, 35)).flags.writeable
+
+
+def test_rotation_through_the_polar_grid_tracks_rotate_then_map():
+    base = _pattern()
+    frames = create_kaleidoscope_animation(base, num_frames=6, segments=6)
+    for i, frame in enumerate(frames):
+        # The old path rotated the base frame, then remapped it
+        rotated = base.rotate(i / 6 * 360, resample=Image.NEAREST)
+        old = np.asarray(apply_kaleidoscope(rotated, segments=6))
+        # Sampling once instead of twice only moves pixels along shape edges
+        assert (np.asarray(frame) != old).any(axis=-1).mean() < 0.06
+
+
+def test_pooled_animation_matches_serial():
+    serial = create_kaleidoscope_animation(_pattern(), num_frames=5, segments=8)
+    pooled = create_kaleidoscope_animation(_pattern(), num_frames=5, segments=8, workers=2)
+    assert all(np.array_equal(np.asarray(a), np.asarray(b)) for a, b in zip(serial, pooled))
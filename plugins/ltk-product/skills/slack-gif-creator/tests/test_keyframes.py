@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from core.easing import interpolate, progress
+from core.keyframes import Track, compile_tracks
+
+
+def heartbeat_scale(t, pulses, low, high):
+    """Per-frame heartbeat logic pulse.py used before keyframe tracks."""
+    phase = (t * pulses) % 1.0
+    if phase < 0.15:
+        return interpolate(low, high, phase / 0.15, 'ease_out')
+    if phase < 0.25:
+        return interpolate(high, low, (phase - 0.15) / 0.10, 'ease_in')
+    if phase < 0.35:
+        return interpolate(low, (low + high) / 2, (phase - 0.25) / 0.10, 'ease_out')
+    if phase < 0.45:
+        return interpolate((low + high) / 2, low, (phase - 0.35) / 0.10, 'ease_in')
+    return low
+
+
+def pop_scale(t, pulses, low, high):
+    """Per-frame pop logic pulse.py used before keyframe tracks."""
+    phase = (t * pulses) % 1.0
+    if phase < 0.3:
+        return interpolate(low, high * 1.1, phase / 0.3, 'elastic_out')
+    return interpolate(high * 1.1, low, (phase - 0.3) / 0.7, 'ease_out')
+
+
+@pytest.mark.parametrize('num_frames, pulses', [(30, 2), (47, 3), (12, 1)])
+def test_heartbeat_track_matches_phase_logic(num_frames, pulses):
+    track = (Track(0.9, cycles=pulses)
+             .to(0.15, 1.2, 'ease_out')
+             .to(0.25, 0.9, 'ease_in')
+             .to(0.35, 1.05, 'ease_out')
+             .to(0.45, 0.9, 'ease_in'))
+    expected = [heartbeat_scale(i / (num_frames - 1), pulses, 0.9, 1.2) for i in range(num_frames)]
+    np.testing.assert_allclose(track.compile(num_frames), expected, rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize('num_frames, pulses', [(30, 2), (41, 1)])
+def test_pop_track_matches_phase_logic(num_frames, pulses):
+    track = (Track(0.8, cycles=pulses)
+             .to(0.3, 1.3 * 1.1, 'elastic_out')
+             .to(1.0, 0.8, 'ease_out'))
+    expected = [pop_scale(i / (num_frames - 1), pulses, 0.8, 1.3) for i in range(num_frames)]
+    np.testing.assert_allclose(track.compile(num_frames), expected, rtol=0, atol=1e-12)
+
+
+def test_hold_and_jump():
+    track = Track(0.0).to(0.5, 1.0).hold(0.75).to(0.75, 3.0)
+    values = track.evaluate(np.array([0.0, 0.25, 0.6, 0.74, 0.75, 1.0]))
+    np.testing.assert_allclose(values, [0.0, 0.5, 1.0, 1.0, 3.0, 3.0])
+
+
+def test_keyframes_must_be_in_order():
+    with pytest.raises(ValueError):
+        Track(0.0).to(0.5, 1.0).to(0.4, 2.0)
+
+
+def test_compile_tracks_includes_progress_and_constants():
+    tracks = compile_tracks(5, scale=Track(1.0).to(1.0, 2.0), opacity=0.5)
+    np.testing.assert_array_equal(tracks['t'], progress(5))
+    np.testing.assert_allclose(tracks['scale'], [1.0, 1.25, 1.5, 1.75, 2.0])
+    np.testing.assert_array_equal(tracks['opacity'], np.full(5, 0.5))
+
+
+@pytest.mark.parametrize('num_frames', [30, 7, 11])
+@pytest.mark.parametrize('switch', [0.15, 0.2, 0.7])
+def test_stepped_track_matches_phase_threshold(num_frames, switch):
+    # The `if t < switch` phase tests explode.py used before keyframe tracks
+    intact = Track(1.0).hold(switch).to(switch, 0.0).compile(num_frames)
+    expected = [1.0 if i / (num_frames - 1) < switch else 0.0 for i in range(num_frames)]
+    np.testing.assert_array_equal(intact, expected)
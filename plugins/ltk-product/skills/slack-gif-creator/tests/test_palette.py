@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from core.palette import ColorHistogram, Palette, _bin_centers
+
+
+def _scene(seed=0, num_frames=6, height=48, width=64):
+    """Frames of a gradient background with a few moving flat-colored shapes."""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:height, 0:width]
+    background = np.stack([x * 255 // (width - 1), y * 255 // (height - 1),
+                           np.full_like(x, 90)], axis=-1).astype(np.uint8)
+    colors = rng.integers(0, 256, (3, 3), dtype=np.uint8)
+    frames = []
+    for i in range(num_frames):
+        frame = background.copy()
+        for j, color in enumerate(colors):
+            top, left = 4 + j * 14, (i * 7 + j * 19) % (width - 12)
+            frame[top:top + 10, left:left + 12] = color
+        frames.append(frame)
+    return frames
+
+
+def _old_palette_error(frames, num_colors):
+    """Mean error of the PIL path optimize_colors used before the histogram palette."""
+    pixels = np.vstack([frame.reshape(-1, 3) for frame in frames])
+    combined = Image.fromarray(pixels.reshape(len(frames) * frames[0].shape[0], -1, 3))
+    palette = combined.quantize(colors=num_colors, method=2)
+    errors = [np.abs(np.asarray(Image.fromarray(frame).quantize(palette=palette, dither=0)
+                                .convert('RGB')).astype(np.int16) - frame).mean()
+              for frame in frames]
+    return float(np.mean(errors))
+
+
+def test_few_colors_round_trip_exactly():
+    colors = np.array([[255, 255, 255], [0, 0, 0], [200, 30, 30], [10, 120, 240],
+                       [90, 90, 90], [250, 200, 0]], dtype=np.uint8)
+    indices = np.random.default_rng(1).integers(0, len(colors), (30, 40))
+    frame = colors[indices]
+
+    palette = ColorHistogram.from_frames([frame]).palette(16)
+    assert len(palette) == len(colors)
+    assert np.array_equal(palette.to_rgb(palette.quantize(frame)), frame)
+
+
+def test_lut_picks_the_nearest_color_to_each_bin():
+    rng = np.random.default_rng(2)
+    palette = Palette(rng.integers(0, 256, (40, 3), dtype=np.uint8))
+    frame = rng.integers(0, 256, (32, 32, 3), dtype=np.uint8)
+
+    centers = _bin_centers()[((frame[..., 0] >> 3).astype(int) << 10)
+                             | ((frame[..., 1] >> 3).astype(int) << 5)
+                             | (frame[..., 2] >> 3)].reshape(-1, 3).astype(np.float64)
+    distances = ((centers[:, None, :] - palette.colors[None].astype(np.float64)) ** 2).sum(axis=-1)
+    chosen = palette.quantize(frame).ravel()
+    np.testing.assert_allclose(distances[np.arange(len(chosen)), chosen],
+                               distances.min(axis=1), rtol=1e-6)
+
+
+@pytest.mark.parametrize('num_colors', [16, 64])
+def test_palette_is_no_worse_than_the_old_pil_path(num_colors):
+    frames = _scene()
+    palette = ColorHistogram.from_frames(frames).palette(num_colors)
+    errors = [np.abs(palette.to_rgb(palette.quantize(frame)).astype(np.int16) - frame).mean()
+              for frame in frames]
+    assert np.mean(errors) <= _old_palette_error(frames, num_colors)
+
+
+def test_sampled_histogram_counts_only_the_sampled_frames():
+    frames = _scene(num_frames=9)
+    sampled = ColorHistogram.from_frames(frames, max_frames=3)
+    expected = ColorHistogram.from_frames([frames[0], frames[4], frames[8]])
+    assert np.array_equal(sampled.counts, expected.counts)
+    assert sampled.counts.sum() == 3 * frames[0].shape[0] * frames[0].shape[1]
+
+
+def test_empty_histogram_gives_a_single_color():
+    assert len(ColorHistogram().palette(32)) == 1
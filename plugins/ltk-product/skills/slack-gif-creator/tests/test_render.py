@@ -0,0 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from core.gif_builder import GIFBuilder
+from core.render import frame_chunks, render_frames
+from templates.bounce import create_bounce_animation, _render_bounce_frame
+from templates.explode import create_explode_animation
+from templates.fade import create_crossfade, create_fade_animation
+from templates.morph import create_morph_animation
+from templates.move import create_move_animation
+from templates.shake import create_shake_animation
+from templates.wiggle import create_wiggle_animation
+
+
+@pytest.mark.parametrize('num_frames, num_chunks', [(30, 8), (5, 16), (1, 4), (97, 12)])
+def test_frame_chunks_cover_every_frame_once_in_order(num_frames, num_chunks):
+    chunks = frame_chunks(num_frames, num_chunks)
+    assert chunks[0][0] == 0 and chunks[-1][1] == num_frames
+    assert all(stop == next_start for (_, stop), (next_start, _) in zip(chunks, chunks[1:]))
+    assert len(chunks) <= min(num_frames, num_chunks)
+
+
+def _bytes(frames):
+    return [np.asarray(frame.convert('RGB')).tobytes() for frame in frames]
+
+
+def test_pooled_rendering_matches_serial():
+    serial = create_bounce_animation(num_frames=12)
+    assert _bytes(create_bounce_animation(num_frames=12, workers=2)) == _bytes(serial)
+    with ThreadPoolExecutor(2) as executor:
+        assert _bytes(create_bounce_animation(num_frames=12, executor=executor)) == _bytes(serial)
+
+
+@pytest.mark.parametrize('create', [
+    lambda **options: create_explode_animation(explode_type='shatter', seed=1, **options),
+    lambda **options: create_explode_animation(explode_type='dissolve', seed=1, **options),
+    lambda **options: create_morph_animation({'emoji': '😊', 'size': 40}, {'emoji': '😂', 'size': 40},
+                                             morph_type='spin_morph', **options),
+    lambda **options: create_move_animation(motion_type='arc', **options),
+    lambda **options: create_shake_animation(direction='both', **options),
+    lambda **options: create_wiggle_animation(wiggle_type='jello', **options),
+])
+def test_templates_render_the_same_on_a_pool(create):
+    options = {'num_frames': 8, 'frame_width': 120, 'frame_height': 100}
+    serial = create(**options)
+    assert _bytes(create(workers=2, **options)) == _bytes(serial)
+
+
+@pytest.mark.parametrize('create', [
+    lambda **options: create_fade_animation(fade_type='in_out', **options),
+    lambda **options: create_crossfade({'emoji': '😊', 'size': 40}, {'emoji': '😂', 'size': 40},
+                                       **options),
+    lambda **options: create_morph_animation({'emoji': '😊', 'size': 40}, {'emoji': '😂', 'size': 40},
+                                             morph_type='crossfade', **options),
+])
+def test_reused_canvas_frames_are_kept_apart(create):
+    options = {'num_frames': 8, 'frame_width': 120, 'frame_height': 100,
+               'center_pos': (60, 50), 'bg_color': (0, 0, 0)}
+    frames = create(**options)
+    assert len({id(frame) for frame in frames}) == len(frames)
+    assert len(set(_bytes(frames))) > 1
+    assert _bytes(create(workers=2, **options)) == _bytes(frames)
+    with ThreadPoolExecutor(2) as executor:
+        assert _bytes(create(executor=executor, **options)) == _bytes(frames)
+
+
+def test_render_frames_streams_into_builder():
+    ctx = {
+        'object_type': 'circle',
+        'object_data': {'radius': 10, 'color': (255, 0, 0)},
+        'heights': np.linspace(0, 40, 6),
+        'ground_y': 60,
+        'start_x': 40,
+        'frame_size': (80, 80),
+        'bg_color': (255, 255, 255),
+    }
+    builder = GIFBuilder(width=80, height=80, fps=10)
+    assert render_frames(_render_bounce_frame, 6, ctx, workers=2, output=builder) is builder
+    assert len(builder.frames) == 6
+    assert _bytes(render_frames(_render_bounce_frame, 6, ctx)) == [frame.tobytes() for frame in builder.frames]
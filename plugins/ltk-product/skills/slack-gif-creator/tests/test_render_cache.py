@@ -0,0 +1,127 @@
+import numpy as np
+from PIL import Image
+
+from core.render_cache import RenderCache
+
+calls = []
+
+
+def _squares(color=(255, 0, 0), num_frames=3):
+    calls.append(color)
+    frames = []
+    for i in range(num_frames):
+        frame = Image.new('RGB', (32, 32), (255, 255, 255))
+        frame.paste(color, (i * 8, 8, i * 8 + 8, 16))
+        frames.append(frame)
+    return frames
+
+
+def _noise(num_frames=3, seed=None):
+    rng = np.random.default_rng(seed)
+    calls.append(seed)
+    return [Image.fromarray(rng.integers(0, 256, (32, 32, 3), dtype=np.uint8))
+            for _ in range(num_frames)]
+
+
+def test_key_is_stable_and_covers_every_input(tmp_path):
+    cache = RenderCache(tmp_path)
+    key = cache.key(_squares, {'color': (1, 2, 3), 'num_frames': 4}, seed=7)
+    assert key == cache.key(_squares, {'num_frames': 4, 'color': (1, 2, 3)}, seed=7)
+    assert key == RenderCache(tmp_path).key(_squares, {'color': (1, 2, 3), 'num_frames': 4}, seed=7)
+    assert key == cache.key(f'{__name__}._squares', {'color': (1, 2, 3), 'num_frames': 4}, seed=7)
+
+    others = {
+        cache.key(_squares, {'color': (1, 2, 3), 'num_frames': 4}, seed=8),
+        cache.key(_squares, {'color': (1, 2, 3), 'num_frames': 4}),
+        cache.key(_squares, {'color': (1, 2, 4), 'num_frames': 4}, seed=7),
+        cache.key(_noise, {'color': (1, 2, 3), 'num_frames': 4}, seed=7),
+    }
+    assert key not in others and len(others) == 4
+
+
+def test_key_hashes_arrays_by_content(tmp_path):
+    cache = RenderCache(tmp_path)
+    image = np.zeros((4, 4, 3), dtype=np.uint8)
+    key = cache.key(_squares, {'image': image})
+    assert key == cache.key(_squares, {'image': Image.fromarray(image.copy())})
+    image[0, 0, 0] = 1
+    assert key != cache.key(_squares, {'image': image})
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = RenderCache(tmp_path, max_bytes=250)
+    cache.put('a', b'a' * 100)
+    cache.put('b', b'b' * 100)
+    assert cache.get('a') is not None  # 'b' is now least recently used
+    cache.put('c', b'c' * 100)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == b'a' * 100 and cache.get('c') == b'c' * 100
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['size_bytes'] == 200
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['a.gif', 'c.gif']
+
+
+def test_entry_larger_than_cache_is_not_kept(tmp_path):
+    cache = RenderCache(tmp_path, max_bytes=250)
+    cache.put('a', b'a' * 100)
+    cache.put('big', b'x' * 300)
+    assert cache.get('big') is None and cache.get('a') is not None
+
+
+def test_render_hits_after_first_miss(tmp_path):
+    calls.clear()
+    cache = RenderCache(tmp_path)
+    first = cache.render(_squares, {'color': (0, 0, 255)}, width=32, height=32, keep_frames=True)
+    assert cache.render(_squares, {'color': (0, 0, 255)}, width=32, height=32) == first
+    assert calls == [(0, 0, 255)]
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+    frames, durations = cache.get_frames(cache.key(
+        _squares, {'template_params': {'color': (0, 0, 255)}, 'width': 32, 'height': 32,
+                   'fps': 15, 'save_options': {}}))
+    assert frames.shape == (3, 32, 32, 3) and len(durations) == 3
+
+    # Only finished entries are on disk, and a new cache indexes exactly those
+    assert sorted(path.suffix for path in tmp_path.iterdir()) == ['.gif', '.npz']
+    assert RenderCache(tmp_path).stats()['entries'] == 1
+
+
+def test_random_template_is_cached_only_with_a_seed(tmp_path):
+    calls.clear()
+    cache = RenderCache(tmp_path)
+    cache.render(_noise, width=32, height=32)
+    cache.render(_noise, width=32, height=32)
+    assert calls == [None, None]
+    assert cache.stats()['entries'] == 0 and cache.stats()['misses'] == 0
+    assert list(tmp_path.iterdir()) == []
+
+    seeded = cache.render(_noise, seed=3, width=32, height=32)
+    assert cache.render(_noise, seed=3, width=32, height=32) == seeded
+    assert calls == [None, None, 3]
+
+
+def test_seed_in_params_is_cached_like_the_seed_argument(tmp_path):
+    calls.clear()
+    cache = RenderCache(tmp_path)
+    seeded = cache.render(_noise, {'seed': 7}, width=32, height=32)
+    assert cache.render(_noise, {'seed': 7}, width=32, height=32) == seeded
+    assert cache.render(_noise, seed=7, width=32, height=32) == seeded
+    assert calls == [7]
+    assert cache.stats()['entries'] == 1 and cache.stats()['hits'] == 2
+
+
+def test_keep_frames_renders_again_when_the_entry_has_none(tmp_path):
+    calls.clear()
+    cache = RenderCache(tmp_path)
+    key = cache.key(_squares, {'template_params': {}, 'width': 32, 'height': 32,
+                               'fps': 15, 'save_options': {}})
+    data = cache.render(_squares, width=32, height=32)
+    assert cache.get_frames(key) is None
+
+    assert cache.render(_squares, width=32, height=32, keep_frames=True) == data
+    assert cache.get_frames(key)[0].shape == (3, 32, 32, 3)
+    assert cache.render(_squares, width=32, height=32, keep_frames=True) == data
+    assert cache.render(_squares, width=32, height=32) == data
+    assert len(calls) == 2
+    assert cache.stats()['misses'] == 2 and cache.stats()['hits'] == 2
@@ -0,0 +1,121 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from core.layers import Layer, LayerCompositor
+from core.sprites import SpriteCache, paste_tile, with_opacity
+from core.typography import draw_text_with_glow
+from templates.fade import apply_opacity
+
+
+def _tile(width=12, height=9, seed=0):
+    rng = np.random.default_rng(seed)
+    return Image.fromarray(rng.integers(0, 256, (height, width, 4), dtype=np.uint8))
+
+
+@pytest.mark.parametrize('opacity', [0.1, 0.25, 0.5, 0.73, 0.99])
+def test_with_opacity_scales_alpha_with_rounding(opacity):
+    tile = _tile()
+    faded = with_opacity(tile, opacity)
+    level = round(opacity * 255)
+    alpha = np.asarray(tile)[..., 3].astype(np.int64)
+    assert np.array_equal(np.asarray(faded)[..., 3], (alpha * level + 127) // 255)
+    assert np.array_equal(np.asarray(faded)[..., :3], np.asarray(tile)[..., :3])
+    assert faded is not tile
+
+
+def test_with_opacity_extremes():
+    tile = _tile()
+    assert with_opacity(tile, 1.0) is tile
+    cleared = with_opacity(tile, 0.0)
+    assert not np.asarray(cleared)[..., 3].any()
+    assert np.array_equal(np.asarray(tile), np.asarray(_tile()))
+
+
+@pytest.mark.parametrize('opacity', [0.0, 0.5, 1.0])
+def test_apply_opacity_returns_a_new_image(opacity):
+    tile = _tile()
+    faded = apply_opacity(tile, opacity)
+    assert faded is not tile
+    faded.putpixel((0, 0), (1, 2, 3, 4))
+    assert np.array_equal(np.asarray(tile), np.asarray(_tile()))
+
+
+def _reference(frame, tile, position, pad=32):
+    """Composite on a canvas big enough that nothing is clipped, then crop back."""
+    canvas = Image.new(frame.mode, (frame.width + 2 * pad, frame.height + 2 * pad))
+    canvas.paste(frame, (pad, pad))
+    x, y = position[0] + pad, position[1] + pad
+    if frame.mode == 'RGBA':
+        canvas.alpha_composite(tile, (x, y))
+    else:
+        canvas.paste(tile, (x, y), tile)
+    return canvas.crop((pad, pad, pad + frame.width, pad + frame.height))
+
+
+@pytest.mark.parametrize('mode', ['RGB', 'RGBA'])
+@pytest.mark.parametrize('position', [(4, 5), (-5, -3), (30, 20), (-4, 17), (-12, 0), (40, 40)])
+def test_paste_tile_clips_to_frame(mode, position):
+    rng = np.random.default_rng(1)
+    channels = 4 if mode == 'RGBA' else 3
+    frame = Image.fromarray(rng.integers(0, 256, (24, 36, channels), dtype=np.uint8))
+    tile = _tile()
+    expected = _reference(frame, tile, position)
+    assert paste_tile(frame, tile, position) is frame
+    assert np.array_equal(np.asarray(frame), np.asarray(expected))
+
+
+def test_compositor_reuse_matches_fresh_frames():
+    background = Image.fromarray(np.random.default_rng(2).integers(
+        0, 256, (40, 50, 3), dtype=np.uint8))
+    fresh = LayerCompositor(50, 40, background=background)
+    reused = LayerCompositor(50, 40, background=background)
+    tile = _tile()
+    for i, opacity in enumerate([1.0, 0.6, 0.0, 0.3, 1.0]):
+        layers = [Layer(tile, (i * 11 - 6, i * 7 - 3), opacity),
+                  Layer(_tile(seed=3), (45 - i * 9, 30), 1.0 - opacity / 2)]
+        expected = np.asarray(fresh.compose(layers))
+        assert np.array_equal(np.asarray(reused.compose(layers, reuse=True)), expected)
+
+
+def test_compositor_reuse_keeps_a_canvas_per_thread():
+    compositor = LayerCompositor(50, 40, bg_color=(20, 40, 60))
+    tile = _tile()
+
+    def layers(i):
+        return [Layer(tile, (i * 3 - 6, i * 2 - 3), 1.0 - (i % 4) / 4)]
+
+    def render(i):
+        return np.asarray(compositor.compose(layers(i), reuse=True)).copy()
+
+    with ThreadPoolExecutor(4) as executor:
+        frames = list(executor.map(render, range(24)))
+    fresh = LayerCompositor(50, 40, bg_color=(20, 40, 60))
+    for i, frame in enumerate(frames):
+        assert np.array_equal(frame, np.asarray(fresh.compose(layers(i))))
+
+
+def test_text_sprite_accepts_list_options():
+    cache = SpriteCache()
+    listed = cache.text('Hi', effect='shadow', shadow_offset=[2, 2], shadow_color=[0, 0, 0])
+    tupled = cache.text('Hi', effect='shadow', shadow_offset=(2, 2), shadow_color=(0, 0, 0))
+    assert tupled is listed
+    assert cache.stats()['misses'] == 1
+
+
+@pytest.mark.parametrize('options', [{}, {'glow_radius': 8}])
+def test_glow_sprite_matches_direct_draw(options):
+    # Without an explicit glow_radius the sprite must still reserve room for the default
+    sprite = SpriteCache().text('Glow', font_size=30, effect='glow', **options)
+    blitted = sprite.blit(Image.new('RGB', (200, 100)), (40, 30))
+    direct = draw_text_with_glow(Image.new('RGB', (200, 100)), 'Glow', (40, 30),
+                                 font_size=30, **options)
+    diff = np.abs(np.asarray(blitted, dtype=np.int16) - np.asarray(direct, dtype=np.int16))
+    assert diff.max() <= 1
+
+
+def test_text_sprite_defaults_share_a_cache_entry():
+    cache = SpriteCache()
+    assert cache.text('Hi', effect='glow') is cache.text('Hi', effect='glow', glow_radius=5)
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from core.typography import (_max_filter_1d, draw_text_with_glow, draw_text_with_outline,
+                             draw_text_with_shadow, get_font)
+
+BACKGROUND = (30, 60, 90)
+TEXT = (250, 250, 250)
+
+
+def _frame():
+    return Image.new('RGB', (220, 90), BACKGROUND)
+
+
+def _offset_draws(offsets, color, size=36, position=(20, 20)):
+    """The old effects: the text drawn once per offset, then on top in TEXT."""
+    frame = _frame()
+    draw = ImageDraw.Draw(frame)
+    font = get_font(size, bold=True)
+    for offset_x, offset_y in offsets:
+        draw.text((position[0] + offset_x, position[1] + offset_y), 'Hey 42!', fill=color, font=font)
+    draw.text(position, 'Hey 42!', fill=TEXT, font=font)
+    return np.asarray(frame).astype(np.int16)
+
+
+def _square(radius):
+    return [(x, y) for x in range(-radius, radius + 1) for y in range(-radius, radius + 1)
+            if x or y]
+
+
+@pytest.mark.parametrize('radius', [0, 1, 2, 3, 5, 8, 13])
+def test_max_filter_matches_a_sliding_window(radius):
+    values = np.random.default_rng(radius).integers(0, 256, (23, 31), dtype=np.uint8)
+    for axis in (0, 1):
+        moved = np.moveaxis(values, axis, 0)
+        expected = np.stack([moved[max(0, i - radius):i + radius + 1].max(axis=0)
+                             for i in range(len(moved))])
+        assert np.array_equal(_max_filter_1d(values, radius, axis), np.moveaxis(expected, 0, axis))
+
+
+def test_shadow_matches_two_draws():
+    frame = draw_text_with_shadow(_frame(), 'Hey 42!', (20, 20), font_size=36, text_color=TEXT,
+                                  shadow_color=(0, 0, 0), shadow_offset=(3, 2))
+    assert np.array_equal(np.asarray(frame), _offset_draws([(3, 2)], (0, 0, 0)))
+
+
+@pytest.mark.parametrize('width', [1, 3])
+def test_outline_matches_offset_draws_away_from_edges(width):
+    frame = draw_text_with_outline(_frame(), 'Hey 42!', (20, 20), font_size=36, text_color=TEXT,
+                                   outline_color=(0, 0, 0), outline_width=width)
+    diff = np.abs(np.asarray(frame) - _offset_draws(_square(width), (0, 0, 0))).max(axis=-1)
+    # Dilating the mask and overdrawing antialiased copies only disagree on edge pixels
+    assert (diff > 0).mean() < 0.03
+    assert (diff > 64).mean() < 0.005
+
+
+def test_glow_is_solid_near_the_text_and_gone_past_its_reach():
+    glow_color = (255, 200, 0)
+    frame = np.asarray(draw_text_with_glow(_frame(), 'Hey 42!', (20, 20), font_size=36,
+                                           text_color=TEXT, glow_color=glow_color,
+                                           glow_radius=4)).astype(np.int16)
+    old = _offset_draws(_square(4), glow_color)
+
+    # The text itself is unchanged, and the old solid glow area is mostly glow colored
+    text = (old == TEXT).all(axis=-1)
+    assert np.array_equal(frame[text], old[text])
+    glow = (old == glow_color).all(axis=-1)
+    assert np.abs(frame[glow] - glow_color).mean() < np.abs(np.subtract(BACKGROUND, glow_color)).mean() / 4
+
+    # Nothing is drawn beyond the grown and blurred reach of the glyphs
+    reach = 4 + 3 * 2 + 1
+    touched = np.argwhere((frame != BACKGROUND).any(axis=-1))
+    drawn = np.argwhere(glow | text)
+    assert (touched.min(axis=0) >= drawn.min(axis=0) - reach).all()
+    assert (touched.max(axis=0) <= drawn.max(axis=0) + reach).all()
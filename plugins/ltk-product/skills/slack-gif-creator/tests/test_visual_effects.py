@@ -0,0 +1,55 @@
+import numpy as np
+from PIL import Image
+
+from core.visual_effects import ParticleSystem, create_screen_shake_offset
+
+
+def test_render_without_particles_leaves_rgba_frame_alone():
+    frame = Image.new('RGBA', (40, 40), (10, 20, 30, 0))
+    ParticleSystem(seed=1).render(frame)
+    assert frame.mode == 'RGBA'
+    assert frame.getextrema()[3] == (0, 0)
+
+
+def test_render_keeps_alpha_outside_particles():
+    system = ParticleSystem(seed=1)
+    system.emit(50, 50, count=20)
+    frame = Image.new('RGBA', (100, 100), (0, 0, 0, 0))
+    system.render(frame)
+
+    alpha = np.asarray(frame)[..., 3]
+    assert frame.mode == 'RGBA'
+    assert alpha.min() == 0
+    assert set(np.unique(alpha)) == {0, 255}
+
+    # Particle pixels match what an RGB frame gets
+    rgb = Image.new('RGB', (100, 100))
+    system.render(rgb)
+    drawn = alpha == 255
+    assert np.array_equal(np.asarray(frame)[..., :3][drawn], np.asarray(rgb)[drawn])
+    assert not np.asarray(rgb)[~drawn].any()
+
+
+def test_render_draws_later_particles_over_earlier_ones():
+    # Alternating shapes and sizes on top of each other, so a render that
+    # grouped particles by stencil would reorder the overlaps
+    system = ParticleSystem(seed=3)
+    for i in range(12):
+        shape = ('circle', 'square', 'star')[i % 3]
+        color = ((40 * i) % 256, 255 - 20 * i, 90)
+        system.add(20 + i, 20 + (i % 4), 0, 0, 10, color, size=2 + i % 3, shape=shape)
+
+    expected = Image.new('RGB', (50, 50))
+    for particle in system.particles:
+        particle.render(expected)
+
+    frame = Image.new('RGB', (50, 50))
+    system.render(frame)
+    assert np.array_equal(np.asarray(frame), np.asarray(expected))
+
+
+def test_screen_shake_accepts_negative_seeds():
+    offsets = [create_screen_shake_offset(5, i, seed=-7) for i in range(10)]
+    assert offsets == [create_screen_shake_offset(5, i, seed=-7) for i in range(10)]
+    assert all(-5 <= dx <= 5 and -5 <= dy <= 5 for dx, dy in offsets)
+    assert offsets != [create_screen_shake_offset(5, i, seed=7) for i in range(10)]